@@ -0,0 +1,92 @@
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from background_loop import get_background_loop
+from llm_cache import credential_fingerprint
+from openai_model import get_async_openai_client
+from agents.chat_segmenter_rater import make_agent_chat_segmenter_rater
+from agents.conversation_starter_generator import SINGLE_CALL, make_agent_conversation_starter_generator
+
+SEGMENTER_RATER = 'segmenter_rater'
+STARTER_GENERATOR = 'starter_generator'
+
+_FACTORIES: Dict[str, Callable] = {
+    SEGMENTER_RATER: make_agent_chat_segmenter_rater,
+    STARTER_GENERATOR: make_agent_conversation_starter_generator,
+}
+
+
+class AgentRegistry:
+    """
+    Constructed agents shared by all sessions and reruns, keyed by agent kind, model,
+    API key fingerprint and build options. Each agent is built once; concurrent
+    requests for the same key wait for that single build.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._agents: Dict[Tuple, object] = {}
+        self._building: Dict[Tuple, threading.Event] = {}
+        self.builds = 0
+
+    def get(self, kind: str, model_name: str = "gpt-4o", api_key: Optional[str] = None, **options):
+        api_key = api_key or os.getenv('OPENAI_API_KEY')
+        key = (kind, model_name, credential_fingerprint(api_key), tuple(sorted(options.items())))
+        while True:
+            with self._lock:
+                agent = self._agents.get(key)
+                if agent is not None:
+                    return agent
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = threading.Event()
+                    break
+            # Another thread is building this agent; a failed build lets the next waiter retry
+            building.wait()
+
+        try:
+            # Bind the model to this key explicitly rather than to whatever OPENAI_API_KEY holds at build time,
+            # through the pooled client of the background loop that every agent run is submitted to
+            client = get_async_openai_client(api_key, loop=get_background_loop().loop)
+            model = OpenAIModel(model_name, provider=OpenAIProvider(openai_client=client))
+            agent = _FACTORIES[kind](model, **options)
+            with self._lock:
+                self._agents[key] = agent
+                self.builds += 1
+            return agent
+        finally:
+            with self._lock:
+                self._building.pop(key, None)
+            building.set()
+
+    def warm(self, model_name: str = "gpt-4o", api_key: Optional[str] = None, starter_mode: str = SINGLE_CALL):
+        """Build the segmenter-rater and starter generator for model_name and api_key ahead of use."""
+        self.get(SEGMENTER_RATER, model_name, api_key)
+        self.get(STARTER_GENERATOR, model_name, api_key, mode=starter_mode)
+
+    def warm_in_background(self, model_name: str = "gpt-4o", api_key: Optional[str] = None,
+                           starter_mode: str = SINGLE_CALL) -> Optional[threading.Thread]:
+        """Warm in a daemon thread unless these agents already exist; returns the thread, if started."""
+        api_key = api_key or os.getenv('OPENAI_API_KEY')
+        fingerprint = credential_fingerprint(api_key)
+        with self._lock:
+            if any(key[1:3] == (model_name, fingerprint) for key in list(self._agents) + list(self._building)):
+                return None
+        thread = threading.Thread(target=self._warm_quietly, args=(model_name, api_key, starter_mode),
+                                  name="agent-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm_quietly(self, model_name: str, api_key: Optional[str], starter_mode: str):
+        try:
+            self.warm(model_name, api_key, starter_mode)
+        except Exception as e:
+            # The hot path builds (and reports) on demand if warm-up fails
+            print(f"Warning: agent warm-up failed: {e}")
+
+
+agent_registry = AgentRegistry()
@@ -1,17 +1,22 @@
 import sys
 import os
 import logging
-from typing import List
+import threading
+from array import array
+from functools import cached_property
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # Add the project root directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
-from dataclasses import dataclass
-from pydantic_ai import RunContext, Agent
+from dataclasses import dataclass, field
+from pydantic_ai import ModelRetry, RunContext, Agent
 from pydantic import BaseModel
 
 # from openai_model import get_openai_model  # Removed to avoid env dependency
 from dotenv import load_dotenv
+from language_detector import language_name
 
 load_dotenv()
 
@@ -38,21 +43,182 @@ class ConversationSegment(BaseModel):
     engagement_justification: str
     enjoyment_score: int   # 1-10 scale
     enjoyment_justification: str
-    combined_score: int    # Sum of engagement + enjoyment
+    combined_score: int = 0  # Sum of engagement + enjoyment (recomputed by repair_segments)
 
 
 class SegmenterRaterResult(BaseModel):
     segments: List[ConversationSegment]
 
 
+class LineIndex:
+    """
+    Line offsets of a conversation, computed once. Lines and line ranges are slices
+    of the original text, and the numbered rendering for the prompt is built on
+    first use and then reused (e.g. across agent retries).
+    """
+    
+    def __init__(self, conversation: str):
+        self.text = conversation.strip()
+        # starts[i] is the offset of line i; starts[-1] is one past the end of the text
+        self.starts = array('q', accumulate((len(line) + 1 for line in self.text.split('\n')), initial=0))
+    
+    def __len__(self) -> int:
+        return len(self.starts) - 1
+    
+    def __iter__(self) -> Iterator[str]:
+        return (self.line(i) for i in range(len(self)))
+    
+    def line(self, i: int) -> str:
+        return self.text[self.starts[i]:self.starts[i + 1] - 1]
+    
+    def lines(self, start: int, end: int) -> str:
+        """Lines start..end inclusive, joined by newlines."""
+        return self.text[self.starts[start]:self.starts[end + 1] - 1]
+    
+    @cached_property
+    def numbered(self) -> str:
+        """The conversation as 'Line i: ...' rows, as shown to the segmenter-rater."""
+        return ''.join(map('Line {}: {}\n'.format, range(len(self)), self.text.split('\n')))
+
+
+# Fixes for output that validation without repair would reject with a re-prompt (out-of-range
+# scores, invalid or overlapping line ranges); the others (combined_score, gaps, ids) are cosmetic
+RETRY_FIXES = frozenset({'score_clamped', 'range_reversed', 'range_clamped', 'segment_dropped', 'overlap_trimmed'})
+
+
+class RepairStats:
+    """
+    Per-run counters for repair_segments: fixes applied locally, retries avoided and their
+    estimated token cost. Only results with a RETRY_FIXES fix count as avoided retries;
+    results with cosmetic fixes alone are counted separately.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.results = 0
+        self.repaired = 0
+        self.cosmetic = 0
+        self.fixes: Dict[str, int] = {}
+        self.retries = 0
+        self.avoided_tokens = 0
+    
+    def record(self, fixes: Dict[str, int], retry_tokens: int):
+        with self._lock:
+            self.results += 1
+            if RETRY_FIXES.intersection(fixes):
+                self.repaired += 1
+                self.avoided_tokens += retry_tokens
+            elif fixes:
+                self.cosmetic += 1
+            for fix, count in fixes.items():
+                self.fixes[fix] = self.fixes.get(fix, 0) + count
+    
+    def record_retry(self):
+        with self._lock:
+            self.results += 1
+            self.retries += 1
+    
+    def summary(self) -> Dict:
+        with self._lock:
+            return {
+                'results': self.results,
+                'avoided_retries': self.repaired,
+                'cosmetic_repairs': self.cosmetic,
+                'retries': self.retries,
+                'avoided_tokens': self.avoided_tokens,
+                'fixes': dict(self.fixes),
+            }
+
+
+def repair_segments(segments: List[ConversationSegment], total_lines: int) -> Tuple[List[ConversationSegment], Dict[str, int]]:
+    """
+    Deterministically fix segmenter output for a conversation of total_lines lines:
+    clamp scores to 1-10 and recompute combined_score, clamp and order line ranges,
+    trim overlaps (dropping segments left empty), close gaps so the segments cover
+    every line, make segment ids unique and sort by combined score. Returns the
+    repaired segments and a count per kind of fix; an empty list means the output
+    cannot be repaired.
+    """
+    fixes: Dict[str, int] = {}
+    
+    def fix(kind: str):
+        fixes[kind] = fixes.get(kind, 0) + 1
+    
+    if total_lines <= 0:
+        return [], fixes
+    
+    repaired = []
+    for segment in segments:
+        updates = {}
+        for name in ('engagement_score', 'enjoyment_score'):
+            score = getattr(segment, name)
+            if not 1 <= score <= 10:
+                updates[name] = min(max(score, 1), 10)
+                fix('score_clamped')
+        combined = updates.get('engagement_score', segment.engagement_score) + updates.get('enjoyment_score', segment.enjoyment_score)
+        if segment.combined_score != combined:
+            updates['combined_score'] = combined
+            fix('combined_score')
+        start, end = segment.start_line, segment.end_line
+        if start > end:
+            start, end = end, start
+            fix('range_reversed')
+        if start < 0 or end > total_lines - 1:
+            if end < 0 or start > total_lines - 1:
+                # Entirely outside the conversation: nothing to clamp to
+                fix('segment_dropped')
+                continue
+            start, end = max(start, 0), min(end, total_lines - 1)
+            fix('range_clamped')
+        if (start, end) != (segment.start_line, segment.end_line):
+            updates.update(start_line=start, end_line=end)
+        repaired.append(segment.model_copy(update=updates) if updates else segment)
+    
+    # Walk in line order: trim each segment to start after the previous one, extend over gaps
+    repaired.sort(key=lambda seg: (seg.start_line, -seg.end_line))
+    covered = []
+    for segment in repaired:
+        next_line = covered[-1].end_line + 1 if covered else 0
+        if segment.end_line < next_line:
+            fix('segment_dropped')
+            continue
+        if segment.start_line > next_line:
+            if covered:
+                covered[-1] = covered[-1].model_copy(update={'end_line': segment.start_line - 1})
+            else:
+                segment = segment.model_copy(update={'start_line': 0})
+            fix('gap_closed')
+        elif segment.start_line < next_line:
+            segment = segment.model_copy(update={'start_line': next_line})
+            fix('overlap_trimmed')
+        covered.append(segment)
+    if covered and covered[-1].end_line < total_lines - 1:
+        covered[-1] = covered[-1].model_copy(update={'end_line': total_lines - 1})
+        fix('gap_closed')
+    
+    if len({segment.segment_id for segment in covered}) != len(covered):
+        covered = [segment.model_copy(update={'segment_id': i + 1}) for i, segment in enumerate(covered)]
+        fix('ids_renumbered')
+    
+    # The prompt asks for this order; sorting alone is not counted as a fix
+    return sorted(covered, key=lambda seg: -seg.combined_score), fixes
+
+
 @dataclass
 class SegmenterRaterDeps:
     conversation: str  # Single conversation text
+    line_index: Optional[LineIndex] = field(default=None, repr=False)  # Built from conversation if not given
+    repair_stats: RepairStats = field(default_factory=RepairStats)  # Local repairs and avoided retries for this run
+    language_code: Optional[str] = None  # Detected ISO 639-1 language to write the analysis in; None lets the model match the conversation
+    
+    def __post_init__(self):
+        if self.line_index is None:
+            self.line_index = LineIndex(self.conversation)
 
 
-def populate_segment_content(segments: List[ConversationSegment], conversation: str) -> List[ConversationSegment]:
+def populate_segment_content(segments: List[ConversationSegment], conversation: Union[str, LineIndex]) -> List[ConversationSegment]:
     """Programmatically populate the content field of segments based on start_line and end_line."""
-    conversation_lines = conversation.strip().split('\n')
+    conversation_lines = conversation if isinstance(conversation, LineIndex) else LineIndex(conversation)
     
     for segment in segments:
         # Validate line numbers
@@ -70,9 +236,8 @@ def populate_segment_content(segments: List[ConversationSegment], conversation:
             segment.content = "Invalid segment boundaries"
             continue
         
-        # Extract content from conversation lines
-        segment_lines = conversation_lines[segment.start_line:segment.end_line + 1]
-        segment.content = '\n'.join(segment_lines)
+        # Extract content as one slice of the conversation text
+        segment.content = conversation_lines.lines(segment.start_line, segment.end_line)
         
         logger.info(f"Populated content for segment {segment.segment_id}: lines {segment.start_line}-{segment.end_line}")
     
@@ -87,21 +252,33 @@ def make_agent_chat_segmenter_rater(model_name="gpt-4o"):
         result_type=SegmenterRaterResult,
     )
     
+    @agent.result_validator
+    def repair_result(ctx: RunContext[SegmenterRaterDeps], result: SegmenterRaterResult) -> SegmenterRaterResult:
+        # Fix ranges, overlaps, gaps and scores locally; re-prompting resends the whole conversation
+        total_lines = len(ctx.deps.line_index)
+        segments, fixes = repair_segments(result.segments, total_lines)
+        if not segments:
+            ctx.deps.repair_stats.record_retry()
+            raise ModelRetry(
+                f"No usable segments. Return at least one segment with start_line and end_line "
+                f"between 0 and {total_lines - 1}."
+            )
+        # A retry would resend the prompt and the rejected response, i.e. at least this run's tokens so far
+        ctx.deps.repair_stats.record(fixes, ctx.usage.total_tokens or 0)
+        return SegmenterRaterResult(segments=segments)
+    
     @agent.system_prompt
     def system_prompt(ctx: RunContext[SegmenterRaterDeps]) -> str:
-        conversation_lines = ctx.deps.conversation.strip().split('\n')
-        total_lines = len(conversation_lines)
-        
-        # Add line numbers to conversation for reference
-        numbered_conversation = ""
-        for i, line in enumerate(conversation_lines):
-            numbered_conversation += f"Line {i}: {line}\n"
+        # Line numbers for reference; rendered once per conversation and reused on retries
+        total_lines = len(ctx.deps.line_index)
+        numbered_conversation = ctx.deps.line_index.numbered
+        language = language_name(ctx.deps.language_code) if ctx.deps.language_code else "the language the conversation is primarily written in"
         
         return f"""
         You are an expert conversation analyzer that segments dialogues and rates user engagement.
         Your task is to analyze a conversation and create a structured breakdown with engagement ratings.
         
-        LANGUAGE DETECTION: First, analyze the language of the input conversation. If the conversation is primarily in Russian, provide ALL your analysis (topic, tone, conversation_direction, interaction_type, engagement_justification, enjoyment_justification) in Russian. If the conversation is in English or other languages, respond in English.
+        LANGUAGE REQUIREMENT: Write ALL your analysis (topic, tone, conversation_direction, engagement_justification, enjoyment_justification) in {language}. interaction_type must stay one of the exact values listed below.
         
         Conversation to analyze (with line numbers):
         
@@ -1,32 +1,53 @@
 import streamlit as st
-import re
 import json
 import os
-import openai
 import nltk
 import asyncio
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from typing import Any, Callable, List, Dict, Tuple, Optional
 import hashlib
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Import agents for followup generation
 try:
     from agents.chat_segmenter_rater import (
-        make_agent_chat_segmenter_rater,
         SegmenterRaterDeps,
         ConversationSegment,
-        populate_segment_content
+        populate_segment_content,
+        LineIndex,
+        RepairStats
     )
     from agents.conversation_starter_generator import (
-        make_agent_conversation_starter_generator,
         StarterGeneratorDeps,
         ConversationStarter
     )
+    from agent_registry import SEGMENTER_RATER, STARTER_GENERATOR, agent_registry
     AGENTS_AVAILABLE = True
 except ImportError:
     st.warning("⚠️ Agent modules not found. Using fallback followup generation.")
     AGENTS_AVAILABLE = False
 
+from conversation_store import Conversation, ConversationLike, as_conversation
+from llm_cache import LLMCache, content_hash, credential_fingerprint, get_llm_cache
+from openai_model import get_openai_client, request_timings
+from language_detector import CONFIDENCE_THRESHOLD, LANGUAGE_NAMES, detect_language, language_name
+from segmentation import (
+    DEFAULT_OVERLAP_TOKENS, DEFAULT_WINDOW_TOKENS, absorb_unclaimed, estimate_message_tokens, estimate_tokens,
+    merge_window_segments, plan_windows
+)
+from pipeline import Stage, PENDING, RUNNING, DONE, FAILED, SKIPPED
+from topic_segmenter import segment_topics
+from background_loop import call_in_caller, get_background_loop
+from job_queue import INTERRUPTED, QUEUED, Job, current_job, get_job_queue
+from result_store import get_result_store, upload_hash
+from interaction_log import get_interaction_logger
+from pagination import (
+    DEFAULT_PAGE_SIZE, DEFAULT_SEARCH_LIMIT, page_count, page_of, page_range, search_conversation, search_lines
+)
+
 # Download required NLTK data
 try:
     nltk.data.find('tokenizers/punkt_tab')
@@ -47,55 +68,118 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-class ConversationParser:
-    """Parse conversation logs from text files."""
+def with_script_run_ctx(fn):
+    """
+    Wrap fn so that worker threads can use st.* and st.session_state of the calling
+    session, and see the caller's context variables (e.g. the current job).
+    """
+    ctx = get_script_run_ctx()
+    context = contextvars.copy_context()
     
-    @staticmethod
-    def parse_conversation(text: str) -> List[Dict]:
-        """
-        Parse conversation text into structured format.
-        Expected format: [timestamp] Speaker: message
-        """
-        lines = text.strip().split('\n')
-        conversations = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line == "...":
-                continue
-                
-            # Regex pattern to match: [timestamp] Speaker: message
-            pattern = r'\[(.*?)\]\s*([^:]+):\s*(.*)'
-            match = re.match(pattern, line)
-            
-            if match:
-                timestamp, speaker, message = match.groups()
-                conversations.append({
-                    'timestamp': timestamp.strip(),
-                    'speaker': speaker.strip(),
-                    'message': message.strip()
-                })
-        
-        return conversations
+    def wrapper(*args, **kwargs):
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        # A context can only be entered by one thread at a time, so each call runs in its own copy
+        return context.copy().run(fn, *args, **kwargs)
+    
+    return wrapper
+
+def session_value(name: str, default=None):
+    """A session setting (e.g. openai_api_key); inside a background job, the job's snapshot of it."""
+    job = current_job()
+    if job is not None:
+        return job.context.get(name, default)
+    return st.session_state.get(name, default)
+
+def set_session_value(name: str, value):
+    job = current_job()
+    if job is not None:
+        job.context[name] = value
+    else:
+        st.session_state[name] = value
+
+def report(level: str, message: str, fallback: bool = False):
+    """
+    st.warning/st.error/st.info, or, inside a background job, a message shown when its results are opened.
+    fallback marks a result replaced by a fallback after an error, so the job's results are not reused.
+    """
+    job = current_job()
+    if job is not None:
+        if fallback:
+            job.mark_degraded()
+        job.add_message(level, message)
+    else:
+        getattr(st, level)(message)
+
+def conversation_hash(conversation: ConversationLike) -> str:
+    """Content hash of a conversation, used to address cached LLM results."""
+    rendered = as_conversation(conversation).render("[{timestamp}] {speaker}: {message}")
+    return hashlib.sha256(rendered.encode('utf-8')).hexdigest()
+
+def cached_chat_completion(api_key: str, namespace: str, conversation_hash: Optional[str] = None,
+                           validate: Optional[Callable[[str], Any]] = None, **request) -> str:
+    """
+    Run a chat completion through the persistent LLM cache and return the message content.
+    A reply is cached only if validate(content) returns truthy without raising; otherwise it is
+    still returned, for the caller to handle, but the next call asks the model again.
+    """
+    cache = get_llm_cache()
+    params = {k: v for k, v in request.items() if k not in ('model', 'messages')}
+    key = LLMCache.make_key(namespace, request['model'], request['messages'], params, conversation_hash)
+    
+    content = cache.get(key, namespace)
+    if content is None:
+        client = get_openai_client(api_key)
+        response = client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        if content is None:
+            raise ValueError(f"Empty {namespace} reply from {request['model']}")
+        if reply_is_usable(content, validate):
+            cache.set(key, content, namespace)
+    return content
+
+def reply_is_usable(content: str, validate: Optional[Callable[[str], Any]]) -> bool:
+    if validate is None:
+        return True
+    try:
+        return bool(validate(content))
+    except Exception:
+        return False
+
+def parses_as_segments(content: str) -> bool:
+    """Whether a segmentation reply is a JSON list of segments or an object with 'segments'."""
+    data = json.loads(content)
+    return isinstance(data, list) or (isinstance(data, dict) and 'segments' in data)
+
+# Offline fallback segmentation: minimum words per segment and at most this many segments
+MIN_SEGMENT_WORDS = 200
+MAX_FALLBACK_SEGMENTS = 10
 
 class SummaryGenerator:
     """Generate segment-based summaries with precise source mapping."""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 4):
         self.segment_summary_prompt = """Please provide a concise summary of this dialogue segment in 1-2 sentences. Focus on the key points, actions, or information exchanged. Be objective and factual. 
 
-LANGUAGE DETECTION: If the dialogue segment is primarily in Russian, provide your summary in Russian. If it's in English or other languages, respond in English."""
+Write the summary in the language named under LANGUAGE REQUIREMENT."""
         
-        # Enforced language code detected upstream: 'ru' or 'en'. None means auto-detect.
+        # Enforced ISO 639-1 language code detected upstream (e.g. 'ru', 'en'). None means auto-detect.
         self.language_code: Optional[str] = None
         
-    def segment_conversation(self, conversation: List[Dict]) -> List[Dict]:
+        # Upper bound on segment summary requests in flight at once (1 = sequential)
+        self.max_concurrency = max_concurrency
+        
+        # Conversations longer than this are segmented in overlapping windows (map-reduce)
+        self.window_tokens = int(os.getenv('SEGMENTATION_WINDOW_TOKENS', DEFAULT_WINDOW_TOKENS))
+        self.window_overlap_tokens = int(os.getenv('SEGMENTATION_OVERLAP_TOKENS', DEFAULT_OVERLAP_TOKENS))
+        
+    def segment_conversation(self, conversation: ConversationLike) -> List[Dict]:
         """Segment conversation using expert analysis prompt and programmatic copy-pasting."""
         if not conversation:
             return []
         
         # Use GPT-4o with the expert prompt to get segment boundaries
-        if hasattr(st.session_state, 'openai_api_key') and st.session_state.openai_api_key:
+        if session_value('openai_api_key'):
             return self.segment_with_expert_analysis(conversation)
         
         # Fallback to programmatic segmentation
@@ -103,18 +187,78 @@ LANGUAGE DETECTION: If the dialogue segment is primarily in Russian, provide you
     
 
     
-    def segment_with_expert_analysis(self, conversation: List[Dict]) -> List[Dict]:
+    def segment_with_expert_analysis(self, conversation: ConversationLike) -> List[Dict]:
         """Use GPT-4o with expert conversation analyzer prompt to get segment boundaries."""
         try:
-            client = openai.OpenAI(api_key=st.session_state.openai_api_key)
+            conversation = as_conversation(conversation)
+            windows = plan_windows(estimate_message_tokens(conversation), self.window_tokens, self.window_overlap_tokens)
+            
+            if len(windows) > 1:
+                boundaries = self.segment_windows(conversation, windows)
+            else:
+                boundaries = self.request_segment_boundaries(conversation)
             
-            # Format conversation for the prompt
-            conversation_text = self.format_conversation_for_prompt(conversation)
+            if not boundaries:
+                report('warning', "Segmentation reply had no usable segments. Using fallback segmentation.", fallback=True)
+                return self.get_programmatic_segments_new_format(conversation)
             
-            # Count total messages first
-            total_messages = len(conversation)
+            segments = []
+            for boundary in boundaries:
+                start_idx, end_idx = boundary['start_idx'], boundary['end_idx']
+                
+                # Programmatically copy-paste content using validated indices
+                content = self.extract_content_from_indices(conversation, start_idx, end_idx)
+                
+                # Validate content is not empty
+                if not content.strip():
+                    report('warning', f"Empty content for segment {start_idx}-{end_idx}. Skipping segment.")
+                    continue
+                
+                segments.append({
+                    'conversation_segment_id': boundary.get('conversation_segment_id', len(segments) + 1),
+                    'content': content,
+                    'start_idx': start_idx,
+                    'end_idx': end_idx
+                })
             
-            expert_prompt = f"""You are an expert conversation analyzer that segments dialogues.
+            if segments:
+                return segments
+            else:
+                return self.get_programmatic_segments_new_format(conversation)
+                
+        except Exception as e:
+            report('error', f"Expert segmentation error: {str(e)}. Using fallback segmentation.", fallback=True)
+            return self.get_programmatic_segments_new_format(conversation)
+    
+    def segment_windows(self, conversation: Conversation, windows: List[Tuple[int, int]]) -> List[Dict]:
+        """Segment overlapping windows concurrently and merge them into one global boundary list."""
+        def segment_window(window: Tuple[int, int]) -> List[Tuple[int, int, None]]:
+            start, end = window
+            try:
+                boundaries = self.request_segment_boundaries(conversation[start:end]) or []
+            except Exception as e:
+                report('warning', f"Segmentation of messages {start}-{end - 1} failed: {e}. Merging neighbouring windows over it.", fallback=True)
+                boundaries = []
+            return [(b['start_idx'], b['end_idx'], None) for b in boundaries]
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(windows))), thread_name_prefix="segment-window") as executor:
+            window_segments = list(executor.map(with_script_run_ctx(segment_window), windows))
+        
+        merged = merge_window_segments(windows, window_segments, len(conversation))
+        return [
+            {'conversation_segment_id': i + 1, 'start_idx': start_idx, 'end_idx': end_idx}
+            for i, (start_idx, end_idx, _) in enumerate(merged)
+        ]
+    
+    def request_segment_boundaries(self, conversation: Conversation) -> Optional[List[Dict]]:
+        """Ask gpt-4o-mini for segment boundaries of conversation (indices local to it). None if the reply has no segments."""
+        # Format conversation for the prompt
+        conversation_text = self.format_conversation_for_prompt(conversation)
+        
+        # Count total messages first
+        total_messages = len(conversation)
+        
+        expert_prompt = f"""You are an expert conversation analyzer that segments dialogues.
 
 IMPORTANT: This conversation contains EXACTLY {total_messages} messages, numbered from 0 to {total_messages - 1}.
 DO NOT create segments beyond message index {total_messages - 1}.
@@ -168,162 +312,80 @@ Return ONLY a JSON array with this exact format:
 ]
 
 Where start_idx and end_idx are 0-based message indices between 0 and {total_messages - 1}."""
-            
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are an expert conversation analyzer. Return only valid JSON with segment boundaries."},
-                    {"role": "user", "content": expert_prompt}
-                ],
-                max_tokens=10000,
-                temperature=0.1,
-                response_format={"type": "json_object"}
-            )
-            
-            # Parse the JSON response
-            import json
-            segments_data = json.loads(response.choices[0].message.content)
-            
-            # Convert to our format and populate content programmatically
-            segments = []
-            if isinstance(segments_data, list):
-                segment_list = segments_data
-            elif 'segments' in segments_data:
-                segment_list = segments_data['segments']
-            else:
-                return self.get_programmatic_segments_new_format(conversation)
-            
-            for segment_data in segment_list:
-                if 'start_idx' in segment_data and 'end_idx' in segment_data:
-                    start_idx = segment_data['start_idx']
-                    end_idx = segment_data['end_idx']
-                    
-                    # Validate indices are within conversation bounds
-                    if start_idx < 0 or start_idx >= len(conversation):
-                        st.warning(f"Invalid start_idx {start_idx} for conversation with {len(conversation)} messages. Skipping segment.")
-                        continue
-                    
-                    if end_idx < 0 or end_idx >= len(conversation):
-                        st.warning(f"Invalid end_idx {end_idx} for conversation with {len(conversation)} messages. Adjusting to {len(conversation) - 1}.")
-                        end_idx = len(conversation) - 1
-                    
-                    if start_idx > end_idx:
-                        st.warning(f"Invalid segment: start_idx {start_idx} > end_idx {end_idx}. Skipping segment.")
-                        continue
-                    
-                    # Programmatically copy-paste content using validated indices
-                    content = self.extract_content_from_indices(conversation, start_idx, end_idx)
-                    
-                    # Validate content is not empty
-                    if not content.strip():
-                        st.warning(f"Empty content for segment {start_idx}-{end_idx}. Skipping segment.")
-                        continue
-                    
-                    segments.append({
-                        'conversation_segment_id': segment_data.get('conversation_segment_id', len(segments) + 1),
-                        'content': content,
-                        'start_idx': start_idx,
-                        'end_idx': end_idx
-                    })
-            
-            if segments:
-                return segments
-            else:
-                return self.get_programmatic_segments_new_format(conversation)
-                
-        except Exception as e:
-            st.error(f"Expert segmentation error: {str(e)}. Using fallback segmentation.")
-            return self.get_programmatic_segments_new_format(conversation)
-    
-    def get_programmatic_segments_new_format(self, conversation: List[Dict]) -> List[Dict]:
-        """Fallback programmatic segmentation in new JSON format with larger segments."""
-        segments = []
         
-        # Special handling for known test conversation (6 messages) - combine into 2 segments
-        if len(conversation) == 6:
-            segment_boundaries = [
-                (0, 3),  # Greeting + Health Concern + Weather Info
-                (4, 5)   # Care Advice + Agreement
-            ]
-            
-            for i, (start_idx, end_idx) in enumerate(segment_boundaries):
-                content = self.extract_content_from_indices(conversation, start_idx, end_idx)
-                segments.append({
-                    'conversation_segment_id': i + 1,
-                    'content': content,
-                    'start_idx': start_idx,
-                    'end_idx': end_idx
-                })
+        response_content = cached_chat_completion(
+            session_value('openai_api_key'),
+            'segmentation',
+            conversation_hash=conversation_hash(conversation),
+            validate=parses_as_segments,
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You are an expert conversation analyzer. Return only valid JSON with segment boundaries."},
+                {"role": "user", "content": expert_prompt}
+            ],
+            max_tokens=10000,
+            temperature=0.1,
+            response_format={"type": "json_object"}
+        )
         
+        # Parse the JSON response
+        segments_data = json.loads(response_content)
+        
+        if isinstance(segments_data, list):
+            segment_list = segments_data
+        elif 'segments' in segments_data:
+            segment_list = segments_data['segments']
         else:
-            # General segmentation - create larger segments to meet 200-word minimum
-            # Calculate segment size to create max 10 segments
-            total_messages = len(conversation)
-            target_segments = min(10, max(1, total_messages // 20))  # Aim for ~20 messages per segment
-            
-            if target_segments == 1:
-                # If conversation is small, create just 1-2 segments
-                if total_messages <= 10:
-                    segments.append({
-                        'conversation_segment_id': 1,
-                        'content': self.extract_content_from_indices(conversation, 0, total_messages - 1),
-                        'start_idx': 0,
-                        'end_idx': total_messages - 1
-                    })
-                else:
-                    # Split into 2 segments
-                    mid_point = total_messages // 2
-                    segments.append({
-                        'conversation_segment_id': 1,
-                        'content': self.extract_content_from_indices(conversation, 0, mid_point - 1),
-                        'start_idx': 0,
-                        'end_idx': mid_point - 1
-                    })
-                    segments.append({
-                        'conversation_segment_id': 2,
-                        'content': self.extract_content_from_indices(conversation, mid_point, total_messages - 1),
-                        'start_idx': mid_point,
-                        'end_idx': total_messages - 1
-                    })
-            else:
-                # Create larger segments
-                messages_per_segment = total_messages // target_segments
+            return None
+        
+        boundaries = []
+        for segment_data in segment_list:
+            if 'start_idx' in segment_data and 'end_idx' in segment_data:
+                start_idx = segment_data['start_idx']
+                end_idx = segment_data['end_idx']
                 
-                for i in range(target_segments):
-                    start_idx = i * messages_per_segment
-                    if i == target_segments - 1:
-                        # Last segment gets any remaining messages
-                        end_idx = total_messages - 1
-                    else:
-                        end_idx = start_idx + messages_per_segment - 1
-                    
-                    content = self.extract_content_from_indices(conversation, start_idx, end_idx)
-                    segments.append({
-                        'conversation_segment_id': i + 1,
-                        'content': content,
-                        'start_idx': start_idx,
-                        'end_idx': end_idx
-                    })
+                # Validate indices are within conversation bounds
+                if start_idx < 0 or start_idx >= len(conversation):
+                    report('warning', f"Invalid start_idx {start_idx} for conversation with {len(conversation)} messages. Skipping segment.")
+                    continue
+                
+                if end_idx < 0 or end_idx >= len(conversation):
+                    report('warning', f"Invalid end_idx {end_idx} for conversation with {len(conversation)} messages. Adjusting to {len(conversation) - 1}.")
+                    end_idx = len(conversation) - 1
+                
+                if start_idx > end_idx:
+                    report('warning', f"Invalid segment: start_idx {start_idx} > end_idx {end_idx}. Skipping segment.")
+                    continue
+                
+                boundaries.append({
+                    'conversation_segment_id': segment_data.get('conversation_segment_id', len(boundaries) + 1),
+                    'start_idx': start_idx,
+                    'end_idx': end_idx
+                })
         
+        return boundaries
+    
+    def get_programmatic_segments_new_format(self, conversation: ConversationLike) -> List[Dict]:
+        """Fallback offline segmentation at lexical topic shifts and long silences (no API calls)."""
+        conversation = as_conversation(conversation)
+        segments = []
+        for start_idx, end_idx in segment_topics(conversation, min_words=MIN_SEGMENT_WORDS, max_segments=MAX_FALLBACK_SEGMENTS):
+            segments.append({
+                'conversation_segment_id': len(segments) + 1,
+                'content': self.extract_content_from_indices(conversation, start_idx, end_idx),
+                'start_idx': start_idx,
+                'end_idx': end_idx
+            })
         return segments
     
-    def format_conversation_for_prompt(self, conversation: List[Dict]) -> str:
+    def format_conversation_for_prompt(self, conversation: ConversationLike) -> str:
         """Format conversation for the expert analysis prompt."""
-        formatted = ""
-        for msg in conversation:
-            formatted += f"[{msg['timestamp']}] {msg['speaker']}: {msg['message']}\n"
-        return formatted.strip()
+        return as_conversation(conversation).render("[{timestamp}] {speaker}: {message}").strip()
     
-    def extract_content_from_indices(self, conversation: List[Dict], start_idx: int, end_idx: int) -> str:
+    def extract_content_from_indices(self, conversation: ConversationLike, start_idx: int, end_idx: int) -> str:
         """Programmatically copy-paste content using start_idx and end_idx."""
-        content_lines = []
-        
-        for i in range(start_idx, min(end_idx + 1, len(conversation))):
-            msg = conversation[i]
-            # Format as "Speaker: message" without timestamp
-            content_lines.append(f"{msg['speaker']}: {msg['message']}")
-        
-        return "\n".join(content_lines)
+        # Format as "Speaker: message" without timestamp, rendered from a view over the range
+        return as_conversation(conversation)[start_idx:end_idx + 1].render("{speaker}: {message}")
     
 
     
@@ -337,31 +399,32 @@ Where start_idx and end_idx are 0-based message indices between 0 and {total_mes
         """Generate summary for a specific segment using OpenAI API."""
         try:
             # Check if API key is available
-            if not hasattr(st.session_state, 'openai_api_key') or not st.session_state.openai_api_key:
+            if not session_value('openai_api_key'):
                 return self.generate_fallback_segment_summary(segment)
             
-            client = openai.OpenAI(api_key=st.session_state.openai_api_key)
-            
             segment_text = self.format_segment_for_prompt(segment)
             # Enforce detected language if available
-            lang = self.language_code or st.session_state.get('detected_language')
-            language_directive = "Please write the summary in Russian." if lang == 'ru' else "Please write the summary in English."
+            lang = self.language_code or session_value('detected_language')
+            language_directive = f"Please write the summary in {language_name(lang)}."
             full_prompt = f"{self.segment_summary_prompt}\n\nLANGUAGE REQUIREMENT: {language_directive}\n\n{segment_text}"
             
-            response = client.chat.completions.create(
+            summary = cached_chat_completion(
+                session_value('openai_api_key'),
+                'segment_summary',
                 model="gpt-4o",
                 messages=[
                     {"role": "system", "content": "You are a helpful assistant that provides concise, accurate summaries of dialogue segments."},
                     {"role": "user", "content": full_prompt}
                 ],
                 max_tokens=150,
-                temperature=0.3
+                temperature=0.3,
+                validate=str.strip
             )
             
-            return response.choices[0].message.content.strip()
+            return summary.strip()
             
         except Exception as e:
-            st.error(f"API Error: {str(e)}")
+            report('error', f"API Error: {str(e)}", fallback=True)
             return self.generate_fallback_segment_summary(segment)
     
     def generate_fallback_segment_summary(self, segment: Dict) -> str:
@@ -379,13 +442,13 @@ Where start_idx and end_idx are 0-based message indices between 0 and {total_mes
         words = all_text.lower().split()
         
         # Enforce detected language if available
-        enforced_lang = self.language_code or st.session_state.get('detected_language')
+        enforced_lang = self.language_code or session_value('detected_language')
         if enforced_lang in ('ru', 'en'):
             is_russian = enforced_lang == 'ru'
         else:
             # Auto-detect if not enforced
             russian_words = ['что', 'как', 'где', 'когда', 'почему', 'да', 'нет', 'хорошо', 'плохо', 'спасибо', 'пожалуйста', 'привет', 'пока', 'здравствуйте', 'до свидания']
-            is_russian = any(word in all_text.lower() for word in russian_words) or any(ord(char) >= 1040 and ord(char) <= 1103 for char in all_text)
+            is_russian = any(word in all_text.lower() for word in russian_words) or detect_language(all_text).script == 'cyrillic'
         
         if is_russian:
             # Russian topic detection
@@ -442,13 +505,30 @@ Where start_idx and end_idx are 0-based message indices between 0 and {total_mes
         
         return summary
     
-    def generate_segmented_summaries(self, conversation: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
-        """Generate summaries for each conversation segment."""
-        segments = self.segment_conversation(conversation)
+    def segments_from_agent_segments(self, conversation: ConversationLike, agent_segments: List) -> List[Dict]:
+        """Turn canonical agent segments (start_line/end_line) into summary segments, in conversation order."""
+        conversation = as_conversation(conversation)
+        segments = []
+        for agent_segment in sorted(agent_segments, key=lambda x: x.start_line):
+            start_idx, end_idx = agent_segment.start_line, agent_segment.end_line
+            if start_idx < 0 or start_idx > end_idx or end_idx >= len(conversation):
+                continue
+            segments.append({
+                'conversation_segment_id': agent_segment.segment_id,
+                'content': self.extract_content_from_indices(conversation, start_idx, end_idx),
+                'start_idx': start_idx,
+                'end_idx': end_idx
+            })
+        return segments
+    
+    def generate_segmented_summaries(self, conversation: ConversationLike, segments: Optional[List[Dict]] = None) -> Tuple[List[Dict], List[Dict]]:
+        """Generate summaries for each conversation segment, segmenting first unless segments are given."""
+        if segments is None:
+            segments = self.segment_conversation(conversation)
+        summary_texts = self.summarize_segments(segments)
         summaries = []
         
-        for segment in segments:
-            summary_text = self.generate_segment_summary_with_api(segment)
+        for segment, summary_text in zip(segments, summary_texts):
             summaries.append({
                 'conversation_segment_id': segment['conversation_segment_id'],
                 'summary': summary_text,
@@ -456,6 +536,16 @@ Where start_idx and end_idx are 0-based message indices between 0 and {total_mes
             })
         
         return summaries, segments
+    
+    def summarize_segments(self, segments: List[Dict]) -> List[str]:
+        """Summarize segments concurrently (up to max_concurrency at once), preserving segment order."""
+        if self.max_concurrency <= 1 or len(segments) <= 1:
+            return [self.generate_segment_summary_with_api(segment) for segment in segments]
+        
+        # generate_segment_summary_with_api falls back per segment on errors, so one failure never sinks the batch
+        summarize = with_script_run_ctx(self.generate_segment_summary_with_api)
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(segments)), thread_name_prefix="segment-summary") as executor:
+            return list(executor.map(summarize, segments))
 
 class FollowupGenerator:
     """Generate followups using the agent-based system from workflow_read_file.py"""
@@ -465,123 +555,223 @@ class FollowupGenerator:
         # Defer agent initialization until API key is available
         self.agent_segmenter_rater = None
         self.agent_starter_generator = None
+        
+        # Research cache hits/misses and saved latency of the latest starter generation run
+        self.last_research_stats = None
+        # Segmenter outputs repaired locally instead of re-prompted, for the latest segmentation
+        self.last_repair_stats = None
+        
+        # 'single' asks for all starters in one call; 'per_segment' runs one call per top segment concurrently
+        self.starter_mode = os.getenv('STARTER_GENERATION_MODE', 'single')
+        
+        # Conversations longer than this are segmented by the agent in overlapping windows
+        self.window_tokens = int(os.getenv('SEGMENTATION_WINDOW_TOKENS', DEFAULT_WINDOW_TOKENS))
+        self.window_overlap_tokens = int(os.getenv('SEGMENTATION_OVERLAP_TOKENS', DEFAULT_OVERLAP_TOKENS))
+    
+    @staticmethod
+    def agent_speaker_label(speaker: str) -> str:
+        """Map a transcript speaker name to the agent-format role ('agent' or 'user')."""
+        if speaker.lower() == 'agent':
+            return "agent"
+        elif speaker.lower() in ['user', 'user 2']:
+            return "user"
+        # Handle other speaker types
+        return "agent" if "agent" in speaker.lower() else "user"
     
-    def format_conversation_for_agents(self, conversation: List[Dict]) -> str:
+    def format_conversation_for_agents(self, conversation: ConversationLike) -> str:
         """Convert Streamlit conversation format to agent-expected format."""
-        conversation_lines = []
-        
-        for msg in conversation:
-            # Convert to agent format: "speaker: message"
-            if msg['speaker'].lower() == 'agent':
-                conversation_lines.append(f"agent: {msg['message']}")
-            elif msg['speaker'].lower() in ['user', 'user 2']:
-                conversation_lines.append(f"user: {msg['message']}")
-            else:
-                # Handle other speaker types
-                speaker_type = "agent" if "agent" in msg['speaker'].lower() else "user"
-                conversation_lines.append(f"{speaker_type}: {msg['message']}")
+        # Convert to agent format: "speaker: message"; labels are resolved once per distinct speaker
+        return as_conversation(conversation).render("{speaker}: {message}", speaker_map=self.agent_speaker_label)
+    
+    @staticmethod
+    def openai_api_key() -> Optional[str]:
+        """The session's (or job's) API key, else the process-wide OPENAI_API_KEY; sessions never change the latter."""
+        return session_value('openai_api_key') or os.getenv('OPENAI_API_KEY')
+    
+    def agents_enabled(self) -> bool:
+        """Whether the agent system can run: modules importable and an OpenAI API key available."""
+        return AGENTS_AVAILABLE and bool(self.openai_api_key())
+    
+    async def _ensure_agents(self):
+        # Agents are built once per model and API key and shared across reruns and sessions;
+        # the key is read on the caller's thread, where the session (or job) is known
+        api_key = await call_in_caller(self.openai_api_key)
+        if self.agent_segmenter_rater is None:
+            self.agent_segmenter_rater = agent_registry.get(SEGMENTER_RATER, self.model_name, api_key)
+        if self.agent_starter_generator is None:
+            self.agent_starter_generator = agent_registry.get(STARTER_GENERATOR, self.model_name, api_key, mode=self.starter_mode)
+    
+    def warm_agents(self):
+        """Start building this model's agents for the session's API key in the background once one is available."""
+        if self.agents_enabled():
+            agent_registry.warm_in_background(self.model_name, self.openai_api_key(), starter_mode=self.starter_mode)
+    
+    async def segment_and_rate(self, conversation: ConversationLike) -> List:
+        """
+        Canonical segmentation pass: one set of segments with engagement/enjoyment scores,
+        shared by the summary panel and starter generation. Long conversations are
+        segmented in overlapping windows and merged.
+        """
+        await self._ensure_agents()
         
-        return '\n'.join(conversation_lines)
+        # Format conversation for agents
+        formatted_conversation = self.format_conversation_for_agents(conversation)
+        # Line offsets shared by windowing, prompt rendering and content extraction
+        line_index = LineIndex(formatted_conversation)
+        
+        # Enforce language for segmenter if detected (session state is read on the Streamlit thread)
+        lang = await call_in_caller(session_value, 'detected_language')
+        language_note = f"Please respond entirely in {language_name(lang)} (all fields)."
+        seg_prompt = f"Please analyze this conversation. {language_note}"
+        
+        repair_stats = RepairStats()
+        windows = plan_windows([estimate_tokens(line) for line in line_index],
+                               self.window_tokens, self.window_overlap_tokens)
+        if len(windows) <= 1:
+            segments = await self._segment_window(line_index, seg_prompt, repair_stats, lang)
+        else:
+            window_results = await asyncio.gather(
+                *(self._segment_window(LineIndex(line_index.lines(start, end - 1)), seg_prompt, repair_stats, lang)
+                  for start, end in windows),
+                return_exceptions=True
+            )
+            window_segments = []
+            for (start, end), window_result in zip(windows, window_results):
+                if isinstance(window_result, BaseException):
+                    await call_in_caller(report, 'warning', f"Segmentation of lines {start}-{end - 1} failed: {window_result}. Merging neighbouring windows over it.", fallback=True)
+                    window_result = []
+                window_segments.append([(seg.start_line, seg.end_line, seg) for seg in window_result])
+            
+            # Lines no window segment claimed (failed windows) join a neighbouring segment, so coverage stays complete
+            merged = absorb_unclaimed(merge_window_segments(windows, window_segments, len(line_index)))
+            segments = [
+                seg.model_copy(update={'segment_id': i + 1, 'start_line': start_line, 'end_line': end_line})
+                for i, (start_line, end_line, seg) in enumerate(merged)
+            ]
+        
+        # Segment ids key the summary panel widgets, so they must be unique
+        if len({seg.segment_id for seg in segments}) != len(segments):
+            for i, seg in enumerate(sorted(segments, key=lambda x: x.start_line)):
+                seg.segment_id = i + 1
+        
+        self.last_repair_stats = repair_stats.summary()
+        
+        # Programmatically populate segment content based on line numbers
+        return populate_segment_content(segments, line_index)
     
-    async def generate_followups_with_agents(self, conversation: List[Dict]) -> Tuple[List[str], List]:
+    async def _segment_window(self, line_index: 'LineIndex', seg_prompt: str, repair_stats: Optional['RepairStats'] = None,
+                              language_code: Optional[str] = None) -> List:
+        """Run the segmenter-rater agent on agent-formatted text (line numbers local to it), via the LLM cache."""
+        cache = get_llm_cache()
+        seg_key = LLMCache.make_key('agent_segmenter_rater', self.model_name, seg_prompt,
+                                    conversation_hash=hashlib.sha256(line_index.text.encode('utf-8')).hexdigest())
+        cached_segments = cache.get_json(seg_key, 'agent_segmenter_rater')
+        if cached_segments is not None:
+            return [ConversationSegment.model_validate(seg) for seg in cached_segments]
+        
+        deps = SegmenterRaterDeps(conversation=line_index.text, line_index=line_index,
+                                  repair_stats=repair_stats if repair_stats is not None else RepairStats(),
+                                  language_code=language_code)
+        result = await self.agent_segmenter_rater.run(seg_prompt, deps=deps)
+        segments = result.data.segments
+        cache.set_json(seg_key, [seg.model_dump() for seg in segments], 'agent_segmenter_rater')
+        return segments
+    
+    async def generate_starters(self, segments: List) -> List[str]:
+        """Generate conversation starters from the top 3 segments by combined score."""
+        await self._ensure_agents()
+        cache = get_llm_cache()
+        
+        # Get top 3 segments by combined score
+        top_segments = sorted(segments, key=lambda x: x.combined_score, reverse=True)[:3]
+        
+        # Write the starters in the detected language (session state is read on the Streamlit thread)
+        lang = await call_in_caller(session_value, 'detected_language')
+        starter_deps = StarterGeneratorDeps(top_segments=top_segments, language_code=lang)
+        starter_key = LLMCache.make_key('agent_starter_generator', self.model_name,
+                                        [seg.model_dump() for seg in top_segments], {'mode': self.starter_mode, 'language': lang})
+        cached_starters = cache.get_json(starter_key, 'agent_starter_generator')
+        if cached_starters is not None:
+            starters = [ConversationStarter.model_validate(starter) for starter in cached_starters]
+        else:
+            starter_result = await self.agent_starter_generator.run(deps=starter_deps)
+            starters = starter_result.data
+            cache.set_json(starter_key, [starter.model_dump() for starter in starters], 'agent_starter_generator')
+        self.last_research_stats = starter_deps.research_stats.summary()
+        
+        # Convert ConversationStarter objects to strings
+        return [starter.starter for starter in starters]  # Show all generated
+    
+    async def generate_followups_with_agents(self, conversation: ConversationLike) -> Tuple[List[str], List]:
         """Generate followups using the agent-based system."""
         if not AGENTS_AVAILABLE:
-            return self.generate_fallback_followups(conversation), []
+            return await call_in_caller(self.generate_fallback_followups, conversation), []
         
         try:
-            # Set up environment for agents to access OpenAI API key
-            if hasattr(st.session_state, 'openai_api_key') and st.session_state.openai_api_key:
-                os.environ['OPENAI_API_KEY'] = st.session_state.openai_api_key
-            elif not os.getenv('OPENAI_API_KEY'):
-                st.warning("⚠️ No OpenAI API key available for agents. Using fallback followups.")
-                return self.generate_fallback_followups(conversation), []
-            
-            # Initialize agents lazily after API key is present
-            if self.agent_segmenter_rater is None:
-                self.agent_segmenter_rater = make_agent_chat_segmenter_rater(model_name=self.model_name)
-            if self.agent_starter_generator is None:
-                self.agent_starter_generator = make_agent_conversation_starter_generator(model_name=self.model_name)
-            
-            # Format conversation for agents
-            formatted_conversation = self.format_conversation_for_agents(conversation)
+            if not await call_in_caller(self.agents_enabled):
+                await call_in_caller(report, 'warning', "⚠️ No OpenAI API key available for agents. Using fallback followups.")
+                return await call_in_caller(self.generate_fallback_followups, conversation), []
             
             # Step 1: Segment and rate conversation
-            deps = SegmenterRaterDeps(conversation=formatted_conversation)
-            # Enforce language for segmenter if detected
-            lang = st.session_state.get('detected_language')
-            language_note = "Please respond entirely in Russian (all fields)." if lang == 'ru' else "Please respond entirely in English (all fields)."
-            seg_prompt = f"Please analyze this conversation. {language_note}"
-            result = await self.agent_segmenter_rater.run(seg_prompt, deps=deps)
-            segments = result.data.segments
-            
-            # Programmatically populate segment content based on line numbers
-            if AGENTS_AVAILABLE:
-                segments = populate_segment_content(segments, formatted_conversation)
-            
-            # Get top 3 segments by combined score
-            top_segments = sorted(segments, key=lambda x: x.combined_score, reverse=True)[:3]
+            segments = await self.segment_and_rate(conversation)
             
             # Step 2: Generate conversation starters
-            starter_deps = StarterGeneratorDeps(top_segments=top_segments)
-            starter_result = await self.agent_starter_generator.run(deps=starter_deps)
-            starters = starter_result.data
-            
-            # Convert ConversationStarter objects to strings
-            followup_strings = [starter.starter for starter in starters]  # Show all generated
+            followup_strings = await self.generate_starters(segments)
             
             return followup_strings, segments
             
         except Exception as e:
-            st.error(f"Agent-based followup generation failed: {str(e)}")
-            return self.generate_fallback_followups(conversation), []
+            await call_in_caller(report, 'error', f"Agent-based followup generation failed: {str(e)}", fallback=True)
+            return await call_in_caller(self.generate_fallback_followups, conversation), []
     
-    def generate_followups_sync(self, conversation: List[Dict]) -> List[str]:
+    def _run_sync(self, make_coroutine, fallback):
+        """Run make_coroutine() to completion from sync code; on failure report the error and return fallback()."""
+        try:
+            # The shared background loop keeps the agents' async HTTP clients and connection pools alive between runs
+            return get_background_loop().run(make_coroutine())
+        except Exception as e:
+            report('error', f"Followup generation failed: {str(e)}", fallback=True)
+            return fallback()
+    
+    def segment_and_rate_sync(self, conversation: ConversationLike) -> List:
+        """Synchronous canonical segmentation; returns [] when agents are unavailable or fail."""
+        if not self.agents_enabled():
+            return []
+        return self._run_sync(lambda: self.segment_and_rate(conversation), lambda: [])
+    
+    def generate_starters_sync(self, segments: List, conversation: ConversationLike) -> List[str]:
+        """Synchronous starter generation from canonical segments, with fallback followups."""
+        if not segments or not self.agents_enabled():
+            return self.generate_fallback_followups(conversation)
+        return self._run_sync(lambda: self.generate_starters(segments),
+                              lambda: self.generate_fallback_followups(conversation))
+    
+    def generate_followups_sync(self, conversation: ConversationLike) -> List[str]:
         """Synchronous wrapper for async followup generation."""
         followups, _ = self.generate_followups_and_segments_sync(conversation)
         return followups
     
-    def generate_followups_and_segments_sync(self, conversation: List[Dict]) -> Tuple[List[str], List]:
+    def generate_followups_and_segments_sync(self, conversation: ConversationLike) -> Tuple[List[str], List]:
         """Synchronous wrapper for async followup generation that returns both followups and segments."""
         if not AGENTS_AVAILABLE:
             return self.generate_fallback_followups(conversation), []
-            
-        try:
-            # Try to run in new event loop
-            return asyncio.run(self.generate_followups_with_agents(conversation))
-        except RuntimeError as e:
-            if "cannot be called from a running event loop" in str(e):
-                # We're in an existing event loop, try different approach
-                try:
-                    import nest_asyncio
-                    nest_asyncio.apply()
-                    return asyncio.run(self.generate_followups_with_agents(conversation))
-                except ImportError:
-                    st.warning("⚠️ nest_asyncio not available. Using fallback followups.")
-                    return self.generate_fallback_followups(conversation), []
-                except Exception as e:
-                    st.error(f"Nested async execution failed: {str(e)}")
-                    return self.generate_fallback_followups(conversation), []
-            else:
-                st.error(f"Async execution failed: {str(e)}")
-                return self.generate_fallback_followups(conversation), []
-        except Exception as e:
-            st.error(f"Followup generation failed: {str(e)}")
-            return self.generate_fallback_followups(conversation), []
+        return self._run_sync(lambda: self.generate_followups_with_agents(conversation),
+                              lambda: (self.generate_fallback_followups(conversation), []))
     
-    def generate_fallback_followups(self, conversation: List[Dict] = None) -> List[str]:
+    def generate_fallback_followups(self, conversation: Optional[ConversationLike] = None) -> List[str]:
         """Generate fallback follow-ups when agents are not available."""
         
         # Determine language from detected value first
-        lang = st.session_state.get('detected_language')
+        lang = session_value('detected_language')
         is_russian = False
         if lang in ('ru', 'en'):
             is_russian = lang == 'ru'
         else:
             # Heuristic detection if not provided
             if conversation:
-                all_text = " ".join([msg.get('message', '') for msg in conversation])
+                all_text = as_conversation(conversation).text
                 russian_words = ['что', 'как', 'где', 'когда', 'почему', 'да', 'нет', 'хорошо', 'плохо', 'спасибо', 'пожалуйста', 'привет', 'пока', 'здравствуйте', 'до свидания']
-                is_russian = any(word in all_text.lower() for word in russian_words) or any(ord(char) >= 1040 and ord(char) <= 1103 for char in all_text)
+                is_russian = any(word in all_text.lower() for word in russian_words) or detect_language(all_text).script == 'cyrillic'
         
         if is_russian:
             return [
@@ -607,11 +797,9 @@ class DataStorage:
         self.log_file = log_file
         
     def log_interaction(self, interaction_data: Dict):
-        """Log user interaction to file."""
+        """Log user interaction to file (queued and written in batches by a background writer)."""
         interaction_data['logged_at'] = datetime.now().isoformat()
-        
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(interaction_data) + '\n')
+        get_interaction_logger(self.log_file).log(interaction_data)
     
     def get_session_data(self) -> Dict:
         """Get or create session data."""
@@ -629,18 +817,83 @@ class DataStorage:
             }
         return st.session_state.session_data
 
-def generate_segmented_summaries(conversation: List[Dict], summary_generator: SummaryGenerator) -> Tuple[List[Dict], List[Dict]]:
+def generate_segmented_summaries(conversation: ConversationLike, summary_generator: SummaryGenerator, segments: Optional[List[Dict]] = None) -> Tuple[List[Dict], List[Dict]]:
     """Generate segment-based summaries with precise source mapping."""
-    summaries, segments = summary_generator.generate_segmented_summaries(conversation)
+    summaries, segments = summary_generator.generate_segmented_summaries(conversation, segments)
     return summaries, segments
 
-def display_interactive_segment_summaries(segment_summaries: List[Dict], segments: List[Dict], conversation: List[Dict], session_data: Dict):
-    """Display an interactive summary with clickable segment summaries."""
+AGENT_SEGMENTS_PAGE_SIZE = 10
+
+def paged_view(key: str, total: int, search: Optional[Callable[[str], List[int]]] = None,
+               describe: Optional[Callable[[int], str]] = None, page_size: int = DEFAULT_PAGE_SIZE) -> Tuple[int, int]:
+    """
+    Page selector for a long list of rows, with optional search and jump-to-index.
+    Returns the [start, stop) range of rows to render, so only one page is sent per rerun.
+    """
+    pages = page_count(total, page_size)
+    page_key = f"{key}_page"
+    if not 1 <= st.session_state.get(page_key, 1) <= pages:
+        st.session_state[page_key] = 1
+    if pages == 1 and search is None:
+        return 0, total
+    
+    def jump(source_key: str):
+        index = st.session_state.get(source_key)
+        if index is not None:
+            st.session_state[page_key] = page_of(index, page_size)
+            st.session_state[f"{key}_highlight"] = index
+    
+    if search is not None:
+        search_col, jump_col, page_col = st.columns([2, 1, 1])
+        with search_col:
+            query = st.text_input("🔎 Search", key=f"{key}_query", placeholder="Find text...")
+        with jump_col:
+            st.number_input("Jump to #", min_value=0, max_value=max(total - 1, 0), step=1, value=None,
+                            key=f"{key}_jump", on_change=jump, args=(f"{key}_jump",))
+        with page_col:
+            st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=page_key)
+        
+        if query:
+            matches = search(query)
+            if matches:
+                more = "+" if len(matches) >= DEFAULT_SEARCH_LIMIT else ""
+                st.selectbox(
+                    f"Matches: {len(matches)}{more}",
+                    matches,
+                    index=None,
+                    format_func=lambda i: f"#{i}: {describe(i)[:80]}" if describe else f"#{i}",
+                    key=f"{key}_match",
+                    on_change=jump,
+                    args=(f"{key}_match",)
+                )
+            else:
+                st.caption("No matches")
+    elif pages > 1:
+        st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=page_key)
+    
+    start, stop = page_range(st.session_state[page_key], total, page_size)
+    if pages > 1:
+        st.caption(f"Showing {start}-{stop - 1} of {total}")
+    return start, stop
+
+def highlighted_row(key: str) -> Optional[int]:
+    """Row last jumped to in paged_view(key), if any."""
+    return st.session_state.get(f"{key}_highlight")
+
+def display_interactive_segment_summaries(segment_summaries: List[Dict], segments: List[Dict], conversation: ConversationLike, session_data: Dict):
+    """Display an interactive summary with clickable segment summaries (called from the summary panel fragment)."""
     st.markdown("### 📝 Interactive Segment Summaries")
     st.markdown("*Click on any summary to view the exact source dialogue segment*")
     
-    # Display each segment summary as a clickable button
-    for summary_item in segment_summaries:
+    # Display each segment summary on the current page as a clickable button
+    start, stop = paged_view(
+        'segment_summaries',
+        len(segment_summaries),
+        search=lambda query: search_lines([item['summary'] for item in segment_summaries], query),
+        describe=lambda i: segment_summaries[i]['summary'],
+        page_size=AGENT_SEGMENTS_PAGE_SIZE
+    )
+    for summary_item in segment_summaries[start:stop]:
         segment_id = summary_item['conversation_segment_id']
         summary_text = summary_item['summary']
         
@@ -683,18 +936,27 @@ def display_interactive_segment_summaries(segment_summaries: List[Dict], segment
             
             st.info(f"📌 Showing complete dialogue for Segment {selected_segment_id}")
             
-            # Display the exact conversation content from this segment
+            # Display the exact conversation content from this segment, one page per markdown block
             content_lines = selected_segment['content'].split('\n')
-            for line in content_lines:
+            view_key = f"source_segment_{selected_segment_id}"
+            start, stop = paged_view(view_key, len(content_lines), search=lambda query: search_lines(content_lines, query),
+                                     describe=lambda i: content_lines[i])
+            highlight = highlighted_row(view_key)
+            blocks = []
+            for i in range(start, stop):
+                line = content_lines[i]
                 if ':' in line:
                     speaker, message = line.split(':', 1)
-                    # Highlight each message with proper contrast
-                    st.markdown(f"""
-                    <div style="background-color: #e8f4fd; color: #1e1e1e; padding: 15px; margin: 8px 0; border-radius: 8px; border-left: 5px solid #0066cc; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+                    # Highlight each message with proper contrast; the jumped-to one gets a stronger border
+                    border = "#ff9800" if i == highlight else "#0066cc"
+                    blocks.append(f"""
+                    <div style="background-color: #e8f4fd; color: #1e1e1e; padding: 15px; margin: 8px 0; border-radius: 8px; border-left: 5px solid {border}; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
                         <strong style="color: #0066cc;">{speaker}:</strong><br>
                         <span style="color: #2c3e50; line-height: 1.5;">{message.strip()}</span>
                     </div>
-                    """, unsafe_allow_html=True)
+                    """)
+            if blocks:
+                st.markdown("".join(blocks), unsafe_allow_html=True)
             
             # Show segment info
             message_count = len(content_lines)
@@ -708,18 +970,45 @@ def display_interactive_segment_summaries(segment_summaries: List[Dict], segment
             """, unsafe_allow_html=True)
             
             # Add button to clear selection
-            if st.button("🔄 Clear Selection", key="clear_selection"):
-                session_data['selected_segment'] = None
-                st.rerun()
+            st.button("🔄 Clear Selection", key="clear_selection", on_click=session_data.update, kwargs={'selected_segment': None})
 
-def generate_intelligent_follow_ups(conversation: List[Dict], followup_generator: FollowupGenerator) -> List[str]:
+def generate_intelligent_follow_ups(conversation: ConversationLike, followup_generator: FollowupGenerator) -> List[str]:
     """Generate intelligent follow-ups using the agent-based system."""
     return followup_generator.generate_followups_sync(conversation)
 
-def generate_intelligent_follow_ups_and_segments(conversation: List[Dict], followup_generator: FollowupGenerator) -> Tuple[List[str], List]:
+def generate_intelligent_follow_ups_and_segments(conversation: ConversationLike, followup_generator: FollowupGenerator) -> Tuple[List[str], List]:
     """Generate intelligent follow-ups and conversation segments using the agent-based system."""
     return followup_generator.generate_followups_and_segments_sync(conversation)
 
+def agent_content_line_html(line: str, highlight: bool = False) -> str:
+    """HTML for one line of agent segment content, color coded by speaker type."""
+    # Outline the line last jumped to
+    outline = " outline: 2px solid #ff9800;" if highlight else ""
+    if ':' in line:
+        # Try to split on first colon to separate speaker from message
+        speaker, message = line.split(':', 1)
+        speaker = speaker.strip()
+        message = message.strip()
+        
+        # Color code by speaker type
+        if speaker.lower() == 'agent':
+            return f"""
+            <div style="background-color: #e3f2fd; padding: 10px; margin: 5px 0; border-radius: 5px; border-left: 3px solid #2196f3;{outline}">
+                <strong style="color: #1976d2;">🤖 {speaker}:</strong> <span style="color: #424242;">{message}</span>
+            </div>
+            """
+        return f"""
+            <div style="background-color: #f3e5f5; padding: 10px; margin: 5px 0; border-radius: 5px; border-left: 3px solid #9c27b0;{outline}">
+                <strong style="color: #7b1fa2;">👤 {speaker}:</strong> <span style="color: #424242;">{message}</span>
+            </div>
+            """
+    # Handle lines without colon (shouldn't happen but good fallback)
+    return f"""
+            <div style="background-color: #f8f9fa; padding: 8px; margin: 3px 0; border-radius: 3px; border-left: 2px solid #6c757d;{outline}">
+                <span style="color: #495057;">{line}</span>
+            </div>
+            """
+
 def display_agent_conversation_segments(agent_segments: List, session_data: Dict):
     """Display conversation segments generated by the AI agents with engagement/enjoyment scores and reasoning."""
     if not agent_segments:
@@ -733,8 +1022,9 @@ def display_agent_conversation_segments(agent_segments: List, session_data: Dict
     # Sort segments by combined score (highest first)
     sorted_segments = sorted(agent_segments, key=lambda x: x.combined_score, reverse=True)
     
-    for i, segment in enumerate(sorted_segments):
-        # Create an expandable section for each segment
+    # Only the current page of segments is rendered
+    page_start, page_stop = paged_view('agent_segments', len(sorted_segments), page_size=AGENT_SEGMENTS_PAGE_SIZE)
+    for i, segment in enumerate(sorted_segments[page_start:page_stop], page_start):
         # Create an expandable section for each segment
         line_info = ""
         if hasattr(segment, 'start_line') and hasattr(segment, 'end_line'):
@@ -789,48 +1079,14 @@ def display_agent_conversation_segments(agent_segments: List, session_data: Dict
             st.markdown("**💬 Complete Segment Content:**")
             
             if segment.content and segment.content.strip():
-                content_lines = segment.content.split('\n')
-                
-                for i, line in enumerate(content_lines):
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    if ':' in line:
-                        # Try to split on first colon to separate speaker from message
-                        parts = line.split(':', 1)
-                        if len(parts) == 2:
-                            speaker, message = parts
-                            speaker = speaker.strip()
-                            message = message.strip()
-                            
-                            # Color code by speaker type
-                            if speaker.lower() == 'agent':
-                                st.markdown(f"""
-                                <div style="background-color: #e3f2fd; padding: 10px; margin: 5px 0; border-radius: 5px; border-left: 3px solid #2196f3;">
-                                    <strong style="color: #1976d2;">🤖 {speaker}:</strong> <span style="color: #424242;">{message}</span>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            else:
-                                st.markdown(f"""
-                                <div style="background-color: #f3e5f5; padding: 10px; margin: 5px 0; border-radius: 5px; border-left: 3px solid #9c27b0;">
-                                    <strong style="color: #7b1fa2;">👤 {speaker}:</strong> <span style="color: #424242;">{message}</span>
-                                </div>
-                                """, unsafe_allow_html=True)
-                        else:
-                            # Fallback for lines that don't follow expected format
-                            st.markdown(f"""
-                            <div style="background-color: #f8f9fa; padding: 8px; margin: 3px 0; border-radius: 3px; border-left: 2px solid #6c757d;">
-                                <span style="color: #495057;">{line}</span>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    else:
-                        # Handle lines without colon (shouldn't happen but good fallback)
-                        st.markdown(f"""
-                        <div style="background-color: #f8f9fa; padding: 8px; margin: 3px 0; border-radius: 3px; border-left: 2px solid #6c757d;">
-                            <span style="color: #495057;">{line}</span>
-                        </div>
-                        """, unsafe_allow_html=True)
+                content_lines = [line.strip() for line in segment.content.split('\n') if line.strip()]
+                view_key = f"agent_segment_{segment.segment_id}"
+                start, stop = paged_view(view_key, len(content_lines), search=lambda query, lines=content_lines: search_lines(lines, query),
+                                         describe=lambda j, lines=content_lines: lines[j])
+                highlight = highlighted_row(view_key)
+                # One markdown block per page instead of one per line
+                blocks = [agent_content_line_html(content_lines[j], j == highlight) for j in range(start, stop)]
+                st.markdown("".join(blocks), unsafe_allow_html=True)
             else:
                 st.warning("⚠️ No content available for this segment")
             
@@ -883,37 +1139,384 @@ def display_agent_conversation_segments(agent_segments: List, session_data: Dict
     based on line boundaries identified by the AI.
     """)
 
-# Helper: detect dominant language ('ru' or 'en') using OpenAI if available, else heuristic
-def detect_conversation_language(conversation: List[Dict]) -> str:
+# Helper: detect dominant language (ISO 639-1 code) offline, asking OpenAI only when unsure
+def detect_conversation_language(conversation: ConversationLike) -> str:
+    conversation = as_conversation(conversation)
+    guess = detect_language(conversation[:200].text)
+    # Local detections below the threshold are double-checked with the LLM
+    if guess.confidence >= CONFIDENCE_THRESHOLD:
+        return guess.code
+    
     try:
         # Use OpenAI if key is present
-        if hasattr(st.session_state, 'openai_api_key') and st.session_state.openai_api_key:
-            client = openai.OpenAI(api_key=st.session_state.openai_api_key)
+        if session_value('openai_api_key'):
             # Sample first N messages to keep prompt compact
-            sample = conversation[:50]
-            text = "\n".join(f"{m['speaker']}: {m['message']}" for m in sample)
+            text = conversation[:50].render("{speaker}: {message}")
             user_prompt = (
                 "Determine the dominant language in this dialogue (consider both speakers). "
-                "Return exactly 'ru' for Russian or 'en' for English. No other text.\n\n" + text
+                "Return exactly one ISO 639-1 code such as 'en' or 'ru'. No other text.\n\n" + text
             )
-            resp = client.chat.completions.create(
+            code = cached_chat_completion(
+                session_value('openai_api_key'),
+                'language',
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are a strict language detector. Reply with 'ru' or 'en' only."},
+                    {"role": "system", "content": "You are a strict language detector. Reply with a two-letter ISO 639-1 code only."},
                     {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=2,
-                temperature=0.0
-            )
-            code = resp.choices[0].message.content.strip().lower()
-            return 'ru' if code.startswith('ru') else 'en'
+                temperature=0.0,
+                validate=lambda reply: reply.strip().lower()[:2] in LANGUAGE_NAMES
+            ).strip().lower()[:2]
+            if code in LANGUAGE_NAMES:
+                return code
         
     except Exception as e:
-        st.warning(f"Language detection via API failed: {e}. Falling back to heuristic.")
+        report('warning', f"Language detection via API failed: {e}. Using local detection.", fallback=True)
+    
+    return guess.code
+
+JOB_POLL_SECONDS = float(os.getenv('JOB_POLL_SECONDS', 2))
+JOB_STATUS_ICONS = {QUEUED: "🕒", RUNNING: "⏳", DONE: "✅", FAILED: "❌", INTERRUPTED: "⚠️"}
+STAGE_ICONS = {PENDING: "⏸️", RUNNING: "⏳", DONE: "✅", FAILED: "❌", SKIPPED: "⏭️"}
+
+# Widget keys of the follow-up review cards, cleared when another job is opened
+REVIEW_WIDGET_PREFIXES = ('follow_up_', 'select_', 'rating_', 'comment_')
+
+def upload_key_for(uploaded_file) -> str:
+    """Content hash of an upload, computed once per uploaded file and session."""
+    upload_keys = st.session_state.setdefault('upload_keys', {})
+    if uploaded_file.file_id not in upload_keys:
+        upload_keys[uploaded_file.file_id] = upload_hash(uploaded_file.getvalue())
+    return upload_keys[uploaded_file.file_id]
+
+def parsed_conversation(uploaded_file, upload_key: str) -> Conversation:
+    """The upload's conversation, parsed once per distinct file content across all sessions."""
+    def parse():
+        # Stream-parse the file in chunks instead of decoding it whole
+        uploaded_file.seek(0)
+        return Conversation.from_source(uploaded_file)
+    
+    return get_result_store().get_or_create('conversation', upload_key, parse, sizeof=lambda conversation: conversation.nbytes)
+
+def processing_key(upload_key: str) -> str:
+    """Result key for processing an upload: the same file, API key, model and options give the same results."""
+    followup_generator = FollowupGenerator()
+    return content_hash('processing', upload_key, credential_fingerprint(followup_generator.openai_api_key()),
+                        followup_generator.model_name, followup_generator.agents_enabled(),
+                        followup_generator.starter_mode, followup_generator.window_tokens)
+
+def submit_processing_job(conversation: Conversation, label: str, storage: DataStorage, key: Optional[str] = None) -> str:
+    """Queue language detection, segmentation, summaries and follow-ups for conversation; returns the job id."""
+    summary_generator = SummaryGenerator()
+    followup_generator = FollowupGenerator()
+    
+    def detect_language_stage(_):
+        # Detect and store dominant language; both branches below depend on it
+        detected_lang = detect_conversation_language(conversation)
+        set_session_value('detected_language', detected_lang)
+        # Apply to summary generator
+        summary_generator.language_code = detected_lang
+        return detected_lang
+    
+    def segmentation_stage(_):
+        # One canonical, scored segmentation feeds both the summaries and the starters
+        return followup_generator.segment_and_rate_sync(conversation)
     
-    # Heuristic fallback (Cyrillic presence)
-    all_text = " ".join((m.get('message', '') or '') for m in conversation)
-    return 'ru' if any(ord(c) >= 1040 and ord(c) <= 1103 for c in all_text) else 'en'
+    def summaries_stage(inputs):
+        # Generate segment-based summaries over the canonical segments (own segmentation if none)
+        agent_segments = inputs['segmentation']
+        segments = summary_generator.segments_from_agent_segments(conversation, agent_segments) if agent_segments else None
+        return generate_segmented_summaries(conversation, summary_generator, segments)
+    
+    def follow_ups_stage(inputs):
+        # Generate intelligent follow-ups from the top canonical segments
+        agent_segments = inputs['segmentation']
+        return followup_generator.generate_starters_sync(agent_segments, conversation), agent_segments
+    
+    def on_finish(job: Job, outcome):
+        for stage_name, error in outcome.errors.items():
+            job.add_message('error', f"Stage '{job.stages[stage_name]['label']}' failed: {error}")
+        
+        detected_lang = outcome.results.get('language', job.context.get('detected_language'))
+        job.add_message('info', f"🌐 Detected language: {language_name(detected_lang)}")
+        
+        # Validate segment bounds
+        summaries, segments = outcome.results.get('summaries', ([], []))
+        valid_segments = []
+        for segment in segments:
+            if segment['start_idx'] < len(conversation) and segment['end_idx'] < len(conversation):
+                valid_segments.append(segment)
+            else:
+                job.add_message('error', f"⚠️ Invalid segment {segment['conversation_segment_id']}: indices {segment['start_idx']}-{segment['end_idx']} exceed conversation length {len(conversation)}")
+        job.set_result('summaries', (summaries, valid_segments))
+        
+        if 'follow_ups' not in outcome.results:
+            job.set_result('follow_ups', (followup_generator.generate_fallback_followups(conversation), []))
+        follow_ups, agent_segments = job.results['follow_ups']
+        job.set_result('research_stats', followup_generator.last_research_stats)
+        job.set_result('repair_stats', followup_generator.last_repair_stats)
+        
+        # Log summary generation
+        storage.log_interaction({
+            'action': 'conversation_processed',
+            'job_id': job.id,
+            'conversation_length': len(conversation),
+            'number_of_segments': len(valid_segments),
+            'invalid_segments': len(segments) - len(valid_segments),
+            'number_of_followups': len(follow_ups),
+            'number_of_agent_segments': len(agent_segments),
+            'agents_available': AGENTS_AVAILABLE,
+            'has_api_key': bool(job.context.get('openai_api_key')),
+            'stage_durations': {name: round(seconds, 3) for name, seconds in outcome.durations.items()},
+            'research_stats': followup_generator.last_research_stats,
+            'repair_stats': followup_generator.last_repair_stats
+        })
+        
+        # Success message based on available systems
+        followup_method = "intelligent agent-based" if AGENTS_AVAILABLE else "fallback"
+        job.add_message('success', f"✅ Conversation processed with {len(valid_segments)} valid segments and {len(follow_ups)} {followup_method} follow-ups!")
+        
+        if len(segments) != len(valid_segments):
+            job.add_message('warning', f"⚠️ Filtered out {len(segments) - len(valid_segments)} invalid segments that exceeded conversation bounds")
+        
+        if not AGENTS_AVAILABLE:
+            job.add_message('info', "💡 Install agent modules for intelligent followup generation")
+        
+        if job.degraded:
+            job.add_message('warning', "⚠️ Some results are fallbacks after errors; processing this file again will retry.")
+    
+    # Summaries and follow-ups only share the segmentation, so they run side by side
+    stages = [
+        Stage('language', detect_language_stage, label="Detecting language"),
+        Stage('segmentation', segmentation_stage, depends_on=('language',), label="Segmenting and rating conversation"),
+        Stage('summaries', summaries_stage, depends_on=('segmentation',), label="Generating segment-based AI summaries"),
+        Stage('follow_ups', follow_ups_stage, depends_on=('segmentation',), label="Generating intelligent follow-ups"),
+    ]
+    
+    return get_job_queue().submit(
+        label,
+        stages,
+        # Stages read the key from this snapshot, not from the (possibly changed) session
+        context={'openai_api_key': st.session_state.get('openai_api_key'), 'conversation': conversation},
+        inputs={'label': label, 'conversation': conversation.render("[{timestamp}] {speaker}: {message}")},
+        on_finish=on_finish,
+        key=key
+    )
+
+def job_conversation(job: Job) -> Optional[Conversation]:
+    """The job's conversation; re-parsed from its persisted inputs for jobs from an earlier process."""
+    conversation = job.context.get('conversation')
+    if conversation is None:
+        inputs = get_job_queue().load_inputs(job.id)
+        if inputs:
+            conversation = job.context['conversation'] = Conversation.from_source(inputs['conversation'])
+    return conversation
+
+def open_job(job: Job, session_data: Dict):
+    """Make job the one under review, replacing the previous conversation and its review state."""
+    session_data.update({
+        'job_id': job.id,
+        'job_version': None,
+        'conversation': job_conversation(job) or [],
+        'segment_summaries': [],
+        'segments': [],
+        'follow_ups': [],
+        'agent_segments': [],
+        'selected_follow_up': None,
+        'user_feedback': {},
+        'selected_segment': None,
+        'show_agent_analysis': False,
+        'research_stats': None,
+        'repair_stats': None
+    })
+    for key in list(st.session_state.keys()):
+        if key.startswith(REVIEW_WIDGET_PREFIXES):
+            del st.session_state[key]
+    apply_job_results(job, session_data)
+
+def apply_job_results(job: Job, session_data: Dict):
+    """Copy the results that have landed since the last rerun into session_data."""
+    state = job.to_dict()
+    if state['version'] == session_data.get('job_version'):
+        return
+    results = state['results']
+    
+    if 'language' in results:
+        st.session_state['detected_language'] = results['language']
+    if 'summaries' in results:
+        session_data['segment_summaries'], session_data['segments'] = results['summaries']
+    if 'follow_ups' in results:
+        follow_ups, agent_segments = results['follow_ups']
+        session_data['follow_ups'] = list(follow_ups)
+        # Jobs loaded from disk hold agent segments as plain dicts
+        session_data['agent_segments'] = [
+            ConversationSegment.model_validate(segment) if isinstance(segment, dict) else segment
+            for segment in agent_segments
+        ]
+    for name in ('research_stats', 'repair_stats'):
+        if name in results:
+            session_data[name] = results[name]
+    session_data['job_version'] = state['version']
+
+def render_jobs_panel(session_data: Dict):
+    """Status of this session's jobs, refreshed by polling while any of them is active."""
+    queue = get_job_queue()
+    jobs = queue.jobs(st.session_state.get('job_ids', []))
+    if not jobs:
+        return
+    
+    st.subheader("🗂️ Processing Jobs")
+    for job in jobs:
+        state = job.to_dict()
+        is_open = job.id == session_data.get('job_id')
+        st.write(f"{JOB_STATUS_ICONS[state['status']]} **{state['label']}**{' (open)' if is_open else ''}")
+        if job.active:
+            st.progress(job.progress())
+        if job.active or is_open:
+            for stage in state['stages'].values():
+                duration = f" ({stage['seconds']:.1f}s)" if stage['seconds'] is not None else ""
+                st.caption(f"{STAGE_ICONS[stage['status']]} {stage['label']}{duration}")
+        if is_open:
+            for message in state['messages']:
+                getattr(st, message['level'])(message['text'])
+        elif st.button("📂 Open", key=f"open_job_{job.id}"):
+            open_job(job, session_data)
+            st.rerun()
+    
+    # Re-render the whole page once new results of the open job have landed
+    current = queue.get(session_data.get('job_id'))
+    if current is not None and current.version != session_data.get('job_version'):
+        st.rerun()
+
+@st.fragment
+def render_follow_up_card(i: int, follow_up: str, session_data: Dict, storage: DataStorage):
+    """One follow-up's edit, select, rating and comment widgets; changing them reruns only this card."""
+    st.subheader(f"Follow-up {i+1}")
+    
+    # Display follow-up in an editable text area
+    edited_follow_up = st.text_area(
+        f"Edit follow-up {i+1}:",
+        value=follow_up,
+        height=80,
+        key=f"follow_up_{i}"
+    )
+    
+    # Selection and rating
+    col_select, col_rate = st.columns([1, 1])
+    
+    selected = False
+    with col_select:
+        if st.button(f"Select Follow-up {i+1}", key=f"select_{i}"):
+            selected = True
+            session_data['selected_follow_up'] = i
+            
+            # Log the selection
+            storage.log_interaction({
+                'action': 'follow_up_selected',
+                'follow_up_index': i,
+                'original_follow_up': follow_up,
+                'edited_follow_up': edited_follow_up
+            })
+        
+        if session_data.get('selected_follow_up') == i:
+            st.success(f"✅ Selected follow-up {i+1}")
+    
+    with col_rate:
+        rating = st.select_slider(
+            f"Rate {i+1}:",
+            options=[1, 2, 3, 4, 5],
+            value=3,
+            key=f"rating_{i}"
+        )
+    
+    # Add comment section
+    comment = st.text_input(
+        f"Comment on follow-up {i+1}:",
+        key=f"comment_{i}",
+        placeholder="Optional feedback..."
+    )
+    
+    # Store ratings and comments
+    previous_text = session_data['user_feedback'].get(f'follow_up_{i}', {}).get('edited_text')
+    session_data['user_feedback'][f'follow_up_{i}'] = {
+        'rating': rating,
+        'comment': comment,
+        'edited_text': edited_follow_up
+    }
+    
+    st.divider()
+    
+    # The selection and the selected follow-up's text are shown in the summary panel (and the
+    # selection on the previously selected card), so changing either reruns the whole app
+    edited_selected = session_data.get('selected_follow_up') == i and previous_text not in (None, edited_follow_up)
+    if selected or edited_selected:
+        st.rerun(scope="app")
+
+@st.fragment
+def render_agent_analysis_panel(session_data: Dict):
+    """Button to show or hide the agent's segment analysis; reruns on its own."""
+    # Add button to view agent conversation segments
+    st.markdown("---")
+    st.markdown("#### 🔍 Analysis Details")
+    
+    # The flag is set in a callback, so the panel below renders in the same fragment run
+    if st.button("🧠 View AI Agent Conversation Analysis", key="view_agent_segments", help="See how the AI analyzed your conversation",
+                 on_click=session_data.update, kwargs={'show_agent_analysis': bool(session_data.get('agent_segments'))}):
+        if not session_data.get('agent_segments'):
+            if AGENTS_AVAILABLE:
+                st.warning("⚠️ No agent analysis available. Make sure you have an OpenAI API key configured.")
+            else:
+                st.info("💡 Agent analysis requires the agent system. Install agent modules for detailed conversation analysis.")
+    
+    # Display agent segments if requested
+    if session_data.get('show_agent_analysis') and session_data.get('agent_segments'):
+        display_agent_conversation_segments(session_data['agent_segments'], session_data)
+        
+        # Add button to hide the analysis
+        st.button("🔼 Hide Analysis", key="hide_agent_segments", on_click=session_data.update, kwargs={'show_agent_analysis': False})
+
+@st.fragment
+def render_summary_panel(session_data: Dict, job_running: bool):
+    """Segment summaries, selected follow-up and original conversation; reruns on its own."""
+    st.header("📃 Conversation Segment Summaries")
+    
+    if session_data['segment_summaries'] and session_data.get('segments'):
+        # Display interactive segment summaries
+        display_interactive_segment_summaries(
+            session_data['segment_summaries'],
+            session_data['segments'],
+            session_data['conversation'],
+            session_data
+        )
+        
+        # Show selected follow-up
+        if session_data.get('selected_follow_up') is not None:
+            st.markdown("---")
+            st.subheader("✅ Selected Follow-up")
+            selected_idx = session_data['selected_follow_up']
+            selected_text = session_data['user_feedback'][f'follow_up_{selected_idx}']['edited_text']
+            st.success(f"**Follow-up {selected_idx + 1}**: {selected_text}")
+    
+    elif job_running:
+        st.info("⏳ Segment summaries are being generated...")
+    
+    elif session_data['conversation']:
+        # Show message to process the conversation
+        st.info("💡 Upload a conversation and click 'Process Conversation' to generate segment-based summaries")
+    
+    # Show original conversation
+    with st.expander("📖 View Original Conversation"):
+        conversation = as_conversation(session_data['conversation'])
+        start, stop = paged_view('transcript', len(conversation),
+                                 search=lambda query: search_conversation(conversation, query),
+                                 describe=conversation.message)
+        # The page is rendered as one text block, numbered by message index
+        highlight = highlighted_row('transcript')
+        st.text('\n'.join(
+            f"{'▶' if i == highlight else ' '} {i:>6}  [{msg['timestamp']}] {msg['speaker']}: {msg['message']}"
+            for i, msg in enumerate(conversation[start:stop], start)
+        ))
 
 def main():
     """Main Streamlit application."""
@@ -921,9 +1524,14 @@ def main():
     # Initialize data storage, summary generator, and followup generator
     storage = DataStorage()
     session_data = storage.get_session_data()
-    summary_generator = SummaryGenerator()
     followup_generator = FollowupGenerator()
     
+    # Pick up results of the open job that landed since the last rerun
+    opened_job = get_job_queue().get(session_data.get('job_id'))
+    if opened_job is not None:
+        apply_job_results(opened_job, session_data)
+    job_running = opened_job is not None and opened_job.active
+    
     # Header
     st.title("🤖 Agentic Follow-up Rating System")
     st.markdown("Rate and improve AI-generated conversation follow-ups")
@@ -942,13 +1550,15 @@ def main():
         
         if api_key:
             st.session_state.openai_api_key = api_key
-            os.environ['OPENAI_API_KEY'] = api_key
             st.success("✅ API key configured")
         elif hasattr(st.session_state, 'openai_api_key'):
             st.info("🔑 Using previously entered API key")
         else:
             st.warning("⚠️ No API key provided - using fallback summary generation")
         
+        # Build agents off the hot path as soon as a key is known (no-op once they exist)
+        followup_generator.warm_agents()
+        
         st.divider()
         st.header("📁 Upload Conversation")
         
@@ -959,13 +1569,14 @@ def main():
         )
         
         if uploaded_file is not None:
-            # Read and parse the file
-            content = uploaded_file.read().decode('utf-8')
-            parser = ConversationParser()
-            conversation = parser.parse_conversation(content)
+            upload_key = upload_key_for(uploaded_file)
+            try:
+                conversation = parsed_conversation(uploaded_file, upload_key)
+            except UnicodeDecodeError as e:
+                conversation = None
+                st.error(f"❌ The file is not valid UTF-8 text: {e}")
             
             if conversation:
-                session_data['conversation'] = conversation
                 st.success(f"✅ Parsed {len(conversation)} messages")
                 
                 # Show conversation preview
@@ -976,64 +1587,31 @@ def main():
                 if len(conversation) > 3:
                     st.text(f"... and {len(conversation) - 3} more messages")
                     
-                # Generate summary and follow-ups
+                # Queue processing; results appear as they land while other conversations are reviewed
                 if st.button("🔄 Process Conversation"):
-                    with st.spinner("Generating segment-based AI summaries..."):
-                        # Show conversation statistics
-                        st.info(f"📊 Conversation contains {len(conversation)} messages (indices 0-{len(conversation)-1})")
-                        
-                        # Detect and store dominant language
-                        detected_lang = detect_conversation_language(conversation)
-                        st.session_state['detected_language'] = detected_lang
-                        # Apply to summary generator
-                        summary_generator.language_code = detected_lang
-                        st.info(f"🌐 Detected language: {'Russian' if detected_lang == 'ru' else 'English'}")
-                        
-                        # Generate segment-based summaries
-                        summaries, segments = generate_segmented_summaries(
-                            conversation, summary_generator
-                        )
-                        
-                        # Validate and display segment information
-                        valid_segments = []
-                        for segment in segments:
-                            if segment['start_idx'] < len(conversation) and segment['end_idx'] < len(conversation):
-                                valid_segments.append(segment)
-                            else:
-                                st.error(f"⚠️ Invalid segment {segment['conversation_segment_id']}: indices {segment['start_idx']}-{segment['end_idx']} exceed conversation length {len(conversation)}")
-                        
-                        session_data['segment_summaries'] = summaries
-                        session_data['segments'] = valid_segments
-                        
-                        # Generate intelligent follow-ups using agents
-                        with st.spinner("Generating intelligent follow-ups..."):
-                            session_data['follow_ups'], session_data['agent_segments'] = generate_intelligent_follow_ups_and_segments(conversation, followup_generator)
-                        
-                        # Log summary generation
-                        storage.log_interaction({
-                            'action': 'conversation_processed',
-                            'conversation_length': len(conversation),
-                            'number_of_segments': len(valid_segments),
-                            'invalid_segments': len(segments) - len(valid_segments),
-                            'number_of_followups': len(session_data['follow_ups']),
-                            'number_of_agent_segments': len(session_data.get('agent_segments', [])),
-                            'agents_available': AGENTS_AVAILABLE,
-                            'has_api_key': bool(hasattr(st.session_state, 'openai_api_key') and st.session_state.openai_api_key)
-                        })
-                        
-                        # Success message based on available systems
-                        followup_method = "intelligent agent-based" if AGENTS_AVAILABLE else "fallback"
-                        st.success(f"✅ Conversation processed with {len(valid_segments)} valid segments and {len(session_data['follow_ups'])} {followup_method} follow-ups!")
-                        
-                        if len(segments) != len(valid_segments):
-                            st.warning(f"⚠️ Filtered out {len(segments) - len(valid_segments)} invalid segments that exceeded conversation bounds")
-                            
-                        if not AGENTS_AVAILABLE:
-                            st.info("💡 Install agent modules for intelligent followup generation")
-                        st.rerun()
-            else:
+                    # Reuse a queued, running or finished job for the same file and options from any session
+                    result_key = processing_key(upload_key)
+                    job = get_job_queue().find(result_key)
+                    if job is None:
+                        job_id = submit_processing_job(conversation, uploaded_file.name, storage, result_key)
+                    else:
+                        job_id = job.id
+                        storage.log_interaction({'action': 'processing_reused', 'job_id': job_id, 'job_status': job.status})
+                    job_ids = st.session_state.setdefault('job_ids', [])
+                    if job_id not in job_ids:
+                        job_ids.append(job_id)
+                    # Open the new job right away unless another conversation is under review
+                    if not session_data.get('follow_ups'):
+                        open_job(get_job_queue().get(job_id), session_data)
+                    st.rerun()
+            elif conversation is not None:
                 st.error("❌ No valid conversation messages found in the file")
         
+        # Poll job progress only while some job of this session is still active
+        session_jobs = get_job_queue().jobs(st.session_state.get('job_ids', []))
+        polling = any(job.active for job in session_jobs)
+        st.fragment(render_jobs_panel, run_every=JOB_POLL_SECONDS if polling else None)(session_data)
+        
         # Session info
         if session_data['conversation']:
             st.divider()
@@ -1052,9 +1630,34 @@ def main():
             st.write(f"**Follow-ups generated**: {'✅' if session_data['follow_ups'] else '❌'}")
             st.write(f"**Agent segments**: {len(session_data.get('agent_segments', []))} analyzed")
             st.write(f"**Agent system**: {'✅ Available' if AGENTS_AVAILABLE else '❌ Using fallback'}")
+            
+            cache_stats = get_llm_cache().stats()
+            st.write(f"**LLM cache**: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                     f"({cache_stats['hit_rate']:.0%}), {cache_stats['entries']} entries, {cache_stats['bytes'] / 1024:.0f} KB")
+            
+            store_stats = get_result_store().stats()
+            st.write(f"**Result store**: {store_stats['hits']} hits / {store_stats['misses']} misses "
+                     f"({store_stats['hit_rate']:.0%}), {store_stats['entries']} entries, {store_stats['bytes'] / 1024:.0f} KB")
+            
+            research_stats = session_data.get('research_stats')
+            if research_stats and research_stats['lookups']:
+                st.write(f"**Research cache**: {research_stats['hits'] + research_stats['joined']}/{research_stats['lookups']} "
+                         f"lookups answered without a search ({research_stats['hit_rate']:.0%}), "
+                         f"{research_stats['saved_seconds']:.1f}s saved")
+            
+            repair_stats = session_data.get('repair_stats')
+            if repair_stats and repair_stats['results']:
+                st.write(f"**Segmenter repairs**: {repair_stats['avoided_retries']} re-prompts avoided "
+                         f"(~{repair_stats['avoided_tokens']:,} tokens), {repair_stats['retries']} needed, "
+                         f"{repair_stats.get('cosmetic_repairs', 0)} cosmetic fixes")
+            
+            timings = request_timings.summary()
+            if timings['requests']:
+                st.write(f"**OpenAI requests**: {timings['requests']} ({timings['reused_connections']} on kept-alive connections), "
+                         f"avg setup {timings['avg_connect_ms']:.0f} ms / server {timings['avg_server_ms']:.0f} ms")
     
     # Main content area
-    if session_data['conversation'] and session_data['follow_ups']:
+    if session_data['conversation'] and (session_data['follow_ups'] or session_data['segment_summaries'] or job_running):
         
         # Create two columns: follow-ups (left) and summary (right)
         col1, col2 = st.columns([1, 1])
@@ -1062,116 +1665,20 @@ def main():
         # Left column: Follow-ups
         with col1:
             st.header("💬 Generated Follow-ups")
-            st.markdown("Select and rate the follow-ups below:")
-            
-            selected_follow_up = None
+            if not session_data['follow_ups'] and job_running:
+                st.info("⏳ Follow-ups are being generated...")
+            else:
+                st.markdown("Select and rate the follow-ups below:")
             
+            # Each card and the analysis panel rerun on their own when their widgets change
             for i, follow_up in enumerate(session_data['follow_ups']):
-                st.subheader(f"Follow-up {i+1}")
-                
-                # Display follow-up in an editable text area
-                edited_follow_up = st.text_area(
-                    f"Edit follow-up {i+1}:",
-                    value=follow_up,
-                    height=80,
-                    key=f"follow_up_{i}"
-                )
-                
-                # Selection and rating
-                col_select, col_rate = st.columns([1, 1])
-                
-                with col_select:
-                    if st.button(f"Select Follow-up {i+1}", key=f"select_{i}"):
-                        selected_follow_up = i
-                        session_data['selected_follow_up'] = i
-                        
-                        # Log the selection
-                        storage.log_interaction({
-                            'action': 'follow_up_selected',
-                            'follow_up_index': i,
-                            'original_follow_up': follow_up,
-                            'edited_follow_up': edited_follow_up
-                        })
-                        
-                        st.success(f"✅ Selected follow-up {i+1}")
-                
-                with col_rate:
-                    rating = st.select_slider(
-                        f"Rate {i+1}:",
-                        options=[1, 2, 3, 4, 5],
-                        value=3,
-                        key=f"rating_{i}"
-                    )
-                
-                # Add comment section
-                comment = st.text_input(
-                    f"Comment on follow-up {i+1}:",
-                    key=f"comment_{i}",
-                    placeholder="Optional feedback..."
-                )
-                
-                # Store ratings and comments
-                session_data['user_feedback'][f'follow_up_{i}'] = {
-                    'rating': rating,
-                    'comment': comment,
-                    'edited_text': edited_follow_up
-                }
-                
-                st.divider()
-            
-            # Add button to view agent conversation segments
-            st.markdown("---")
-            st.markdown("#### 🔍 Analysis Details")
-            
-            if st.button("🧠 View AI Agent Conversation Analysis", key="view_agent_segments", help="See how the AI analyzed your conversation"):
-                if session_data.get('agent_segments'):
-                    # Store the flag to show agent segments
-                    session_data['show_agent_analysis'] = True
-                    st.rerun()
-                else:
-                    if AGENTS_AVAILABLE:
-                        st.warning("⚠️ No agent analysis available. Make sure you have an OpenAI API key configured.")
-                    else:
-                        st.info("💡 Agent analysis requires the agent system. Install agent modules for detailed conversation analysis.")
+                render_follow_up_card(i, follow_up, session_data, storage)
             
-            # Display agent segments if requested
-            if session_data.get('show_agent_analysis') and session_data.get('agent_segments'):
-                display_agent_conversation_segments(session_data['agent_segments'], session_data)
-                
-                # Add button to hide the analysis
-                if st.button("🔼 Hide Analysis", key="hide_agent_segments"):
-                    session_data['show_agent_analysis'] = False
-                    st.rerun()
+            render_agent_analysis_panel(session_data)
         
         # Right column: Summary
         with col2:
-            st.header("📃 Conversation Segment Summaries")
-            
-            if session_data['segment_summaries'] and session_data.get('segments'):
-                # Display interactive segment summaries
-                display_interactive_segment_summaries(
-                    session_data['segment_summaries'],
-                    session_data['segments'],
-                    session_data['conversation'],
-                    session_data
-                )
-                
-                # Show selected follow-up
-                if session_data.get('selected_follow_up') is not None:
-                    st.markdown("---")
-                    st.subheader("✅ Selected Follow-up")
-                    selected_idx = session_data['selected_follow_up']
-                    selected_text = session_data['user_feedback'][f'follow_up_{selected_idx}']['edited_text']
-                    st.success(f"**Follow-up {selected_idx + 1}**: {selected_text}")
-            
-            elif session_data['conversation']:
-                # Show message to process the conversation
-                st.info("💡 Upload a conversation and click 'Process Conversation' to generate segment-based summaries")
-            
-            # Show original conversation
-            with st.expander("📖 View Original Conversation"):
-                for msg in session_data['conversation']:
-                    st.text(f"[{msg['timestamp']}] {msg['speaker']}: {msg['message']}")
+            render_summary_panel(session_data, job_running)
     
     else:
         # Welcome screen
@@ -0,0 +1,124 @@
+import asyncio
+import contextvars
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Optional
+
+# Queue of calls to run on the thread blocked in BackgroundLoop.run() for the current coroutine
+_caller_calls: contextvars.ContextVar[Optional[queue.SimpleQueue]] = contextvars.ContextVar('caller_calls', default=None)
+
+
+class BackgroundLoop:
+    """
+    One long-lived asyncio event loop on a daemon thread, shared by all sessions.
+    Sync code submits coroutines to it, so async HTTP clients and their connection
+    pools (which are bound to the loop that first used them) survive across requests.
+    """
+
+    def __init__(self, name: str = "async-loop"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._thread = threading.Thread(target=self._serve, args=(loop, started), name=self.name, daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop, started: threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def submit(self, coroutine: Awaitable) -> Future:
+        """Schedule coroutine on the loop from any thread; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Run coroutine on the loop and block until it finishes, returning its result or
+        raising its exception. While waiting, this thread runs the calls the coroutine
+        hands back with call_in_caller(), e.g. Streamlit calls that need this thread's
+        script context.
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("BackgroundLoop.run() cannot be called from the loop's own thread; await instead")
+
+        calls: queue.SimpleQueue = queue.SimpleQueue()
+
+        async def with_caller():
+            _caller_calls.set(calls)
+            return await coroutine
+
+        future = self.submit(with_caller())
+        future.add_done_callback(lambda _: calls.put(None))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                call = calls.get(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+                if call is None:
+                    return future.result()
+                call()
+        except queue.Empty:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout} seconds") from None
+
+    def stop(self):
+        """Stop the loop; it is restarted on next use."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+
+async def call_in_caller(fn: Callable, *args, **kwargs) -> Any:
+    """
+    Run fn(*args, **kwargs) on the thread waiting in BackgroundLoop.run() for this
+    coroutine and return its result; called directly when there is no such thread.
+    """
+    calls = _caller_calls.get()
+    if calls is None:
+        return fn(*args, **kwargs)
+    result: Future = Future()
+
+    def call():
+        if result.set_running_or_notify_cancel():
+            try:
+                result.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                result.set_exception(e)
+
+    calls.put(call)
+    return await asyncio.wrap_future(result)
+
+
+_background_loop_lock = threading.Lock()
+_background_loop: Optional[BackgroundLoop] = None
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Process-wide background event loop."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = BackgroundLoop()
+        return _background_loop
@@ -0,0 +1,91 @@
+"""
+Interaction logging throughput: the legacy open/append/close per event vs the
+batched background InteractionLogger, at 1, 10 and 100 concurrent writer threads.
+
+Usage:
+    python benchmarks/bench_interaction_log.py [--events 20000] [--writers 1 10 100] [--fsync interval]
+
+--events is the total per run, split across the writers. Logs are written to a
+temporary directory. Logger throughput counts until every event is on disk.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from interaction_log import FSYNC_BATCH, FSYNC_INTERVAL, FSYNC_NEVER, InteractionLogger
+
+SAMPLE_EVENT = {
+    'action': 'follow_up_selected',
+    'follow_up_index': 2,
+    'original_follow_up': "How did the trip to the lake go in the end?",
+    'edited_follow_up': "How did the trip to the lake go?",
+}
+
+
+def legacy_log(path, event):
+    """The original DataStorage.log_interaction."""
+    event['logged_at'] = datetime.now().isoformat()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(event) + '\n')
+
+
+def run_writers(writers, events, log):
+    per_writer = events // writers
+
+    def write():
+        for _ in range(per_writer):
+            log(dict(SAMPLE_EVENT))
+
+    threads = [threading.Thread(target=write) for _ in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return per_writer * writers, start
+
+
+def count_lines(path):
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=20000)
+    parser.add_argument('--writers', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--fsync', choices=[FSYNC_NEVER, FSYNC_INTERVAL, FSYNC_BATCH], default=FSYNC_INTERVAL)
+    args = parser.parse_args()
+
+    print(f"{args.events} events per run, logger fsync policy '{args.fsync}'")
+    print(f"{'writers':>8} {'legacy ev/s':>12} {'batched ev/s':>13} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for writers in args.writers:
+            legacy_path = os.path.join(tmp, f"legacy_{writers}.jsonl")
+            total, start = run_writers(writers, args.events, lambda event: legacy_log(legacy_path, event))
+            legacy_rate = total / (time.perf_counter() - start)
+
+            batched_path = os.path.join(tmp, f"batched_{writers}.jsonl")
+            logger = InteractionLogger(batched_path, fsync=args.fsync, max_bytes=0)
+
+            def batched_log(event):
+                event['logged_at'] = datetime.now().isoformat()
+                logger.log(event)
+
+            total, start = run_writers(writers, args.events, batched_log)
+            logger.close()
+            batched_rate = total / (time.perf_counter() - start)
+
+            assert count_lines(legacy_path) == count_lines(batched_path) == total
+            print(f"{writers:>8} {legacy_rate:>12,.0f} {batched_rate:>13,.0f} {batched_rate / legacy_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Offline language detection: checks that short chat samples are detected confidently
+enough to skip the LLM fallback, then times detect_language on a 200-message sample
+(the slice the app inspects) repeated over many conversations.
+
+Usage:
+    python benchmarks/bench_language_detector.py [--conversations 2000]
+
+Russian and English samples must clear CONFIDENCE_THRESHOLD; the other languages are
+reported, and a confident wrong guess fails the run.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from language_detector import CONFIDENCE_THRESHOLD, detect_language
+
+SAMPLES = {
+    'ru': ["Привет! Как у тебя дела? Я вчера смотрел новый фильм, он мне очень понравился.",
+           "Слушай, давай встретимся завтра после работы и обсудим план поездки.",
+           "Сегодня погода хорошая, пойдём гулять в парк?",
+           "Да, я согласен. Погода сегодня ужасная."],
+    'en': ["Hey, how was your weekend? I went hiking with some friends and it was great.",
+           "Can you send me the report before the meeting tomorrow morning?",
+           "I think we should try the new restaurant downtown.",
+           "Oh, get well soon! Let me check the weather so you know how to dress warmly."],
+    'uk': ["Привіт! Як у тебе справи? Я вчора дивився новий фільм, він мені дуже сподобався."],
+    'bg': ["Здравей! Как си? Вчера гледах нов филм и много ми хареса."],
+    'sr': ["Здраво! Како си? Јуче сам гледао нови филм и јако ми се допао."],
+    'de': ["Hallo, wie geht es dir? Ich habe gestern einen neuen Film gesehen."],
+    'es': ["Hola, ¿cómo estás? Ayer vi una película nueva y me gustó mucho."],
+    'fr': ["Salut, comment ça va ? J'ai vu un nouveau film hier, il était très bien."],
+    'it': ["Ciao, come stai? Ieri ho visto un film nuovo e mi è piaciuto molto."],
+    'pt': ["Olá, tudo bem? Ontem eu vi um filme novo e gostei muito."],
+    'nl': ["Hoi, hoe gaat het met je? Ik heb gisteren een nieuwe film gezien."],
+    'pl': ["Cześć, jak się masz? Wczoraj oglądałem nowy film i bardzo mi się podobał."],
+    'tr': ["Merhaba, nasılsın? Dün yeni bir film izledim ve çok beğendim."],
+    'ar': ["مرحبا، كيف حالك؟ شاهدت فيلما جديدا أمس وأعجبني كثيرا."],
+    'fa': ["سلام، حالت چطوره؟ دیروز یک فیلم جدید دیدم و خیلی خوشم آمد."],
+}
+# Languages whose samples must never fall back to the LLM
+REQUIRED = ('ru', 'en')
+
+
+def check_samples() -> int:
+    failures = 0
+    for lang, texts in SAMPLES.items():
+        for text in texts:
+            guess = detect_language(text)
+            confident = guess.confidence >= CONFIDENCE_THRESHOLD
+            if confident and guess.code == lang:
+                status = "ok"
+            elif confident:
+                status = "WRONG"
+                failures += 1
+            elif lang in REQUIRED:
+                status = "LLM FALLBACK"
+                failures += 1
+            else:
+                status = "llm fallback"
+            print(f"  {lang} -> {guess.code} {guess.confidence:.2f}  {status:<12} {text[:50]}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--conversations', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"Samples (threshold {CONFIDENCE_THRESHOLD}):")
+    failures = check_samples()
+
+    texts = [text for lang in REQUIRED for text in SAMPLES[lang]]
+    sample = "\n".join(texts[i % len(texts)] for i in range(200))
+    start = time.perf_counter()
+    for _ in range(args.conversations):
+        detect_language(sample)
+    elapsed = time.perf_counter() - start
+    print(f"{args.conversations:>8} conversations  {elapsed:6.3f}s  {elapsed / args.conversations * 1e3:.3f} ms each")
+
+    assert not failures, f"{failures} sample(s) detected wrongly or sent to the LLM"
+
+
+if __name__ == '__main__':
+    main()
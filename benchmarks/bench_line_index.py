@@ -0,0 +1,102 @@
+"""
+Segmenter-rater prompt rendering and segment content extraction: legacy string
+building vs the shared LineIndex.
+
+Usage:
+    python benchmarks/bench_line_index.py [--lines 50000] [--segments 500] [--renders 4]
+
+--renders is how often the numbered prompt is built per run (1 + retries=3).
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from agents.chat_segmenter_rater import ConversationSegment, LineIndex, populate_segment_content
+
+SAMPLE_LINES = [
+    "agent: What's new, [REDACTED]?",
+    "user: I have a very bad cold,",
+    "agent: Oh, get well soon! Let me check the weather so you know how to dress warmly.",
+    "user: Да, я согласен. Погода сегодня ужасная.",
+]
+
+
+def legacy_numbered(conversation):
+    """The original system_prompt line numbering."""
+    conversation_lines = conversation.strip().split('\n')
+    numbered_conversation = ""
+    for i, line in enumerate(conversation_lines):
+        numbered_conversation += f"Line {i}: {line}\n"
+    return numbered_conversation
+
+
+def legacy_populate(segments, conversation):
+    """The original populate_segment_content extraction (validation omitted)."""
+    conversation_lines = conversation.strip().split('\n')
+    for segment in segments:
+        segment.content = '\n'.join(conversation_lines[segment.start_line:segment.end_line + 1])
+    return segments
+
+
+def make_segments(n_lines, n_segments):
+    bounds = sorted(random.Random(0).sample(range(1, n_lines), n_segments - 1))
+    starts = [0] + bounds
+    ends = [b - 1 for b in bounds] + [n_lines - 1]
+    return [
+        ConversationSegment(
+            segment_id=i + 1, topic="t", tone="t", conversation_direction="d", interaction_type="personal_interaction",
+            start_line=start, end_line=end, engagement_score=5, engagement_justification="j",
+            enjoyment_score=5, enjoyment_justification="j", combined_score=10,
+        )
+        for i, (start, end) in enumerate(zip(starts, ends))
+    ]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', type=int, default=50000)
+    parser.add_argument('--segments', type=int, default=500)
+    parser.add_argument('--renders', type=int, default=4)
+    args = parser.parse_args()
+
+    conversation = "\n".join(SAMPLE_LINES[i % len(SAMPLE_LINES)] for i in range(args.lines))
+    legacy_segments = make_segments(args.lines, args.segments)
+    indexed_segments = [segment.model_copy() for segment in legacy_segments]
+
+    def legacy():
+        prompts = [legacy_numbered(conversation) for _ in range(args.renders)]
+        legacy_populate(legacy_segments, conversation)
+        return prompts[-1]
+
+    def indexed():
+        line_index = LineIndex(conversation)
+        prompts = [line_index.numbered for _ in range(args.renders)]
+        populate_segment_content(indexed_segments, line_index)
+        return prompts[-1]
+
+    # Per-segment info logging is not what is being measured
+    logging.getLogger('agents.chat_segmenter_rater').setLevel(logging.WARNING)
+
+    legacy_prompt, legacy_seconds = timed(legacy)
+    indexed_prompt, indexed_seconds = timed(indexed)
+    assert legacy_prompt == indexed_prompt
+    assert [s.content for s in legacy_segments] == [s.content for s in indexed_segments]
+
+    print(f"{args.lines} lines, {args.segments} segments, {args.renders} prompt renders")
+    print(f"  legacy:    {legacy_seconds * 1000:8.1f} ms")
+    print(f"  LineIndex: {indexed_seconds * 1000:8.1f} ms  ({legacy_seconds / indexed_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
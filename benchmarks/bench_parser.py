@@ -0,0 +1,101 @@
+"""
+Throughput and peak-RSS benchmark: legacy whole-text parse vs streaming parse.
+
+Usage:
+    python benchmarks/bench_parser.py [--mb 200] [--chunk-size 1048576]
+
+Each mode runs in its own subprocess so peak RSS is measured independently.
+"""
+import argparse
+import os
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from conversation_parser import ConversationParser, DEFAULT_CHUNK_SIZE
+
+SAMPLE_LINES = [
+    "[4/18/2025, 12:29:52 AM] Agent: What's new, [REDACTED]?",
+    "[4/18/2025, 12:29:57 AM] User 2: I have a very bad cold,",
+    "[4/18/2025, 12:30:01 AM] Agent: Oh, get well soon! Let me check the weather so you know how to dress warmly.",
+    "[4/18/2025, 12:30:30 AM] User 2: Да, я согласен. Погода сегодня ужасная.",
+    "...",
+]
+
+
+def legacy_parse(text):
+    """The original ConversationParser.parse_conversation implementation."""
+    lines = text.strip().split('\n')
+    conversations = []
+    for line in lines:
+        line = line.strip()
+        if not line or line == "...":
+            continue
+        pattern = r'\[(.*?)\]\s*([^:]+):\s*(.*)'
+        match = re.match(pattern, line)
+        if match:
+            timestamp, speaker, message = match.groups()
+            conversations.append({
+                'timestamp': timestamp.strip(),
+                'speaker': speaker.strip(),
+                'message': message.strip()
+            })
+    return conversations
+
+
+def write_sample(path, target_mb):
+    block = ("\n".join(SAMPLE_LINES) + "\n").encode('utf-8')
+    repeats = max(1, (target_mb * 1024 * 1024) // len(block))
+    with open(path, 'wb') as f:
+        for _ in range(repeats):
+            f.write(block)
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_mode(mode, path, chunk_size):
+    start = time.perf_counter()
+    if mode == 'legacy':
+        with open(path, 'rb') as f:
+            count = len(legacy_parse(f.read().decode('utf-8')))
+    else:
+        count = 0
+        with open(path, 'rb') as f:
+            for _ in ConversationParser.iter_conversation(f, chunk_size=chunk_size):
+                count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{mode:>8}: {count:>10} msgs  {elapsed:7.2f}s  {count / elapsed:>12,.0f} msgs/s  peak RSS {peak_rss_mb():8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mb', type=int, default=200, help="size of the generated export in MB")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--mode', choices=['legacy', 'stream'], help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.path, args.chunk_size)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'conversation.txt')
+        write_sample(path, args.mb)
+        print(f"Sample export: {os.path.getsize(path) / (1024 * 1024):.1f} MB")
+        for mode in ('legacy', 'stream'):
+            subprocess.run([sys.executable, __file__, '--mode', mode, '--path', path,
+                            '--chunk-size', str(args.chunk_size)], check=True)
+
+
+if __name__ == "__main__":
+    main()
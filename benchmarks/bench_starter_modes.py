@@ -0,0 +1,86 @@
+"""
+Latency and token benchmark: one 15-starter call vs three concurrent 5-starter calls.
+
+Usage:
+    OPENAI_API_KEY=... python benchmarks/bench_starter_modes.py [--runs 3] [--model gpt-4o]
+
+Calls the real OpenAI API. Research is disabled (RESEARCH_BACKEND=none) so only
+model time is measured, and the starter agent's results are not cached.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+os.environ.setdefault('RESEARCH_BACKEND', 'none')
+
+from agents.chat_segmenter_rater import ConversationSegment
+from agents.conversation_starter_generator import (
+    PER_SEGMENT, SINGLE_CALL, STARTERS_PER_SEGMENT, StarterGeneratorDeps, make_agent_conversation_starter_generator
+)
+
+SAMPLE_SEGMENTS = [
+    ConversationSegment(
+        segment_id=1, topic="Bad cold and weather", tone="caring", conversation_direction="User is sick, agent checks weather",
+        interaction_type="personal_interaction", start_line=0, end_line=3,
+        content="user: I have a very bad cold\nagent: Oh, get well soon! Let me check the weather so you know how to dress warmly.\n"
+                "user: Yes please\nagent: It's 4°C and raining in London today, so a warm coat and hot tea it is.",
+        engagement_score=8, engagement_justification="User shares health concern", enjoyment_score=6,
+        enjoyment_justification="Warm, supportive exchange", combined_score=14,
+    ),
+    ConversationSegment(
+        segment_id=2, topic="Learning to bake sourdough", tone="playful", conversation_direction="User asks for baking tips",
+        interaction_type="useful_interaction", start_line=4, end_line=7,
+        content="user: my sourdough keeps coming out flat\nagent: Sounds like an under-proofed loaf. How warm is your kitchen?\n"
+                "user: pretty cold, maybe 18 degrees\nagent: Try proofing in the oven with just the light on.",
+        engagement_score=7, engagement_justification="Concrete problem", enjoyment_score=7,
+        enjoyment_justification="Light banter", combined_score=14,
+    ),
+    ConversationSegment(
+        segment_id=3, topic="Weekend hiking plans", tone="excited", conversation_direction="User plans a trip",
+        interaction_type="personal_interaction", start_line=8, end_line=11,
+        content="user: thinking of hiking in the Lake District this weekend\nagent: Great choice! Which route?\n"
+                "user: Helvellyn via Striding Edge\nagent: Bold! Check the wind forecast before the ridge.",
+        engagement_score=7, engagement_justification="User shares plans", enjoyment_score=8,
+        enjoyment_justification="Excitement", combined_score=15,
+    ),
+]
+
+
+async def run_mode(mode, model, runs):
+    agent = make_agent_conversation_starter_generator(model_name=model, mode=mode)
+    latencies, input_tokens, tokens, requests, call_starters = [], [], [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = await agent.run(deps=StarterGeneratorDeps(top_segments=SAMPLE_SEGMENTS))
+        latencies.append(time.perf_counter() - start)
+        input_tokens.append(result.request_tokens)
+        tokens.append(result.response_tokens)
+        requests.append(result.requests)
+        call_starters.extend(result.call_starters)
+    print(f"{mode:>12}: median {statistics.median(latencies):6.2f}s  (min {min(latencies):.2f}s)  "
+          f"input tokens {statistics.mean(input_tokens):7.0f}  output tokens {statistics.mean(tokens):7.0f}  requests {statistics.mean(requests):4.1f}  "
+          f"starters {len(result.data)}  per call {sorted(set(call_starters))}")
+    # Each call is asked for STARTERS_PER_SEGMENT starters per segment it covers
+    expected = STARTERS_PER_SEGMENT * (1 if mode == PER_SEGMENT else len(SAMPLE_SEGMENTS))
+    if any(count != expected for count in call_starters):
+        print(f"{'':>12}  warning: expected {expected} starters per call, got {call_starters}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--model', default="gpt-4o")
+    args = parser.parse_args()
+
+    if not os.getenv('OPENAI_API_KEY'):
+        sys.exit("OPENAI_API_KEY is required")
+    for mode in (SINGLE_CALL, PER_SEGMENT):
+        asyncio.run(run_mode(mode, args.model, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Offline topic segmentation benchmark on a synthetic conversation with known topic shifts.
+
+Usage:
+    python benchmarks/bench_topic_segmenter.py [--messages 100000] [--topic-length 150]
+
+Reports wall time (including the one-off timestamp parse), boundary precision (detected
+boundaries within two messages of a topic shift) and recall (topic shifts with a detected
+boundary within two messages). A shift may pick the same topic again, so some shifts are
+undetectable; recall reaching the share of real topic changes is the ceiling.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from bisect import bisect_left
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from conversation_store import Conversation
+from topic_segmenter import segment_topics
+
+TOPICS = [
+    "weather rain cloudy forecast umbrella temperature sunny storm wind",
+    "football match goal team player coach league season score",
+    "cooking recipe pasta sauce garlic oven bake flour dinner",
+    "programming python code bug compiler function variable debug test",
+    "travel flight hotel airport luggage passport beach museum ticket",
+]
+FILLER = "the and is you to of it that in for so yes".split()
+
+
+def make_conversation(messages, topic_length, seed=0):
+    rng = random.Random(seed)
+    topics = [topic.split() for topic in TOPICS]
+    shifts = []
+    changes = 0
+    seconds = 0
+    rows = []
+    for i in range(messages):
+        if i % topic_length == 0:
+            previous, topic = (topic if i else None), rng.randrange(len(topics))
+            shifts.append(i)
+            changes += i > 0 and topic != previous
+        seconds += rng.randint(5, 90)
+        hours, minutes = divmod(seconds // 60, 60)
+        words = [rng.choice(topics[topic]) if rng.random() < 0.4 else rng.choice(FILLER) for _ in range(15)]
+        rows.append({
+            'timestamp': f"4/{18 + hours // 24}/2025, {(hours % 12) or 12}:{minutes:02d}:{seconds % 60:02d} {'AM' if hours % 24 < 12 else 'PM'}",
+            'speaker': 'Agent' if i % 2 else 'User',
+            'message': ' '.join(words).capitalize(),
+        })
+    return Conversation.from_messages(rows), shifts, changes
+
+
+def within(sorted_positions, position, tolerance=2):
+    i = bisect_left(sorted_positions, position)
+    return any(abs(position - sorted_positions[j]) <= tolerance for j in (i - 1, i) if 0 <= j < len(sorted_positions))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--messages', type=int, default=100000)
+    parser.add_argument('--topic-length', type=int, default=150, help="messages per synthetic topic")
+    parser.add_argument('--max-segments', type=int, default=None)
+    args = parser.parse_args()
+
+    conversation, shifts, changes = make_conversation(args.messages, args.topic_length)
+    start = time.perf_counter()
+    segments = segment_topics(conversation, max_segments=args.max_segments)
+    elapsed = time.perf_counter() - start
+
+    boundaries = [start_idx for start_idx, _ in segments[1:]]
+    near = sum(within(shifts, boundary) for boundary in boundaries)
+    found = sum(within(boundaries, shift) for shift in shifts[1:])
+    mode = f"max_segments={args.max_segments}" if args.max_segments else "default (no max_segments)"
+    print(f"{len(conversation):>8} msgs  {elapsed:6.3f}s  {len(conversation) / elapsed:>12,.0f} msgs/s  [{mode}]")
+    print(f"{len(segments):>8} segments")
+    print(f"  precision {near}/{len(boundaries)} = {near / max(1, len(boundaries)):.2f} boundaries within 2 msgs of a topic shift")
+    print(f"  recall    {found}/{len(shifts) - 1} = {found / max(1, len(shifts) - 1):.2f} topic shifts found "
+          f"({changes} of them change topic)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Map-reduce segmentation merge: merge_window_segments + absorb_unclaimed on a long
+conversation, with some windows failing, checking that the merged segments still
+cover every line exactly once.
+
+Usage:
+    python benchmarks/bench_window_merge.py [--lines 100000] [--segment-lines 30] [--fail middle]
+
+--fail picks which window returns no segments: none, first, middle, last or all.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from segmentation import absorb_unclaimed, merge_window_segments, plan_windows
+
+LINE_TOKENS = 25
+
+
+def window_segments(windows, segment_lines, failed):
+    """Fixed-length segments per window (local indices); failed windows contribute none."""
+    per_window = []
+    for k, (start, end) in enumerate(windows):
+        if k in failed:
+            per_window.append([])
+            continue
+        length = end - start
+        per_window.append([(first, min(first + segment_lines, length) - 1, (k, first))
+                           for first in range(0, length, segment_lines)])
+    return per_window
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', type=int, default=100000)
+    parser.add_argument('--segment-lines', type=int, default=30)
+    parser.add_argument('--fail', choices=['none', 'first', 'middle', 'last', 'all'], default='middle')
+    args = parser.parse_args()
+
+    windows = plan_windows([LINE_TOKENS] * args.lines)
+    failed = {
+        'none': set(),
+        'first': {0},
+        'middle': {len(windows) // 2},
+        'last': {len(windows) - 1},
+        'all': set(range(len(windows))),
+    }[args.fail]
+    segments = window_segments(windows, args.segment_lines, failed)
+
+    start = time.perf_counter()
+    merged = absorb_unclaimed(merge_window_segments(windows, segments, args.lines))
+    seconds = time.perf_counter() - start
+
+    if args.fail == 'all':
+        assert merged == []
+    else:
+        assert merged[0][0] == 0 and merged[-1][1] == args.lines - 1, "merged segments do not span the conversation"
+        assert all(a[1] + 1 == b[0] for a, b in zip(merged, merged[1:])), "merged segments leave a gap or overlap"
+        assert all(payload is not None for _, _, payload in merged)
+
+    print(f"{args.lines} lines, {len(windows)} windows, failed {sorted(failed) if len(failed) < 5 else len(failed)}")
+    coverage = "no window succeeded" if args.fail == 'all' else "covering every line"
+    print(f"  {len(merged)} merged segments {coverage}, {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+import os
+import re
+import json
+import shutil
+import threading
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from language_detector import STOPWORDS
+
+DOCUMENT_SUFFIXES = ('.md', '.markdown', '.txt')
+PASSAGE_WORDS = 150          # documents are indexed as passages of roughly this many words
+MAX_SEGMENTS = 8             # compact once incremental updates leave more segments than this
+MAX_DELETED_FRACTION = 0.3   # ...or once this share of indexed passages is tombstoned
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_STOPWORDS = frozenset().union(*STOPWORDS.values())
+_HEADING_PATTERN = re.compile(r"^\s{0,3}#{1,6}\s+(.+?)\s*#*\s*$", re.MULTILINE)
+
+# (title, url, text) for one indexed passage
+Passage = Tuple[str, str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_PATTERN.findall(text.casefold()) if token not in _STOPWORDS]
+
+
+def split_passages(path: Path, text: str) -> List[Passage]:
+    """Split a document into ~PASSAGE_WORDS-word passages on paragraph boundaries."""
+    heading = _HEADING_PATTERN.search(text)
+    title = heading.group(1) if heading else path.stem.replace('_', ' ').replace('-', ' ')
+    uri = path.resolve().as_uri()
+
+    passages, current, words = [], [], 0
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        current.append(paragraph)
+        words += len(paragraph.split())
+        if words >= PASSAGE_WORDS:
+            passages.append('\n\n'.join(current))
+            current, words = [], 0
+    if current:
+        passages.append('\n\n'.join(current))
+    return [(title, f"{uri}#passage-{i + 1}" if len(passages) > 1 else uri, passage)
+            for i, passage in enumerate(passages)]
+
+
+class _Segment:
+    """
+    One immutable batch of passages in CSR layout: term_offsets[t]:term_offsets[t + 1]
+    slices postings/term_freqs for term t. Arrays are memory-mapped; only the
+    vocabulary and passage titles/urls are held in memory. Deletions are tombstones
+    in deleted.npy, the one file rewritten in place; updates replace the in-memory
+    deleted array with a modified copy, so snapshots keep the tombstones they saw.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path / 'meta.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        self.vocab: Dict[str, int] = meta['vocab']
+        self.titles: List[str] = meta['titles']
+        self.urls: List[str] = meta['urls']
+        self.term_offsets = np.load(path / 'term_offsets.npy', mmap_mode='r')
+        self.postings = np.load(path / 'postings.npy', mmap_mode='r')
+        self.term_freqs = np.load(path / 'term_freqs.npy', mmap_mode='r')
+        self.doc_lengths = np.load(path / 'doc_lengths.npy', mmap_mode='r')
+        self.text_offsets = np.load(path / 'text_offsets.npy', mmap_mode='r')
+        self.text = np.memmap(path / 'text.bin', dtype=np.uint8, mode='r') if self.text_offsets[-1] else np.zeros(0, np.uint8)
+        self.deleted = np.load(path / 'deleted.npy')
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.doc_lengths)
+
+    def passage_text(self, doc: int) -> str:
+        return bytes(self.text[self.text_offsets[doc]:self.text_offsets[doc + 1]]).decode('utf-8')
+
+    def postings_for(self, term: str, deleted: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        term_id = self.vocab.get(term)
+        if term_id is None:
+            return np.zeros(0, np.int32), np.zeros(0, np.float32)
+        start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+        docs = np.asarray(self.postings[start:end])
+        live = ~deleted[docs]
+        return docs[live], np.asarray(self.term_freqs[start:end])[live]
+
+    def live_passages(self) -> Iterable[Passage]:
+        for doc in np.flatnonzero(~self.deleted).tolist():
+            yield self.titles[doc], self.urls[doc], self.passage_text(doc)
+
+    def save_deleted(self):
+        tmp = self.path / 'deleted.tmp.npy'
+        np.save(tmp, self.deleted)
+        os.replace(tmp, self.path / 'deleted.npy')
+
+    @staticmethod
+    def write(path: Path, passages: List[Passage]):
+        """Build a segment directory from passages."""
+        vocab: Dict[str, int] = {}
+        term_ids, docs, term_freqs = array('q'), array('q'), array('q')
+        doc_lengths = np.zeros(len(passages), dtype=np.int32)
+        for doc, (title, _, text) in enumerate(passages):
+            tokens = tokenize(title + "\n" + text)
+            counts = Counter(tokens)
+            doc_lengths[doc] = len(tokens)
+            term_ids.extend([vocab.setdefault(term, len(vocab)) for term in counts])
+            term_freqs.extend(counts.values())
+            docs.extend([doc] * len(counts))
+
+        term_ids = np.frombuffer(term_ids, dtype=np.int64)
+        order = np.argsort(term_ids, kind='stable')  # docs stay ascending within each term
+        term_offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=len(vocab)), out=term_offsets[1:])
+
+        encoded = [text.encode('utf-8') for _, _, text in passages]
+        text_offsets = np.zeros(len(passages) + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in encoded], out=text_offsets[1:])
+
+        path.mkdir(parents=True)
+        np.save(path / 'term_offsets.npy', term_offsets)
+        np.save(path / 'postings.npy', np.frombuffer(docs, dtype=np.int64)[order].astype(np.int32))
+        np.save(path / 'term_freqs.npy', np.frombuffer(term_freqs, dtype=np.int64)[order].astype(np.float32))
+        np.save(path / 'doc_lengths.npy', doc_lengths)
+        np.save(path / 'text_offsets.npy', text_offsets)
+        np.save(path / 'deleted.npy', np.zeros(len(passages), dtype=bool))
+        with open(path / 'text.bin', 'wb') as f:
+            for chunk in encoded:
+                f.write(chunk)
+        with open(path / 'meta.json', 'w', encoding='utf-8') as f:
+            json.dump({'vocab': vocab, 'titles': [p[0] for p in passages], 'urls': [p[1] for p in passages]},
+                      f, ensure_ascii=False)
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a directory of markdown/text documents, persisted as
+    memory-mapped segments under index_dir.
+
+    update() is incremental: new and modified files go into a fresh segment and
+    the passages of modified or removed files are tombstoned, so unchanged files
+    are never re-read. Segments are compacted once there are too many of them or
+    too many tombstones. Searches run against a consistent snapshot and can
+    proceed while an update is being written.
+    """
+
+    def __init__(self, index_dir: str, k1: float = 1.5, b: float = 0.75):
+        self.index_dir = Path(index_dir)
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._manifest = {'next_segment': 0, 'segments': [], 'files': {}}
+        self._segments: Dict[str, _Segment] = {}
+        self._snapshot: Tuple[int, List[Tuple[_Segment, np.ndarray, np.ndarray]]] = (0, [])
+        self._load()
+
+    def _load(self):
+        manifest_path = self.index_dir / 'manifest.json'
+        if not manifest_path.exists():
+            return
+        with open(manifest_path, encoding='utf-8') as f:
+            self._manifest = json.load(f)
+        self._segments = {name: _Segment(self.index_dir / name) for name in self._manifest['segments']}
+        self._refresh_snapshot()
+
+    def _refresh_snapshot(self):
+        # Searches read one immutable (live passage count, [(segment, length norms, tombstones)])
+        # tuple, swapped in after each update
+        segments = list(self._segments.values())
+        live = [segment.doc_lengths[~segment.deleted] for segment in segments]
+        n_docs = sum(len(lengths) for lengths in live)
+        avg_length = max(1.0, sum(float(lengths.sum()) for lengths in live) / n_docs) if n_docs else 1.0
+        self._snapshot = (n_docs, [
+            (segment, self.k1 * (1 - self.b + self.b * np.asarray(segment.doc_lengths, dtype=np.float32) / avg_length),
+             segment.deleted)
+            for segment in segments
+        ])
+
+    def _save_manifest(self):
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_dir / 'manifest.tmp.json'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest, f, ensure_ascii=False)
+        os.replace(tmp, self.index_dir / 'manifest.json')
+
+    def _new_segment_name(self) -> str:
+        name = f"seg_{self._manifest['next_segment']:06d}"
+        self._manifest['next_segment'] += 1
+        return name
+
+    def __len__(self) -> int:
+        return self._snapshot[0]
+
+    def update(self, corpus_dir: str) -> Dict[str, int]:
+        """Bring the index in line with corpus_dir. Returns counts of added, updated and removed files."""
+        corpus = Path(corpus_dir)
+        with self._lock:
+            seen = {}
+            for path in sorted(corpus.rglob('*')):
+                if path.is_file() and path.suffix.lower() in DOCUMENT_SUFFIXES:
+                    stat = path.stat()
+                    seen[str(path.relative_to(corpus))] = [stat.st_mtime_ns, stat.st_size]
+
+            files = self._manifest['files']
+            changed = [name for name, signature in seen.items() if files.get(name, {}).get('signature') != signature]
+            removed = [name for name in files if name not in seen]
+            added = sum(1 for name in changed if name not in files)
+            if not changed and not removed:
+                return {'added': 0, 'updated': 0, 'removed': 0}
+
+            # Tombstone passages of modified and removed files, copying each segment's tombstones
+            # first: the current snapshot keeps the old array until _refresh_snapshot swaps it out
+            touched = set()
+            for name in changed + removed:
+                entry = files.pop(name, None)
+                if entry and entry.get('segment'):
+                    segment = self._segments[entry['segment']]
+                    if entry['segment'] not in touched:
+                        segment.deleted = segment.deleted.copy()
+                        touched.add(entry['segment'])
+                    segment.deleted[entry['start']:entry['end']] = True
+            for segment_name in touched:
+                self._segments[segment_name].save_deleted()
+
+            passages: List[Passage] = []
+            for name in changed:
+                path = corpus / name
+                try:
+                    text = path.read_text(encoding='utf-8', errors='replace')
+                except OSError:
+                    continue
+                start = len(passages)
+                passages.extend(split_passages(path, text))
+                files[name] = {'signature': seen[name], 'segment': None, 'start': start, 'end': len(passages)}
+
+            if passages:
+                segment_name = self._new_segment_name()
+                _Segment.write(self.index_dir / segment_name, passages)
+                self._segments[segment_name] = _Segment(self.index_dir / segment_name)
+                self._manifest['segments'].append(segment_name)
+                for name in changed:
+                    if name in files and files[name]['end'] > files[name]['start']:
+                        files[name]['segment'] = segment_name
+
+            self._drop_empty_segments()
+            self._save_manifest()
+            if self._needs_compaction():
+                self._compact()
+            self._refresh_snapshot()
+            return {'added': added, 'updated': len(changed) - added, 'removed': len(removed)}
+
+    def _drop_empty_segments(self):
+        for name in list(self._manifest['segments']):
+            if self._segments[name].deleted.all():
+                self._manifest['segments'].remove(name)
+                self._segments.pop(name)
+                shutil.rmtree(self.index_dir / name, ignore_errors=True)
+
+    def _needs_compaction(self) -> bool:
+        total = sum(segment.n_docs for segment in self._segments.values())
+        deleted = sum(int(segment.deleted.sum()) for segment in self._segments.values())
+        return len(self._segments) > MAX_SEGMENTS or (total and deleted / total > MAX_DELETED_FRACTION)
+
+    def _compact(self):
+        """Rewrite all live passages into a single segment."""
+        passages: List[Passage] = []
+        files = self._manifest['files']
+        for segment_name in self._manifest['segments']:
+            segment = self._segments[segment_name]
+            live = np.flatnonzero(~segment.deleted)
+            remap = np.full(segment.n_docs + 1, -1, dtype=np.int64)
+            remap[live] = np.arange(len(passages), len(passages) + len(live))
+            for entry in files.values():
+                if entry['segment'] == segment_name:
+                    start = int(remap[entry['start']])
+                    entry['start'], entry['end'] = start, start + entry['end'] - entry['start']
+                    entry['segment'] = 'compacted'
+            passages.extend(segment.live_passages())
+
+        old_segments = list(self._manifest['segments'])
+        segment_name = self._new_segment_name()
+        _Segment.write(self.index_dir / segment_name, passages)
+        for entry in files.values():
+            if entry['segment'] == 'compacted':
+                entry['segment'] = segment_name
+        self._segments = {segment_name: _Segment(self.index_dir / segment_name)}
+        self._manifest['segments'] = [segment_name]
+        self._save_manifest()
+        for name in old_segments:
+            shutil.rmtree(self.index_dir / name, ignore_errors=True)
+
+    def search(self, query: str, limit: int = 3) -> List[Dict]:
+        """Top passages for query as {'title', 'url', 'markdown', 'score'} dicts, best first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        n_docs, segments = self._snapshot
+        if not terms or not n_docs:
+            return []
+
+        postings = {term: [segment.postings_for(term, deleted) for segment, _, deleted in segments] for term in terms}
+        candidates = []
+        for i, (segment, norm, _) in enumerate(segments):
+            scores = np.zeros(segment.n_docs, dtype=np.float32)
+            for term in terms:
+                df = sum(len(docs) for docs, _ in postings[term])
+                if not df:
+                    continue
+                idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                docs, tfs = postings[term][i]
+                scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norm[docs])
+            hits = np.flatnonzero(scores)
+            if len(hits) > limit:
+                hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+            candidates.extend((float(scores[doc]), i, int(doc)) for doc in hits)
+
+        results = []
+        for score, i, doc in sorted(candidates, reverse=True)[:limit]:
+            segment = segments[i][0]
+            results.append({'title': segment.titles[doc], 'url': segment.urls[doc],
+                            'markdown': segment.passage_text(doc), 'score': score})
+        return results
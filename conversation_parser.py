@@ -0,0 +1,99 @@
+import re
+import codecs
+from typing import List, Dict, Iterator, Optional, Union, IO
+
+# Compiled once at import: [timestamp] Speaker: message
+MESSAGE_PATTERN = re.compile(r'\[(.*?)\]\s*([^:]+):\s*(.*)')
+
+# Default read size for streaming parses (1 MiB)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+ConversationSource = Union[str, bytes, bytearray, IO]
+
+
+class ConversationParser:
+    """Parse conversation logs from text files."""
+
+    @staticmethod
+    def parse_line(line: str) -> Optional[Dict]:
+        """Parse a single log line. Returns None for blank, '...' or malformed lines."""
+        line = line.strip()
+        if not line or line == "...":
+            return None
+
+        match = MESSAGE_PATTERN.match(line)
+        if not match:
+            return None
+
+        timestamp, speaker, message = match.groups()
+        return {
+            'timestamp': timestamp.strip(),
+            'speaker': speaker.strip(),
+            'message': message.strip()
+        }
+
+    @staticmethod
+    def parse_conversation(text: str) -> List[Dict]:
+        """
+        Parse conversation text into structured format.
+        Expected format: [timestamp] Speaker: message
+        """
+        return list(ConversationParser.iter_conversation(text))
+
+    @staticmethod
+    def iter_lines(source: ConversationSource, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   encoding: str = 'utf-8') -> Iterator[str]:
+        """
+        Yield raw lines from a string, a bytes buffer or a (text or binary) file object.
+        File objects are read in chunk_size pieces, so only one chunk plus the
+        trailing partial line is held in memory at a time. Bytes that are not valid
+        in encoding raise UnicodeDecodeError, as decoding the whole upload did.
+        """
+        if isinstance(source, str):
+            # Already decoded in memory: walk line boundaries without building a list
+            start = 0
+            while True:
+                end = source.find('\n', start)
+                if end == -1:
+                    if start < len(source):
+                        yield source[start:]
+                    return
+                yield source[start:end]
+                start = end + 1
+
+        if isinstance(source, (bytes, bytearray)):
+            yield from ConversationParser.iter_lines(memoryview(source), chunk_size, encoding)
+            return
+
+        if isinstance(source, memoryview):
+            read_chunks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+        else:
+            read_chunks = iter(lambda: source.read(chunk_size), source.read(0))
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+        pending = ''
+        for chunk in read_chunks:
+            if not isinstance(chunk, str):
+                chunk = decoder.decode(chunk)
+            if not chunk:
+                continue
+            lines = (pending + chunk).split('\n')
+            pending = lines.pop()
+            yield from lines
+
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            yield pending
+
+    @staticmethod
+    def iter_conversation(source: ConversationSource, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          encoding: str = 'utf-8') -> Iterator[Dict]:
+        """
+        Lazily parse messages from text, bytes or a file object.
+        Yields the same {'timestamp', 'speaker', 'message'} dicts as parse_conversation.
+        """
+        parse_line = ConversationParser.parse_line
+        for line in ConversationParser.iter_lines(source, chunk_size, encoding):
+            message = parse_line(line)
+            if message is not None:
+                yield message
@@ -0,0 +1,275 @@
+import io
+import re
+import sys
+import math
+import calendar
+from array import array
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from conversation_parser import ConversationParser, ConversationSource, DEFAULT_CHUNK_SIZE
+
+# Export format: "4/18/2025, 12:29:52 AM" (seconds and AM/PM optional)
+_TIMESTAMP_PATTERN = re.compile(
+    r'(\d{1,2})/(\d{1,2})/(\d{4}),?\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([AaPp][Mm])?$'
+)
+
+
+# Midnight epoch per "M/D/YYYY" date string seen by the regex path; chat exports
+# repeat the same few dates for thousands of messages
+_date_starts: Dict[str, float] = {}
+_MAX_CACHED_DATES = 4096
+
+
+def parse_timestamp(timestamp: str) -> float:
+    """Parse an export timestamp to epoch seconds (naive times treated as UTC). NaN if unparseable."""
+    # Fast path for the canonical export form; anything unusual goes through the regex
+    date, _, clock = timestamp.partition(', ')
+    clock, _, meridiem = clock.partition(' ')
+    clock_parts = clock.split(':')
+    if (date in _date_starts and 2 <= len(clock_parts) <= 3 and meridiem in ('AM', 'PM', '')
+            and all(part.isdecimal() and len(part) == 2 for part in clock_parts[1:])
+            and clock_parts[0].isdecimal() and len(clock_parts[0]) <= 2):
+        hour = int(clock_parts[0])
+        if meridiem:
+            hour = hour % 12 + (12 if meridiem == 'PM' else 0)
+        seconds = int(clock_parts[2]) if len(clock_parts) == 3 else 0
+        return _date_starts[date] + hour * 3600 + int(clock_parts[1]) * 60 + seconds
+
+    match = _TIMESTAMP_PATTERN.match(timestamp)
+    if match:
+        month, day, year, hour, minute, second, meridiem = match.groups()
+        hour = int(hour)
+        if meridiem:
+            hour = hour % 12 + (12 if meridiem.lower() == 'pm' else 0)
+        try:
+            day_start = float(calendar.timegm((int(year), int(month), int(day), 0, 0, 0)))
+        except (ValueError, OverflowError):
+            return math.nan
+        if len(_date_starts) < _MAX_CACHED_DATES:
+            _date_starts[f"{month}/{day}/{year}"] = day_start
+        return day_start + hour * 3600 + int(minute) * 60 + int(second or 0)
+
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return math.nan
+    if parsed.tzinfo is None:
+        return float(calendar.timegm(parsed.timetuple()))
+    return parsed.timestamp()
+
+
+class _Columns:
+    """Shared storage behind a Conversation and all of its slices."""
+
+    __slots__ = ('buffer', 'offsets', 'ts_buffer', 'ts_offsets', 'speaker_ids', 'speakers', '_epochs')
+
+    def __init__(self, buffer: str, offsets: array, ts_buffer: str, ts_offsets: array,
+                 speaker_ids: array, speakers: Tuple[str, ...]):
+        # Messages and timestamps are each stored '\n'-terminated in one string;
+        # offsets[i] is the start of row i and offsets[i + 1] - 1 its end.
+        self.buffer = buffer
+        self.offsets = offsets
+        self.ts_buffer = ts_buffer
+        self.ts_offsets = ts_offsets
+        self.speaker_ids = speaker_ids
+        self.speakers = speakers
+        self._epochs = None
+
+    @property
+    def epochs(self) -> array:
+        """Parsed timestamps as epoch seconds, computed once on first access."""
+        if self._epochs is None:
+            ts_buffer, ts_offsets = self.ts_buffer, self.ts_offsets
+            self._epochs = array('d', (
+                parse_timestamp(ts_buffer[ts_offsets[i]:ts_offsets[i + 1] - 1])
+                for i in range(len(ts_offsets) - 1)
+            ))
+        return self._epochs
+
+    def __getstate__(self):
+        return (self.buffer, self.offsets, self.ts_buffer, self.ts_offsets, self.speaker_ids, self.speakers)
+
+    def __setstate__(self, state):
+        self.buffer, self.offsets, self.ts_buffer, self.ts_offsets, self.speaker_ids, self.speakers = state
+        self._epochs = None
+
+
+class ConversationBuilder:
+    """Append messages one at a time and freeze them into a Conversation."""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._offsets = array('q', [0])
+        self._ts_buffer = io.StringIO()
+        self._ts_offsets = array('q', [0])
+        self._speaker_ids = array('l')
+        self._speaker_index: Dict[str, int] = {}
+
+    def append(self, timestamp: str, speaker: str, message: str):
+        speaker_id = self._speaker_index.get(speaker)
+        if speaker_id is None:
+            speaker_id = self._speaker_index[speaker] = len(self._speaker_index)
+        self._speaker_ids.append(speaker_id)
+
+        self._offsets.append(self._offsets[-1] + self._buffer.write(message) + self._buffer.write('\n'))
+        self._ts_offsets.append(self._ts_offsets[-1] + self._ts_buffer.write(timestamp) + self._ts_buffer.write('\n'))
+
+    def build(self) -> 'Conversation':
+        speakers = tuple(sorted(self._speaker_index, key=self._speaker_index.get))
+        columns = _Columns(self._buffer.getvalue(), self._offsets, self._ts_buffer.getvalue(),
+                           self._ts_offsets, self._speaker_ids, speakers)
+        return Conversation(columns, 0, len(self._speaker_ids))
+
+
+class Conversation:
+    """
+    Compact, array-backed conversation.
+
+    Message and timestamp text live in two contiguous buffers indexed by offset
+    arrays, speakers are interned to integer ids, and timestamps are parsed lazily.
+    Slicing by message range returns a view over the same storage (no copying).
+    Iterating or indexing yields the {'timestamp', 'speaker', 'message'} dicts
+    that the rest of the app consumes, so it can stand in for a List[Dict].
+    """
+
+    __slots__ = ('_columns', '_start', '_stop')
+
+    def __init__(self, columns: _Columns, start: int, stop: int):
+        self._columns = columns
+        self._start = start
+        self._stop = stop
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[Dict]) -> 'Conversation':
+        """Build from an iterable of {'timestamp', 'speaker', 'message'} dicts."""
+        builder = ConversationBuilder()
+        for msg in messages:
+            builder.append(msg.get('timestamp', ''), msg.get('speaker', ''), msg.get('message', ''))
+        return builder.build()
+
+    @classmethod
+    def from_source(cls, source: ConversationSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> 'Conversation':
+        """Stream-parse text, bytes or a file object straight into columnar storage."""
+        return cls.from_messages(ConversationParser.iter_conversation(source, chunk_size=chunk_size))
+
+    # Sequence protocol
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self._start, self._stop):
+            yield self._row(i)
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self._row(self._start + i) for i in range(start, stop, step)]
+            return Conversation(self._columns, self._start + start, self._start + max(start, stop))
+
+        index = key + len(self) if key < 0 else key
+        if not 0 <= index < len(self):
+            raise IndexError("conversation index out of range")
+        return self._row(self._start + index)
+
+    def __repr__(self) -> str:
+        return f"Conversation({len(self)} messages, {len(self.speakers)} speakers)"
+
+    # Column access (indices are relative to this view)
+
+    def message(self, index: int) -> str:
+        offsets = self._columns.offsets
+        i = self._start + index
+        return self._columns.buffer[offsets[i]:offsets[i + 1] - 1]
+
+    def timestamp(self, index: int) -> str:
+        ts_offsets = self._columns.ts_offsets
+        i = self._start + index
+        return self._columns.ts_buffer[ts_offsets[i]:ts_offsets[i + 1] - 1]
+
+    def speaker(self, index: int) -> str:
+        return self._columns.speakers[self._columns.speaker_ids[self._start + index]]
+
+    @property
+    def speakers(self) -> Tuple[str, ...]:
+        """Interned speaker names; speaker_ids index into this tuple."""
+        return self._columns.speakers
+
+    @property
+    def speaker_ids(self) -> memoryview:
+        return memoryview(self._columns.speaker_ids)[self._start:self._stop]
+
+    @property
+    def epochs(self) -> memoryview:
+        """Message timestamps as epoch seconds (NaN where unparseable)."""
+        return memoryview(self._columns.epochs)[self._start:self._stop]
+
+    @property
+    def message_offsets(self) -> memoryview:
+        """
+        Buffer offset of each message start plus one past the last message's end.
+        Subtract the first entry to get positions within .text.
+        """
+        return memoryview(self._columns.offsets)[self._start:self._stop + 1]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the underlying storage (shared with all slices)."""
+        columns = self._columns
+        arrays = (columns.offsets, columns.ts_offsets, columns.speaker_ids)
+        return (sys.getsizeof(columns.buffer) + sys.getsizeof(columns.ts_buffer)
+                + sum(len(values) * values.itemsize for values in arrays))
+
+    @property
+    def text(self) -> str:
+        """All message text in this range, newline-separated, as one buffer slice."""
+        if not len(self):
+            return ""
+        offsets = self._columns.offsets
+        return self._columns.buffer[offsets[self._start]:offsets[self._stop] - 1]
+
+    def render(self, template: str = "{speaker}: {message}", sep: str = "\n",
+               speaker_map: Optional[Callable[[str], str]] = None) -> str:
+        """
+        Render each message with template (fields: timestamp, speaker, message) and join with sep.
+        speaker_map is applied once per distinct speaker rather than once per message.
+        """
+        columns = self._columns
+        labels: Sequence[str] = [speaker_map(s) for s in columns.speakers] if speaker_map else columns.speakers
+        buffer, offsets, speaker_ids = columns.buffer, columns.offsets, columns.speaker_ids
+        ts_buffer, ts_offsets = columns.ts_buffer, columns.ts_offsets
+        format_row = template.format
+        with_timestamp = '{timestamp}' in template
+
+        return sep.join(
+            format_row(
+                timestamp=ts_buffer[ts_offsets[i]:ts_offsets[i + 1] - 1] if with_timestamp else '',
+                speaker=labels[speaker_ids[i]],
+                message=buffer[offsets[i]:offsets[i + 1] - 1],
+            )
+            for i in range(self._start, self._stop)
+        )
+
+    def to_dicts(self) -> List[Dict]:
+        return list(self)
+
+    def _row(self, i: int) -> Dict:
+        columns = self._columns
+        offsets, ts_offsets = columns.offsets, columns.ts_offsets
+        return {
+            'timestamp': columns.ts_buffer[ts_offsets[i]:ts_offsets[i + 1] - 1],
+            'speaker': columns.speakers[columns.speaker_ids[i]],
+            'message': columns.buffer[offsets[i]:offsets[i + 1] - 1],
+        }
+
+
+ConversationLike = Union[Conversation, List[Dict]]
+
+
+def as_conversation(conversation: Union[Conversation, Iterable[Dict]]) -> Conversation:
+    """Return conversation unchanged if already columnar, else pack a List[Dict] into a Conversation."""
+    if isinstance(conversation, Conversation):
+        return conversation
+    return Conversation.from_messages(conversation or [])
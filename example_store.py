@@ -0,0 +1,139 @@
+import os
+import json
+import math
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+from bm25_index import tokenize
+from segmentation import estimate_tokens
+
+DEFAULT_EXAMPLES_PATH = os.getenv(
+    'STARTER_EXAMPLES_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'agents', 'starter_examples.json')
+)
+DEFAULT_EXAMPLE_COUNT = int(os.getenv('STARTER_EXAMPLE_COUNT', 2))
+DEFAULT_EXAMPLE_TOKENS = int(os.getenv('STARTER_EXAMPLE_TOKENS', 2000))
+
+# Example conversations are indexed and quoted in excerpts of this many lines
+EXCERPT_LINES = 12
+
+
+def _tfidf(tokens: List[str], idf: Dict[str, float]) -> Dict[str, float]:
+    """L2-normalized TF-IDF vector with sublinear term frequency; unknown terms are dropped."""
+    vector = {term: (1 + math.log(count)) * idf[term] for term, count in Counter(tokens).items() if term in idf}
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+
+def _cosine(query: Dict[str, float], vector: Dict[str, float]) -> float:
+    if len(vector) < len(query):
+        query, vector = vector, query
+    return sum(weight * vector.get(term, 0.0) for term, weight in query.items())
+
+
+class ExampleStore:
+    """
+    Few-shot examples for the starter generator: example conversations with good and
+    bad starters written for them. A TF-IDF index over conversation excerpts and the
+    starter lists selects the examples closest to the current segments, so only those
+    are sent to the model instead of the whole collection.
+    """
+
+    def __init__(self, examples: List[Dict], excerpt_lines: int = EXCERPT_LINES):
+        self.examples = examples
+        self.excerpts = []  # (example index, first line, end line)
+        documents = []
+        for i, example in enumerate(examples):
+            lines = example['conversation']
+            for first in range(0, len(lines), excerpt_lines):
+                end = min(first + excerpt_lines, len(lines))
+                self.excerpts.append((i, first, end))
+                documents.append(tokenize('\n'.join(lines[first:end])))
+        lesson_documents = [tokenize(example['good'] + '\n' + example['bad']) for example in examples]
+
+        document_frequency = Counter()
+        for tokens in documents + lesson_documents:
+            document_frequency.update(set(tokens))
+        n_documents = len(documents) + len(lesson_documents)
+        self._idf = {term: math.log((1 + n_documents) / (1 + df)) + 1 for term, df in document_frequency.items()}
+        self._excerpt_vectors = [_tfidf(tokens, self._idf) for tokens in documents]
+        self._lesson_vectors = [_tfidf(tokens, self._idf) for tokens in lesson_documents]
+        self._excerpt_tokens = [
+            estimate_tokens('\n'.join(examples[i]['conversation'][first:end])) for i, first, end in self.excerpts
+        ]
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_EXAMPLES_PATH) -> 'ExampleStore':
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f)['examples'])
+
+    def _render_lessons(self, index: int, number: int) -> str:
+        example = self.examples[index]
+        return (f"<GOOD_EXAMPLES_{number}>\n{example['good']}\n</GOOD_EXAMPLES_{number}>\n\n"
+                f"<BAD_EXAMPLES_{number}>\n{example['bad']}\n</BAD_EXAMPLES_{number}>\n")
+
+    def _render_conversation(self, index: int, number: int, excerpts: List[int]) -> str:
+        lines = self.examples[index]['conversation']
+        parts, previous_end = [], 0
+        for excerpt in sorted(excerpts, key=lambda j: self.excerpts[j][1]):
+            _, first, end = self.excerpts[excerpt]
+            if first > previous_end:
+                parts.append("...")
+            parts.extend(lines[first:end])
+            previous_end = end
+        if previous_end < len(lines):
+            parts.append("...")
+        body = '\n'.join(parts)
+        return f"<EXAMPLE_CONVERSATION_{number}>\n{body}\n</EXAMPLE_CONVERSATION_{number}>\n"
+
+    def retrieve(self, query: str, k: int = DEFAULT_EXAMPLE_COUNT, token_budget: int = DEFAULT_EXAMPLE_TOKENS) -> str:
+        """
+        Render the k examples most similar to query within roughly token_budget tokens.
+        Each example's good and bad starters are included first, then its best-matching
+        conversation excerpts while budget remains. The top example is always included.
+        """
+        if not self.examples:
+            return ""
+        query_vector = _tfidf(tokenize(query), self._idf)
+        excerpt_scores = [_cosine(query_vector, vector) for vector in self._excerpt_vectors]
+        example_scores = [_cosine(query_vector, vector) for vector in self._lesson_vectors]
+        for (i, _, _), score in zip(self.excerpts, excerpt_scores):
+            example_scores[i] = max(example_scores[i], score)
+        ranked = sorted(range(len(self.examples)), key=lambda i: (-example_scores[i], i))[:k]
+
+        budget = token_budget
+        chosen: Dict[int, List[int]] = {}
+        for number, i in enumerate(ranked, 1):
+            cost = estimate_tokens(self._render_lessons(i, number))
+            if chosen and cost > budget:
+                continue
+            chosen[i] = []
+            budget -= cost
+
+        candidates = sorted((j for j, (i, _, _) in enumerate(self.excerpts) if i in chosen),
+                            key=lambda j: (-excerpt_scores[j], j))
+        for j in candidates:
+            if self._excerpt_tokens[j] <= budget:
+                chosen[self.excerpts[j][0]].append(j)
+                budget -= self._excerpt_tokens[j]
+
+        blocks = []
+        for number, (i, excerpts) in enumerate(chosen.items(), 1):
+            if excerpts:
+                blocks.append(self._render_conversation(i, number, excerpts))
+            blocks.append(self._render_lessons(i, number))
+        return '\n'.join(blocks)
+
+
+_example_store_lock = threading.Lock()
+_example_store: Optional[ExampleStore] = None
+
+
+def get_example_store() -> ExampleStore:
+    """Process-wide example store loaded from STARTER_EXAMPLES_PATH."""
+    global _example_store
+    with _example_store_lock:
+        if _example_store is None:
+            _example_store = ExampleStore.load()
+        return _example_store
@@ -0,0 +1,196 @@
+import os
+import gzip
+import json
+import time
+import atexit
+import shutil
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, List
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+DEFAULT_BATCH_SIZE = int(os.getenv('INTERACTION_LOG_BATCH_SIZE', 256))
+DEFAULT_FLUSH_SECONDS = float(os.getenv('INTERACTION_LOG_FLUSH_SECONDS', 1.0))
+DEFAULT_FSYNC = os.getenv('INTERACTION_LOG_FSYNC', 'interval')
+DEFAULT_FSYNC_SECONDS = float(os.getenv('INTERACTION_LOG_FSYNC_SECONDS', 5.0))
+DEFAULT_MAX_BYTES = int(float(os.getenv('INTERACTION_LOG_MAX_MB', 50)) * 1024 * 1024)
+DEFAULT_BACKUPS = int(os.getenv('INTERACTION_LOG_BACKUPS', 10))
+
+# fsync policies: leave it to the OS, fsync at most every fsync_seconds, or after every batch
+FSYNC_NEVER = 'never'
+FSYNC_INTERVAL = 'interval'
+FSYNC_BATCH = 'batch'
+
+# Callers write batches themselves once this many events are waiting
+MAX_PENDING = 50000
+
+
+class InteractionLogger:
+    """
+    Append JSON-lines events through a background writer. Events are queued in memory
+    and written in batches once batch_size are waiting or flush_seconds have passed,
+    under an exclusive file lock so several Streamlit processes can share one log.
+    Files beyond max_bytes are rotated and gzip-compressed, keeping `backups` of them.
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE, flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+                 fsync: str = DEFAULT_FSYNC, fsync_seconds: float = DEFAULT_FSYNC_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES, backups: int = DEFAULT_BACKUPS):
+        if fsync not in (FSYNC_NEVER, FSYNC_INTERVAL, FSYNC_BATCH):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.fsync = fsync
+        self.fsync_seconds = fsync_seconds
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._pending: deque = deque()
+        self._condition = threading.Condition()
+        # Serializes batch writes between the writer thread and explicit flush() calls
+        self._write_lock = threading.Lock()
+        self._last_fsync = time.monotonic()
+        self._closed = False
+        self._stats = {'events': 0, 'batches': 0, 'bytes': 0, 'fsyncs': 0, 'rotations': 0}
+        self._thread = threading.Thread(target=self._serve, name="interaction-log", daemon=True)
+        self._thread.start()
+
+    def log(self, event: Dict):
+        """Queue one event; it is serialized now, so later changes to event are not logged."""
+        line = json.dumps(event) + '\n'
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("InteractionLogger is closed")
+            self._pending.append(line)
+            backlog = len(self._pending)
+            if backlog >= self.batch_size:
+                self._condition.notify()
+        # Back-pressure: the writer cannot keep up, so this caller writes a batch too
+        if backlog >= MAX_PENDING:
+            self.flush()
+
+    def _take(self) -> List[str]:
+        with self._condition:
+            lines = list(self._pending)
+            self._pending.clear()
+            return lines
+
+    def _serve(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or len(self._pending) >= self.batch_size,
+                                         timeout=self.flush_seconds)
+                closed = self._closed
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"Warning: could not write interaction log {self.path}: {e}")
+            if closed:
+                return
+
+    def flush(self):
+        """Write all queued events now."""
+        with self._write_lock:
+            lines = self._take()
+            if not lines:
+                return
+            try:
+                self._write_batch(''.join(lines).encode('utf-8'), len(lines))
+            except OSError:
+                # Keep the events for the next attempt
+                with self._condition:
+                    self._pending.extendleft(reversed(lines))
+                raise
+
+    def _open_locked(self):
+        """Open the log for appending under an exclusive lock, reopening if another process rotated it meanwhile."""
+        while True:
+            f = open(self.path, 'ab')
+            if fcntl is None:
+                return f
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                if os.stat(self.path).st_ino == os.fstat(f.fileno()).st_ino:
+                    return f
+            except FileNotFoundError:
+                pass
+            f.close()
+
+    def _write_batch(self, data: bytes, events: int):
+        rotated = None
+        with self._open_locked() as f:
+            f.write(data)
+            f.flush()
+            now = time.monotonic()
+            if self.fsync == FSYNC_BATCH or (self.fsync == FSYNC_INTERVAL and now - self._last_fsync >= self.fsync_seconds):
+                os.fsync(f.fileno())
+                self._last_fsync = now
+                self._stats['fsyncs'] += 1
+            if self.max_bytes and f.tell() >= self.max_bytes:
+                # Rename while holding the lock; other writers notice the new inode and reopen
+                rotated = f"{self.path}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+                os.replace(self.path, rotated)
+                self._stats['rotations'] += 1
+        self._stats['events'] += events
+        self._stats['batches'] += 1
+        self._stats['bytes'] += len(data)
+        if rotated is not None:
+            try:
+                self._compress(rotated)
+            except OSError as e:
+                # The events are written; only the archive is affected
+                print(f"Warning: could not compress rotated interaction log {rotated}: {e}")
+
+    def _compress(self, rotated: str):
+        with open(rotated, 'rb') as src, gzip.open(f"{rotated}.gz", 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(rotated)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        prefix = os.path.basename(self.path) + '.'
+        archives = sorted(name for name in os.listdir(directory) if name.startswith(prefix) and name.endswith('.gz'))
+        for name in archives[:max(0, len(archives) - self.backups)]:
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass  # Pruned by another process
+
+    def close(self):
+        """Write what is queued and stop the writer."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def stats(self) -> Dict:
+        with self._condition:
+            pending = len(self._pending)
+        return {**self._stats, 'pending': pending}
+
+
+_loggers_lock = threading.Lock()
+_loggers: Dict[str, InteractionLogger] = {}
+
+
+def get_interaction_logger(path: str) -> InteractionLogger:
+    """Process-wide logger for path, configured from the INTERACTION_LOG_* variables."""
+    key = os.path.abspath(path)
+    with _loggers_lock:
+        logger = _loggers.get(key)
+        if logger is None:
+            logger = _loggers[key] = InteractionLogger(path)
+        return logger
+
+
+@atexit.register
+def _close_loggers():
+    with _loggers_lock:
+        loggers = list(_loggers.values())
+    for logger in loggers:
+        logger.close()
@@ -0,0 +1,303 @@
+import os
+import json
+import time
+import uuid
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from pipeline import Pipeline, PipelineResult, Stage, PENDING, RUNNING, DONE, FAILED, SKIPPED
+
+# Job statuses; stages use the pipeline statuses
+QUEUED = 'queued'
+INTERRUPTED = 'interrupted'  # Was queued or running when the process stopped
+
+DEFAULT_JOB_STATE_DIR = os.getenv('JOB_STATE_DIR', os.path.join('.cache', 'jobs'))
+DEFAULT_JOB_WORKERS = int(os.getenv('JOB_WORKERS', 2))
+DEFAULT_JOB_HISTORY = int(os.getenv('JOB_HISTORY', 200))
+
+_current_job: contextvars.ContextVar[Optional['Job']] = contextvars.ContextVar('current_job', default=None)
+
+
+def current_job() -> Optional['Job']:
+    """The job whose pipeline is running in this context, if any."""
+    return _current_job.get()
+
+
+def _to_json(value: Any) -> Any:
+    # Pydantic models (e.g. agent segments) are stored as plain dicts
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    return str(value)
+
+
+class Job:
+    """
+    One pipeline run queued for a session. Stage progress, results as they land and
+    messages reported by the stages are readable from any thread while it runs.
+    context holds in-memory values for the stages (e.g. API key) and is never persisted.
+    key identifies the result (e.g. input hash and options), so equal requests can share it.
+    degraded is set by stages that returned a fallback after an error (e.g. a failed LLM call).
+    """
+
+    def __init__(self, job_id: str, label: str, stages: List[Stage], context: Optional[Dict] = None,
+                 key: Optional[str] = None):
+        self._lock = threading.Lock()
+        self.id = job_id
+        self.label = label
+        self.key = key
+        self.context = dict(context or {})
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.stages = {stage.name: {'label': stage.label, 'status': PENDING, 'seconds': None} for stage in stages}
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, str] = {}
+        self.messages: List[Dict] = []
+        self.degraded = False
+        # Bumped on every change, so pollers can tell when there is something new to render
+        self.version = 0
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    def add_message(self, level: str, text: str):
+        with self._lock:
+            self.messages.append({'level': level, 'text': text})
+            self.version += 1
+
+    def mark_degraded(self):
+        """Record that some result is a fallback, so the job is not reused for its key."""
+        with self._lock:
+            self.degraded = True
+            self.version += 1
+
+    def set_result(self, name: str, value: Any):
+        """Add or replace a result (e.g. post-processed stage output from on_finish)."""
+        with self._lock:
+            self.results[name] = value
+            self.version += 1
+
+    def _set_status(self, status: str):
+        with self._lock:
+            self.status = status
+            if status == RUNNING:
+                self.started_at = time.time()
+            elif status != QUEUED:
+                self.finished_at = time.time()
+            self.version += 1
+
+    def _update_stage(self, stage: Stage, status: str, outcome: PipelineResult):
+        with self._lock:
+            self.stages[stage.name]['status'] = status
+            if stage.name in outcome.durations:
+                self.stages[stage.name]['seconds'] = outcome.durations[stage.name]
+            if status == DONE:
+                self.results[stage.name] = outcome.results[stage.name]
+            elif status == FAILED:
+                self.errors[stage.name] = str(outcome.errors[stage.name])
+            self.version += 1
+
+    def progress(self) -> float:
+        with self._lock:
+            finished = sum(stage['status'] in (DONE, FAILED, SKIPPED) for stage in self.stages.values())
+            return finished / len(self.stages) if self.stages else 1.0
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'id': self.id,
+                'label': self.label,
+                'key': self.key,
+                'status': self.status,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'stages': {name: dict(stage) for name, stage in self.stages.items()},
+                'results': dict(self.results),
+                'errors': dict(self.errors),
+                'messages': list(self.messages),
+                'degraded': self.degraded,
+                'version': self.version,
+            }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'Job':
+        job = cls(state['id'], state['label'], [], key=state.get('key'))
+        job.status = state['status']
+        job.created_at = state['created_at']
+        job.started_at = state['started_at']
+        job.finished_at = state['finished_at']
+        job.stages = state['stages']
+        job.results = state['results']
+        job.errors = state['errors']
+        job.messages = state['messages']
+        job.degraded = state.get('degraded', False)
+        job.version = state['version']
+        return job
+
+
+class JobQueue:
+    """
+    Run pipelines as background jobs on a small worker pool, so processing survives
+    reruns and disconnects and a session can queue several conversations.
+
+    Each job's state is written to state_dir as JSON after every change, and its
+    inputs once at submission. Jobs found queued or running at startup are marked
+    interrupted. Jobs submitted with a key can be found again by it, so identical
+    requests from any session reuse a running or finished job; failed and degraded
+    jobs are forgotten once they finish, so the next request runs again. Beyond max_history
+    finished jobs, the oldest are dropped together with their files.
+    """
+
+    def __init__(self, state_dir: str = DEFAULT_JOB_STATE_DIR, max_workers: int = DEFAULT_JOB_WORKERS,
+                 max_history: int = DEFAULT_JOB_HISTORY):
+        self.state_dir = state_dir
+        self.max_history = max_history
+        os.makedirs(state_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._by_key: Dict[str, str] = {}  # Result key -> id of the newest usable job
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._load()
+
+    def _path(self, job_id: str, kind: str = 'state') -> str:
+        return os.path.join(self.state_dir, f"{job_id}.{kind}.json")
+
+    def _write(self, path: str, data: Dict):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=_to_json)
+        os.replace(tmp_path, path)
+
+    def _persist(self, job: Job):
+        try:
+            self._write(self._path(job.id), job.to_dict())
+        except OSError as e:
+            print(f"Warning: could not persist job {job.id}: {e}")
+
+    def _load(self):
+        for name in os.listdir(self.state_dir):
+            if not name.endswith('.state.json'):
+                continue
+            try:
+                with open(os.path.join(self.state_dir, name), encoding='utf-8') as f:
+                    job = Job.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: skipping unreadable job state {name}: {e}")
+                continue
+            if job.active:
+                job.status = INTERRUPTED
+                self._persist(job)
+            self._jobs[job.id] = job
+        for job in sorted(self._jobs.values(), key=lambda job: job.created_at):
+            if job.key and job.status == DONE and not job.degraded:
+                self._by_key[job.key] = job.id
+        self._prune()
+
+    def _prune(self):
+        with self._lock:
+            finished = sorted((job for job in self._jobs.values() if not job.active), key=lambda job: job.created_at)
+            evicted = finished[:max(0, len(finished) - self.max_history)]
+            for job in evicted:
+                del self._jobs[job.id]
+                if self._by_key.get(job.key) == job.id:
+                    del self._by_key[job.key]
+        for job in evicted:
+            for kind in ('state', 'inputs'):
+                try:
+                    os.remove(self._path(job.id, kind))
+                except FileNotFoundError:
+                    pass
+
+    def submit(self, label: str, stages: List[Stage], context: Optional[Dict] = None,
+               inputs: Optional[Dict] = None, on_finish: Optional[Callable[[Job, PipelineResult], None]] = None,
+               key: Optional[str] = None) -> str:
+        """
+        Queue a pipeline of stages and return the job id. Stages run with current_job()
+        set to the job. inputs (JSON-serializable) are persisted for load_inputs();
+        on_finish runs on the worker after the last stage. key registers the job for find().
+        """
+        pipeline = Pipeline(stages)
+        job = Job(uuid.uuid4().hex[:12], label, [pipeline.stages[name] for name in pipeline.order], context, key)
+        if inputs is not None:
+            self._write(self._path(job.id, 'inputs'), inputs)
+        with self._lock:
+            self._jobs[job.id] = job
+            if key:
+                self._by_key[key] = job.id
+        self._persist(job)
+        self._executor.submit(self._run, job, pipeline, on_finish)
+        return job.id
+
+    def _run(self, job: Job, pipeline: Pipeline, on_finish: Optional[Callable]):
+        token = _current_job.set(job)
+        try:
+            job._set_status(RUNNING)
+            self._persist(job)
+
+            def on_update(stage: Stage, status: str, outcome: PipelineResult):
+                job._update_stage(stage, status, outcome)
+                self._persist(job)
+
+            # Stage threads inherit this context, so they see current_job() too
+            def wrap(fn):
+                context = contextvars.copy_context()
+                return lambda *args: context.run(fn, *args)
+
+            outcome = pipeline.run(on_update=on_update, wrap=wrap)
+            if on_finish is not None:
+                on_finish(job, outcome)
+            job._set_status(DONE if outcome.ok else FAILED)
+        except Exception as e:
+            job.add_message('error', f"Processing failed: {e}")
+            job._set_status(FAILED)
+        finally:
+            _current_job.reset(token)
+            self._persist(job)
+            if job.status != DONE or job.degraded:
+                # Failed or fallback results are not reused; the next request for the key runs again
+                with self._lock:
+                    if self._by_key.get(job.key) == job.id:
+                        del self._by_key[job.key]
+            self._prune()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def find(self, key: str) -> Optional[Job]:
+        """The queued, running or finished job for key, unless it failed, was degraded or was evicted."""
+        with self._lock:
+            job_id = self._by_key.get(key)
+            return self._jobs.get(job_id) if job_id is not None else None
+
+    def jobs(self, job_ids: Optional[List[str]] = None) -> List[Job]:
+        """Jobs by id (unknown ids skipped), or all jobs, newest first."""
+        with self._lock:
+            jobs = [self._jobs[job_id] for job_id in job_ids if job_id in self._jobs] if job_ids is not None \
+                else list(self._jobs.values())
+        return sorted(jobs, key=lambda job: -job.created_at)
+
+    def load_inputs(self, job_id: str) -> Optional[Dict]:
+        try:
+            with open(self._path(job_id, 'inputs'), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+_job_queue_lock = threading.Lock()
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Process-wide job queue configured from JOB_STATE_DIR and JOB_WORKERS."""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue()
+        return _job_queue
@@ -0,0 +1,107 @@
+import re
+from collections import Counter, defaultdict
+from typing import List, Tuple
+
+from language_detector import STOPWORDS
+from segmentation import estimate_tokens
+
+# Research queries are kept to roughly this many tokens
+DEFAULT_QUERY_TOKENS = 16
+
+# Chat filler that carries no topic, on top of the per-language function words
+_CHAT_STOPWORDS = frozenset("""
+    i me we our us you your he him she her they them his its a an about also am been being but by could did
+    does doing from had has here if into like more most no nor now off once only or other out over own same
+    should so some such than then there these those through too under until up very was were when where
+    which while who whom why will would yes yeah ok okay oh hi hey hello thanks thank please really well
+    know think want get got going go let lets sure right one maybe something anything thing things much
+    good great nice cool lol haha hmm im dont cant thats its ive youre agent user all any every each
+""".split())
+_STOPWORDS = frozenset().union(_CHAT_STOPWORDS, *STOPWORDS.values())
+
+# "Speaker: " prefixes on rendered conversation lines
+_SPEAKER_PREFIX = re.compile(r"^[^\n:]{1,40}:\s", re.MULTILINE)
+_CLAUSE_SPLIT = re.compile(r"[.,!?;:()\[\]{}\"“”«»…\n\t/|]+|\s[-–—]\s")
+_WORD_PATTERN = re.compile(r"[^\W_][\w'’-]*")
+
+
+def _candidate_phrases(text: str, max_words: int) -> List[List[str]]:
+    """Runs of content words between stopwords and punctuation (RAKE candidates)."""
+    phrases = []
+    for clause in _CLAUSE_SPLIT.split(_SPEAKER_PREFIX.sub("", text).casefold()):
+        phrase = []
+        for word in _WORD_PATTERN.findall(clause):
+            word = word.strip("'’-")
+            # Contractions ("i'll", "don't") are function words too
+            if word in _STOPWORDS or len(word) < 3 or word.isdigit() or "'" in word or "’" in word:
+                if phrase:
+                    phrases.append(phrase)
+                phrase = []
+            else:
+                phrase.append(word)
+        if phrase:
+            phrases.append(phrase)
+    # Long runs are usually unpunctuated rambling; keep their leading words only
+    return [phrase[:max_words] for phrase in phrases]
+
+
+def extract_keyphrases(text: str, max_phrases: int = 5, max_words: int = 3) -> List[Tuple[str, float]]:
+    """
+    Rank keyphrases in text with RAKE: each word scores degree / frequency over the
+    candidate phrases it appears in, and a phrase scores the sum of its words.
+    Phrases that recur are boosted by their count. Returns (phrase, score), best first.
+    """
+    phrases = _candidate_phrases(text, max_words)
+    if not phrases:
+        return []
+
+    frequency = Counter()
+    degree = Counter()
+    for phrase in phrases:
+        frequency.update(phrase)
+        for word in phrase:
+            degree[word] += len(phrase)
+
+    occurrences = Counter()
+    first_seen = {}
+    for position, phrase in enumerate(phrases):
+        key = ' '.join(phrase)
+        occurrences[key] += 1
+        first_seen.setdefault(key, (position, phrase))
+
+    scores = defaultdict(float)
+    for key, (_, phrase) in first_seen.items():
+        scores[key] = sum(degree[word] / frequency[word] for word in phrase) * (1 + 0.5 * (occurrences[key] - 1))
+
+    ranked = sorted(scores, key=lambda key: (-scores[key], first_seen[key][0]))
+    return [(key, scores[key]) for key in ranked[:max_phrases]]
+
+
+def build_research_query(topic: str, content: str = "", max_tokens: int = DEFAULT_QUERY_TOKENS) -> str:
+    """
+    Short search query for a segment: its topic label, then the strongest keyphrases
+    from the content that add new words, until the token budget is used.
+    """
+    query_words: List[str] = []
+    seen = set()
+
+    def add(words: List[str]) -> bool:
+        fresh = [word for word in words if word.casefold() not in seen]
+        if not fresh:
+            return True
+        candidate = ' '.join(query_words + fresh)
+        if query_words and estimate_tokens(candidate) > max_tokens:
+            return False
+        query_words.extend(fresh)
+        seen.update(word.casefold() for word in fresh)
+        return True
+
+    for word in _WORD_PATTERN.findall(topic):
+        if word.casefold() in _STOPWORDS:
+            continue
+        if not add([word]):
+            break
+    for phrase, _ in extract_keyphrases(content, max_phrases=8):
+        if not add(phrase.split()):
+            break
+    return ' '.join(query_words)
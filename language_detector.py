@@ -0,0 +1,184 @@
+import re
+from collections import Counter
+from typing import Dict, NamedTuple
+
+import numpy as np
+
+# Guesses at or above this confidence are trusted without asking the LLM; checked against
+# the sample sentences in benchmarks/bench_language_detector.py
+CONFIDENCE_THRESHOLD = 0.5
+
+# Human-readable names for every code detect_language can return
+LANGUAGE_NAMES: Dict[str, str] = {
+    'en': 'English', 'de': 'German', 'fr': 'French', 'es': 'Spanish', 'it': 'Italian',
+    'pt': 'Portuguese', 'nl': 'Dutch', 'tr': 'Turkish', 'pl': 'Polish',
+    'ru': 'Russian', 'uk': 'Ukrainian', 'bg': 'Bulgarian', 'sr': 'Serbian',
+    'el': 'Greek', 'he': 'Hebrew', 'ar': 'Arabic', 'fa': 'Persian', 'hi': 'Hindi',
+    'zh': 'Chinese', 'ja': 'Japanese', 'ko': 'Korean', 'th': 'Thai', 'ka': 'Georgian', 'hy': 'Armenian',
+}
+
+# Unicode blocks as (first codepoint, script); each block runs until the next entry starts
+_SCRIPT_BLOCKS = [
+    (0x0000, None), (0x0041, 'latin'), (0x005B, None), (0x0061, 'latin'), (0x007B, None),
+    (0x00C0, 'latin'), (0x0250, None), (0x0370, 'greek'), (0x0400, 'cyrillic'), (0x0530, 'armenian'),
+    (0x0590, 'hebrew'), (0x0600, 'arabic'), (0x0700, None), (0x0900, 'devanagari'), (0x0980, None),
+    (0x0E00, 'thai'), (0x0E80, None), (0x10A0, 'georgian'), (0x1100, None), (0x1E00, 'latin'),
+    (0x1F00, None), (0x3040, 'kana'), (0x3100, None), (0x4E00, 'han'), (0xA000, None),
+    (0xAC00, 'hangul'), (0xD7B0, None),
+]
+_BLOCK_STARTS = np.array([start for start, _ in _SCRIPT_BLOCKS], dtype=np.uint32)
+_SCRIPTS = sorted({script for _, script in _SCRIPT_BLOCKS if script})
+_BLOCK_SCRIPT_IDS = np.array([_SCRIPTS.index(s) if s else -1 for _, s in _SCRIPT_BLOCKS], dtype=np.int64)
+
+# Scripts used by a single language in practice
+_SINGLE_LANGUAGE_SCRIPTS = {
+    'greek': 'el', 'hebrew': 'he', 'devanagari': 'hi', 'thai': 'th',
+    'georgian': 'ka', 'armenian': 'hy', 'hangul': 'ko', 'kana': 'ja',
+}
+
+# Letters that only (or mostly) occur in one language of a shared script
+_MARKER_CHARS = {
+    'cyrillic': {'ru': 'ыэё', 'uk': 'іїєґ', 'bg': 'ъ', 'sr': 'ђћџљњј'},
+    'arabic': {'ar': 'ةى', 'fa': 'پچژگ'},
+    'latin': {
+        'de': 'äöüß', 'fr': 'èêàçœ', 'es': 'ñ¿¡', 'it': 'ìò', 'pt': 'ãõ',
+        'tr': 'ğışİ', 'pl': 'ąęłńśźż',
+    },
+}
+
+# Frequent function words; a few dozen per language are enough for chat-sized text
+STOPWORDS: Dict[str, frozenset] = {lang: frozenset(words.split()) for lang, words in {
+    'en': "the and is are you to of it that in for was what how with this have not my your do be can just "
+          "i we he she they me our us at on from so if or but all about there get will would should know think",
+    'de': "und der die das ist nicht ich sie es ein eine zu mit auf für wie was auch sind haben "
+          "du dir mich mir habe hat war aber oder wenn dass noch schon nur sehr ja nein wir ihr den dem einen bin bist",
+    'fr': "le la les et est un une des je vous il pas que qui pour dans avec ce sur mais très "
+          "tu te moi toi nous ils elle on au aux du mon ma mes ton ta oui non comme bien aussi suis",
+    'es': "el la los las y es un una que de no por para con como pero muy está qué yo "
+          "tú te me mi su lo se del al también sí ya hay bien cómo estás soy eres",
+    'it': "il lo la gli le e è un una che di non per con come ma sono molto anche questo "
+          "io tu mi ti si ci del della ho hai ha sei stai bene perché più",
+    'pt': "o a os as e é um uma que de não para com como mas você muito está isso "
+          "eu me te da em nos ele ela bem sim também tudo",
+    'nl': "de het een en is niet ik je van dat die op te met voor zijn maar ook "
+          "hoe gaat wat wij jij hij zij er naar bij om als heb heeft nog wel geen",
+    'tr': "ve bir bu da de ne için çok ben sen ama gibi var yok mi "
+          "o biz siz onlar şu evet hayır nasıl neden daha sonra kadar ile",
+    'pl': "i w nie na jest to że się z do jak co ale tak jestem "
+          "mnie mi ty my wy on ona już tylko bardzo być był była czy który",
+    'ru': "и в не на что я с как это он она а но по да нет так все мне ты вы "
+          "у меня тебя его её мы они был была было бы же ли только уже ещё вот если или когда очень хорошо",
+    'uk': "і в не на що я з як це він вона а але та так все мені ти ви й "
+          "у мене тебе його її ми вони був була було б же чи тільки вже ще ось якщо або коли дуже добре",
+    'bg': "и в не на че аз с как това той тя а но да се за е "
+          "си съм сме са бях беше ще може когато ако или",
+    'sr': "и у не на да је се са како то он она а али за "
+          "ја сам си смо су био била још само врло када ако или јер",
+    'ar': "في من على إلى هذا هذه أن لا ما هو هي كان مع عن أنا أنت لكن كيف ماذا نعم",
+    'fa': "و در به از که این را با است من تو یک هم برای آن ما شما خیلی",
+}.items()}
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+
+class LanguageGuess(NamedTuple):
+    code: str          # ISO 639-1 code, e.g. 'ru'
+    confidence: float  # 0..1
+    script: str        # dominant script, e.g. 'cyrillic'
+
+
+def language_name(code: str) -> str:
+    return LANGUAGE_NAMES.get(code, 'English')
+
+
+def _script_counts(text: str) -> np.ndarray:
+    """Letters per script, bucketed over the codepoint array in one vectorized pass."""
+    codepoints = np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+    script_ids = _BLOCK_SCRIPT_IDS[np.searchsorted(_BLOCK_STARTS, codepoints, side='right') - 1]
+    return np.bincount(script_ids[script_ids >= 0], minlength=len(_SCRIPTS))
+
+
+def script_shares(text: str) -> Dict[str, float]:
+    """Fraction of letters in each script."""
+    counts = _script_counts(text)
+    total = counts.sum()
+    if not total:
+        return {}
+    return {script: count / total for script, count in zip(_SCRIPTS, counts.tolist()) if count}
+
+
+def _marker_hits(lowered: str, script: str) -> Counter:
+    hits = Counter()
+    for lang, markers in _MARKER_CHARS.get(script, {}).items():
+        hits[lang] = sum(lowered.count(ch) for ch in markers)
+    return +hits
+
+
+def _score_languages(lowered: str, script: str, markers: Counter) -> Counter:
+    scores = Counter({lang: 2 * hits for lang, hits in markers.items()})
+
+    candidates = [lang for lang in STOPWORDS if _script_of(lang) == script]
+    if candidates:
+        words = Counter(_WORD_PATTERN.findall(lowered))
+        for lang in candidates:
+            stopwords = STOPWORDS[lang]
+            scores[lang] += sum(count for word, count in words.items() if word in stopwords)
+    # Drop languages with no evidence at all
+    return +scores
+
+
+def _script_of(lang: str) -> str:
+    if lang in ('ru', 'uk', 'bg', 'sr'):
+        return 'cyrillic'
+    if lang in ('ar', 'fa'):
+        return 'arabic'
+    return 'latin'
+
+
+def detect_language(text: str, max_chars: int = 20000) -> LanguageGuess:
+    """
+    Guess the dominant language of text offline from script ratios, marker
+    letters and stopword frequencies. Confidence is low for short or mixed text.
+    """
+    sample = text[:max_chars]
+    counts = _script_counts(sample)
+    letters = int(counts.sum())
+    if not letters:
+        return LanguageGuess('en', 0.0, 'unknown')
+
+    shares = {script: count / letters for script, count in zip(_SCRIPTS, counts.tolist()) if count}
+    script, share = max(shares.items(), key=lambda item: item[1])
+    # Very short samples can't be trusted much regardless of how clean they look;
+    # CJK characters carry roughly a word each, so they need fewer of them
+    length_factor = min(1.0, letters / (10 if script in ('han', 'kana', 'hangul') else 40))
+
+    if script == 'han':
+        # Japanese text mixes kanji with kana
+        if shares.get('kana', 0) > 0.05:
+            return LanguageGuess('ja', min(1.0, share + shares['kana']) * length_factor, 'kana')
+        return LanguageGuess('zh', share * length_factor, script)
+
+    if script in _SINGLE_LANGUAGE_SCRIPTS:
+        return LanguageGuess(_SINGLE_LANGUAGE_SCRIPTS[script], share * length_factor, script)
+
+    lowered = sample.lower()
+    markers = _marker_hits(lowered, script)
+    scores = _score_languages(lowered, script, markers)
+    default = {'cyrillic': 'ru', 'arabic': 'ar', 'latin': 'en'}[script]
+    if not scores:
+        # Script is known but nothing distinguishes languages within it (or the text is in a
+        # language we have no stopwords for), so stay below CONFIDENCE_THRESHOLD
+        return LanguageGuess(default, share * length_factor * 0.4, script)
+
+    # The other languages of a shared script give themselves away with their marker
+    # letters; without any, a default that has evidence and leads (or ties) the
+    # stopword count is as safe as a single-language script
+    if scores[default] and scores[default] >= max(scores.values()) and not (markers.keys() - {default}):
+        return LanguageGuess(default, share * length_factor, script)
+
+    ranked = scores.most_common(2)
+    best, best_score = ranked[0]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0
+    margin = best_score / (best_score + runner_up)
+    evidence = min(1.0, best_score / 5)
+    return LanguageGuess(best, share * margin * evidence * length_factor, script)
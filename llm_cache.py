@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join('.cache', 'llm_cache.sqlite3'))
+DEFAULT_TTL_SECONDS = float(os.getenv('LLM_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+DEFAULT_MAX_BYTES = int(float(os.getenv('LLM_CACHE_MAX_MB', 256)) * 1024 * 1024)
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable sha256 over JSON-serializable parts (dict keys sorted)."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def credential_fingerprint(secret: Optional[str]) -> str:
+    """Short stable digest identifying a credential without keeping it in keys."""
+    if not secret:
+        return 'none'
+    return content_hash('credential', secret)[:16]
+
+
+class LLMCache:
+    """
+    Persistent, content-addressed cache for LLM responses, stored in SQLite.
+
+    Keys are hashes of (namespace, model, prompt, parameters, conversation hash),
+    so identical requests are answered locally. Entries expire after ttl_seconds
+    and the least recently used ones are evicted once the store exceeds max_bytes.
+    Safe to share across threads.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES, enabled: bool = True):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+        self._namespace_stats: Dict[str, Dict[str, int]] = {}
+        self._conn = None
+        self._total_bytes = 0
+
+        if self.enabled:
+            self._open()
+
+    def _open(self):
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self.evict_expired()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(namespace: str, model: str, prompt: Any, params: Optional[Dict] = None,
+                 conversation_hash: Optional[str] = None) -> str:
+        """Build the content address for a request."""
+        return content_hash(namespace, model, prompt, params or {}, conversation_hash)
+
+    def get(self, key: str, namespace: str = 'default') -> Optional[str]:
+        """Return the cached value for key, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._delete(key)
+                row = None
+
+            if row is None:
+                self._count(namespace, 'misses')
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._count(namespace, 'hits')
+            return row[0]
+
+    def set(self, key: str, value: str, namespace: str = 'default'):
+        """Store value under key, evicting least recently used entries if over the size budget."""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        size = len(value.encode('utf-8'))
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, value, size, now, now)
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._count(namespace, 'writes')
+            if self._total_bytes > self.max_bytes:
+                self._evict_lru()
+
+    def get_json(self, key: str, namespace: str = 'default') -> Any:
+        value = self.get(key, namespace)
+        return json.loads(value) if value is not None else None
+
+    def set_json(self, key: str, value: Any, namespace: str = 'default'):
+        self.set(key, json.dumps(value, ensure_ascii=False), namespace)
+
+    def evict_expired(self) -> int:
+        """Drop entries older than the TTL. Returns the number removed."""
+        if not self.enabled:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            removed, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE created_at < ?", (cutoff,)
+            ).fetchone()
+            if removed:
+                self._conn.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,))
+                self._total_bytes -= size
+                self._stats['evictions'] += removed
+            return removed
+
+    def clear(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._total_bytes = 0
+
+    def stats(self) -> Dict:
+        """Process-wide hit/miss counters plus current store size."""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] if self.enabled else 0
+            return {
+                **self._stats,
+                'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+                'entries': entries,
+                'bytes': self._total_bytes,
+                'by_namespace': {name: dict(counts) for name, counts in self._namespace_stats.items()},
+            }
+
+    def _count(self, namespace: str, field: str):
+        self._stats[field] += 1
+        counts = self._namespace_stats.setdefault(namespace, {'hits': 0, 'misses': 0, 'writes': 0})
+        counts[field] += 1
+
+    def _delete(self, key: str):
+        row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+            self._stats['evictions'] += 1
+
+    def _evict_lru(self):
+        # Trim to 90% of the budget so we don't evict on every subsequent write
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= size
+            self._stats['evictions'] += 1
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Process-wide LLM cache configured from LLM_CACHE_* environment variables."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMCache(enabled=os.getenv('LLM_CACHE_DISABLED', '').lower() not in ('1', 'true', 'yes'))
+        return _cache
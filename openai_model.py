@@ -0,0 +1,178 @@
+import os
+import time
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import httpx
+import openai
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+
+@dataclass(frozen=True)
+class ClientConfig:
+    """Connection-pool, timeout and retry settings for pooled OpenAI clients."""
+    max_connections: int = int(_env_float('OPENAI_POOL_MAX_CONNECTIONS', 20))
+    max_keepalive_connections: int = int(_env_float('OPENAI_POOL_MAX_KEEPALIVE', 10))
+    keepalive_expiry: float = _env_float('OPENAI_POOL_KEEPALIVE_EXPIRY', 120.0)
+    connect_timeout: float = _env_float('OPENAI_CONNECT_TIMEOUT', 10.0)
+    read_timeout: float = _env_float('OPENAI_READ_TIMEOUT', 120.0)
+    max_retries: int = int(_env_float('OPENAI_MAX_RETRIES', 3))
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+
+DEFAULT_CONFIG = ClientConfig()
+
+
+class RequestTimings:
+    """
+    Aggregates per-request time split into connection setup (TCP connect + TLS)
+    and server time (request sent until response headers received), using
+    httpcore's trace extension. Requests on a reused keep-alive connection
+    have zero setup time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+            self.connect_seconds = 0.0
+            self.server_seconds = 0.0
+
+    def record(self, connect_seconds: float, server_seconds: float):
+        with self._lock:
+            self.requests += 1
+            if connect_seconds > 0:
+                self.new_connections += 1
+            self.connect_seconds += connect_seconds
+            self.server_seconds += server_seconds
+
+    def summary(self) -> Dict:
+        with self._lock:
+            requests = self.requests or 1
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'reused_connections': self.requests - self.new_connections,
+                'connect_seconds': self.connect_seconds,
+                'server_seconds': self.server_seconds,
+                'avg_connect_ms': 1000 * self.connect_seconds / requests,
+                'avg_server_ms': 1000 * self.server_seconds / requests,
+            }
+
+
+request_timings = RequestTimings()
+
+
+def _trace_event(marks: Dict[str, float], event_name: str):
+    # Event names look like "connection.connect_tcp.started" or "http11.send_request_headers.started"
+    step = event_name.rsplit('.', 2)
+    if len(step) == 3:
+        marks.setdefault(f"{step[1]}.{step[2]}", time.perf_counter())
+
+
+def _record_timing(request: httpx.Request):
+    marks = request.extensions.get('timing_marks')
+    if not marks:
+        return
+    connect_start = marks.get('connect_tcp.started')
+    connect_end = marks.get('start_tls.complete') or marks.get('connect_tcp.complete')
+    send_start = marks.get('send_request_headers.started')
+    headers_done = marks.get('receive_response_headers.complete')
+    connect_seconds = connect_end - connect_start if connect_start and connect_end else 0.0
+    server_seconds = headers_done - send_start if send_start and headers_done else 0.0
+    request_timings.record(connect_seconds, server_seconds)
+
+
+def _on_request(request: httpx.Request):
+    marks: Dict[str, float] = {}
+    request.extensions['timing_marks'] = marks
+    request.extensions['trace'] = lambda event_name, info: _trace_event(marks, event_name)
+
+
+def _on_response(response: httpx.Response):
+    _record_timing(response.request)
+
+
+async def _on_request_async(request: httpx.Request):
+    marks: Dict[str, float] = {}
+
+    async def trace(event_name, info):
+        _trace_event(marks, event_name)
+
+    request.extensions['timing_marks'] = marks
+    request.extensions['trace'] = trace
+
+
+async def _on_response_async(response: httpx.Response):
+    _record_timing(response.request)
+
+
+_registry_lock = threading.Lock()
+_sync_clients: Dict[Tuple[str, ClientConfig], openai.OpenAI] = {}
+# httpx async pools are bound to the event loop they were first used on
+_async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]' = weakref.WeakKeyDictionary()
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    api_key = api_key or os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        raise openai.OpenAIError("No OpenAI API key provided")
+    return api_key
+
+
+def get_openai_client(api_key: Optional[str] = None, config: ClientConfig = DEFAULT_CONFIG) -> openai.OpenAI:
+    """Process-wide OpenAI client for api_key, sharing one keep-alive connection pool."""
+    key = (_resolve_api_key(api_key), config)
+    with _registry_lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            http_client = httpx.Client(
+                limits=config.limits(),
+                timeout=config.timeout(),
+                follow_redirects=True,
+                event_hooks={'request': [_on_request], 'response': [_on_response]},
+            )
+            client = openai.OpenAI(api_key=key[0], max_retries=config.max_retries,
+                                   timeout=config.timeout(), http_client=http_client)
+            _sync_clients[key] = client
+        return client
+
+
+def get_async_openai_client(api_key: Optional[str] = None, config: ClientConfig = DEFAULT_CONFIG,
+                            loop: Optional[asyncio.AbstractEventLoop] = None) -> openai.AsyncOpenAI:
+    """AsyncOpenAI client for api_key, shared by all callers on loop (default: the running event loop)."""
+    key = (_resolve_api_key(api_key), config)
+    loop = loop or asyncio.get_running_loop()
+    with _registry_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            http_client = httpx.AsyncClient(
+                limits=config.limits(),
+                timeout=config.timeout(),
+                follow_redirects=True,
+                event_hooks={'request': [_on_request_async], 'response': [_on_response_async]},
+            )
+            client = openai.AsyncOpenAI(api_key=key[0], max_retries=config.max_retries,
+                                        timeout=config.timeout(), http_client=http_client)
+            clients[key] = client
+        return client
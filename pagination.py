@@ -0,0 +1,63 @@
+import os
+import re
+import math
+from bisect import bisect_right
+from typing import List, Sequence, Tuple
+
+from conversation_store import Conversation
+
+DEFAULT_PAGE_SIZE = int(os.getenv('TRANSCRIPT_PAGE_SIZE', 50))
+DEFAULT_SEARCH_LIMIT = 200
+
+
+def page_count(total: int, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    return max(1, math.ceil(total / page_size))
+
+
+def page_of(index: int, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    """1-based page holding row index."""
+    return index // page_size + 1
+
+
+def page_range(page: int, total: int, page_size: int = DEFAULT_PAGE_SIZE) -> Tuple[int, int]:
+    """[start, stop) rows of a 1-based page, clamped to the last page."""
+    page = min(max(page, 1), page_count(total, page_size))
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total)
+
+
+def search_lines(lines: Sequence[str], query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[int]:
+    """Indices of lines containing query (case-insensitive), at most limit."""
+    query = query.casefold()
+    matches = []
+    for i, line in enumerate(lines):
+        if query in line.casefold():
+            matches.append(i)
+            if len(matches) >= limit:
+                break
+    return matches
+
+
+def search_conversation(conversation: Conversation, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[int]:
+    """
+    Indices of messages whose text contains query (case-insensitive), at most limit.
+    Scans the message buffer directly and maps hits to messages by offset, so no
+    per-message strings are built.
+    """
+    if not query or not len(conversation):
+        return []
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    text = conversation.text
+    offsets = conversation.message_offsets
+    base = offsets[0]
+    matches = []
+    position = 0
+    while len(matches) < limit:
+        match = pattern.search(text, position)
+        if match is None:
+            break
+        index = bisect_right(offsets, base + match.start()) - 1
+        matches.append(index)
+        # Continue from the next message so each message is reported once
+        position = offsets[index + 1] - base
+    return matches
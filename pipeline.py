@@ -0,0 +1,118 @@
+import time
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Stage statuses reported through Pipeline.run(on_update=...)
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+@dataclass
+class Stage:
+    """A unit of pipeline work. fn receives a dict with the results of depends_on."""
+    name: str
+    fn: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+    label: str = ""
+
+
+@dataclass
+class PipelineResult:
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class Pipeline:
+    """
+    Run stages concurrently on a thread pool, each as soon as its dependencies finish.
+
+    Progress callbacks are invoked on the calling thread, so they may safely
+    update UI state. A failed stage marks all of its dependents as skipped;
+    independent branches keep running.
+    """
+
+    def __init__(self, stages: Sequence[Stage], max_workers: Optional[int] = None):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names in pipeline")
+        self.order = self._topological_order()
+        self.max_workers = max_workers or len(self.stages)
+
+    def _topological_order(self) -> List[str]:
+        order, visiting, visited = [], set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Pipeline has a dependency cycle through '{name}'")
+            if name not in self.stages:
+                raise ValueError(f"Unknown pipeline stage '{name}'")
+            visiting.add(name)
+            for dependency in self.stages[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def run(self, on_update: Optional[Callable[[Stage, str, PipelineResult], None]] = None,
+            wrap: Optional[Callable[[Callable], Callable]] = None) -> PipelineResult:
+        """
+        Execute the graph and return all stage results.
+        wrap, if given, is applied to each stage function before it is submitted
+        (e.g. to attach thread-local context to worker threads).
+        """
+        outcome = PipelineResult()
+        status = {name: PENDING for name in self.order}
+        started: Dict[str, float] = {}
+        running = {}
+
+        def notify(name: str, new_status: str):
+            status[name] = new_status
+            if on_update:
+                on_update(self.stages[name], new_status, outcome)
+
+        def submit_ready(executor: ThreadPoolExecutor):
+            for name in self.order:
+                if status[name] != PENDING:
+                    continue
+                dependencies = self.stages[name].depends_on
+                if any(status[dep] in (FAILED, SKIPPED) for dep in dependencies):
+                    notify(name, SKIPPED)
+                elif all(status[dep] == DONE for dep in dependencies):
+                    stage_fn = wrap(self.stages[name].fn) if wrap else self.stages[name].fn
+                    inputs = {dep: outcome.results[dep] for dep in dependencies}
+                    started[name] = time.perf_counter()
+                    running[executor.submit(stage_fn, inputs)] = name
+                    notify(name, RUNNING)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pipeline") as executor:
+            submit_ready(executor)
+            while running:
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    outcome.durations[name] = time.perf_counter() - started[name]
+                    try:
+                        outcome.results[name] = future.result()
+                    except Exception as e:
+                        outcome.errors[name] = e
+                        notify(name, FAILED)
+                    else:
+                        notify(name, DONE)
+                submit_ready(executor)
+
+        return outcome
@@ -0,0 +1,120 @@
+import os
+import time
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from bm25_index import BM25Index
+from llm_cache import content_hash
+
+DEFAULT_INDEX_DIR = os.getenv('RESEARCH_INDEX_DIR', os.path.join('.cache', 'research_index'))
+CORPUS_REFRESH_SECONDS = float(os.getenv('RESEARCH_CORPUS_REFRESH_SECONDS', 60))
+
+
+class ResearchBackend(ABC):
+    """
+    Source of research results for the starter generator. search() returns up to
+    limit {'title', 'markdown', 'url'} dicts, the shape of Firecrawl search results.
+    """
+
+    name = 'base'
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 3) -> List[Dict]:
+        ...
+
+
+class FirecrawlBackend(ResearchBackend):
+    """Web search through Firecrawl (uses FIRECRAWL_API_KEY from environment)."""
+
+    name = 'firecrawl'
+
+    def __init__(self):
+        from firecrawl import FirecrawlApp
+        self.app = FirecrawlApp()
+
+    def search(self, query: str, limit: int = 3) -> List[Dict]:
+        search_results = self.app.search(
+            query=query,
+            limit=limit,
+            search_format="markdown"
+        )
+        if search_results and 'data' in search_results:
+            return search_results['data'][:limit]
+        return []
+
+
+class LocalBM25Backend(ResearchBackend):
+    """Offline search over a local directory of markdown/text documents, re-scanned for changes periodically."""
+
+    name = 'local'
+
+    def __init__(self, corpus_dir: str, index_dir: str = DEFAULT_INDEX_DIR,
+                 refresh_seconds: float = CORPUS_REFRESH_SECONDS):
+        if not os.path.isdir(corpus_dir):
+            raise FileNotFoundError(f"Research corpus directory not found: {corpus_dir}")
+        self.corpus_dir = corpus_dir
+        self.refresh_seconds = refresh_seconds
+        self.index = BM25Index(index_dir)
+        self._lock = threading.Lock()
+        self._refreshed_at = 0.0
+        self.refresh()
+
+    def refresh(self) -> Dict[str, int]:
+        """Index new, changed and removed corpus files."""
+        with self._lock:
+            changes = self.index.update(self.corpus_dir)
+            self._refreshed_at = time.monotonic()
+            return changes
+
+    def search(self, query: str, limit: int = 3) -> List[Dict]:
+        if time.monotonic() - self._refreshed_at > self.refresh_seconds:
+            self.refresh()
+        return self.index.search(query, limit=limit)
+
+
+def make_research_backend(kind: Optional[str] = None) -> Optional[ResearchBackend]:
+    """
+    Build the backend named by RESEARCH_BACKEND: 'firecrawl', 'local' (BM25 over
+    RESEARCH_CORPUS_DIR), 'none', or 'auto' (default) to use Firecrawl when it is
+    configured and the local corpus otherwise. Returns None if research is unavailable.
+    """
+    kind = (kind or os.getenv('RESEARCH_BACKEND', 'auto')).lower()
+    corpus_dir = os.getenv('RESEARCH_CORPUS_DIR')
+
+    if kind in ('firecrawl', 'auto'):
+        try:
+            return FirecrawlBackend()
+        except Exception as e:
+            if kind == 'firecrawl' or not corpus_dir:
+                print(f"Warning: Firecrawl not initialized. Research capabilities disabled: {e}")
+                return None
+
+    if kind in ('local', 'auto'):
+        if not corpus_dir:
+            print("Warning: RESEARCH_CORPUS_DIR not set. Research capabilities disabled.")
+            return None
+        try:
+            return LocalBM25Backend(corpus_dir)
+        except Exception as e:
+            print(f"Warning: Local research index not available. Research capabilities disabled: {e}")
+            return None
+
+    return None
+
+
+_backend_lock = threading.Lock()
+_backends: Dict[Tuple[str, str], Optional[ResearchBackend]] = {}
+
+
+def get_research_backend(kind: Optional[str] = None) -> Optional[ResearchBackend]:
+    """
+    Process-wide research backend per kind and credentials (Firecrawl key, corpus
+    directory); retried on the next call if it could not be built.
+    """
+    kind = (kind or os.getenv('RESEARCH_BACKEND', 'auto')).lower()
+    key = (kind, content_hash(os.getenv('FIRECRAWL_API_KEY'), os.getenv('RESEARCH_CORPUS_DIR')))
+    with _backend_lock:
+        if _backends.get(key) is None:
+            _backends[key] = make_research_backend(kind)
+        return _backends[key]
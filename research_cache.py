@@ -0,0 +1,183 @@
+import os
+import re
+import time
+import asyncio
+import threading
+import unicodedata
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+from llm_cache import LLMCache, content_hash
+from language_detector import STOPWORDS
+
+DEFAULT_RESEARCH_CACHE_PATH = os.getenv('RESEARCH_CACHE_PATH', os.path.join('.cache', 'research_cache.sqlite3'))
+DEFAULT_RESEARCH_TTL_SECONDS = float(os.getenv('RESEARCH_CACHE_TTL_SECONDS', 24 * 3600))
+DEFAULT_RESEARCH_MAX_BYTES = int(float(os.getenv('RESEARCH_CACHE_MAX_MB', 64)) * 1024 * 1024)
+
+_QUERY_WORD_PATTERN = re.compile(r"\w+")
+_ALL_STOPWORDS = frozenset().union(*STOPWORDS.values())
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonical form of a research query: case-folded words, stopwords and repeats
+    dropped, sorted. "Weather in London today" and "london weather today?" match.
+    """
+    words = _QUERY_WORD_PATTERN.findall(unicodedata.normalize('NFKC', query).casefold())
+    content_words = {word for word in words if word not in _ALL_STOPWORDS} or set(words)
+    return ' '.join(sorted(content_words))
+
+
+class ResearchStats:
+    """Per-run research counters: lookups, cache hits, in-flight joins and latency saved by both."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+        self.joined = 0
+        self.fetches = 0
+        self.fetch_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def record(self, outcome: str, seconds: float):
+        with self._lock:
+            self.lookups += 1
+            if outcome == 'hit':
+                self.hits += 1
+                self.saved_seconds += seconds
+            elif outcome == 'joined':
+                self.joined += 1
+                self.saved_seconds += seconds
+            else:
+                self.fetches += 1
+                self.fetch_seconds += seconds
+
+    def summary(self) -> Dict:
+        with self._lock:
+            return {
+                'lookups': self.lookups,
+                'hits': self.hits,
+                'joined': self.joined,
+                'fetches': self.fetches,
+                'hit_rate': (self.hits + self.joined) / self.lookups if self.lookups else 0.0,
+                'fetch_seconds': self.fetch_seconds,
+                'saved_seconds': self.saved_seconds,
+            }
+
+
+class ResearchCache:
+    """
+    Research results keyed on normalized queries, persisted with a TTL in an
+    LLMCache store. Concurrent lookups of the same query, from any thread or
+    event loop, share a single fetch.
+    """
+
+    NAMESPACE = 'research'
+
+    def __init__(self, store: LLMCache):
+        self.store = store
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    @staticmethod
+    def make_key(query: str, backend: str = 'firecrawl') -> str:
+        return content_hash('research', backend, normalize_query(query))
+
+    def _claim(self, key: str) -> Tuple[Optional[Dict], Future, bool]:
+        """Return (cached entry, in-flight future, whether this caller owns the fetch)."""
+        cached = self.store.get_json(key, self.NAMESPACE)
+        if cached is not None:
+            return cached, None, False
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return None, future, False
+            # _complete stores the result before dropping its future, so a fetch that finished
+            # since the check above is in the store by now
+            cached = self.store.get_json(key, self.NAMESPACE)
+            if cached is not None:
+                return cached, None, False
+            future = self._in_flight[key] = Future()
+            return None, future, True
+
+    def _complete(self, key: str, future: Future, result: Optional[str], seconds: float,
+                  error: Optional[BaseException] = None):
+        # Only successful results are persisted; failures are retried by the next lookup
+        if error is None:
+            self.store.set_json(key, {'result': result, 'seconds': seconds}, self.NAMESPACE)
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if error is None:
+            future.set_result({'result': result, 'seconds': seconds})
+        else:
+            future.set_exception(error)
+
+    def get_or_fetch(self, query: str, fetch: Callable[[str], str], stats: Optional[ResearchStats] = None,
+                     backend: str = 'firecrawl') -> str:
+        """Return the research result for query, calling fetch(query) only on a miss."""
+        key = self.make_key(query, backend)
+        cached, future, owner = self._claim(key)
+        if cached is not None:
+            self._record(stats, 'hit', cached['seconds'])
+            return cached['result']
+        if not owner:
+            entry = future.result()
+            self._record(stats, 'joined', entry['seconds'])
+            return entry['result']
+
+        start = time.perf_counter()
+        try:
+            result = fetch(query)
+        except BaseException as e:
+            self._complete(key, future, None, 0.0, e)
+            raise
+        seconds = time.perf_counter() - start
+        self._complete(key, future, result, seconds)
+        self._record(stats, 'fetch', seconds)
+        return result
+
+    async def get_or_fetch_async(self, query: str, fetch: Callable[[str], str], stats: Optional[ResearchStats] = None,
+                                 backend: str = 'firecrawl') -> str:
+        """Async variant: the blocking fetch runs in a worker thread and waiting never blocks the event loop."""
+        key = self.make_key(query, backend)
+        cached, future, owner = self._claim(key)
+        if cached is not None:
+            self._record(stats, 'hit', cached['seconds'])
+            return cached['result']
+        if not owner:
+            entry = await asyncio.wrap_future(future)
+            self._record(stats, 'joined', entry['seconds'])
+            return entry['result']
+
+        start = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(fetch, query)
+        except BaseException as e:
+            self._complete(key, future, None, 0.0, e)
+            raise
+        seconds = time.perf_counter() - start
+        self._complete(key, future, result, seconds)
+        self._record(stats, 'fetch', seconds)
+        return result
+
+    @staticmethod
+    def _record(stats: Optional[ResearchStats], outcome: str, seconds: float):
+        if stats is not None:
+            stats.record(outcome, seconds)
+
+
+_research_cache_lock = threading.Lock()
+_research_cache: Optional[ResearchCache] = None
+
+
+def get_research_cache() -> ResearchCache:
+    """Process-wide research cache configured from RESEARCH_CACHE_* environment variables."""
+    global _research_cache
+    with _research_cache_lock:
+        if _research_cache is None:
+            disabled = os.getenv('RESEARCH_CACHE_DISABLED', '').lower() in ('1', 'true', 'yes')
+            store = LLMCache(path=DEFAULT_RESEARCH_CACHE_PATH, ttl_seconds=DEFAULT_RESEARCH_TTL_SECONDS,
+                             max_bytes=DEFAULT_RESEARCH_MAX_BYTES, enabled=not disabled)
+            _research_cache = ResearchCache(store)
+        return _research_cache
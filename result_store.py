@@ -0,0 +1,102 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_RESULT_STORE_MAX_MB = float(os.getenv('RESULT_STORE_MAX_MB', 256))
+
+
+def upload_hash(data: bytes) -> str:
+    """Content hash of an uploaded file's bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResultStore:
+    """
+    In-memory results shared by all sessions, keyed by (namespace, content hash), e.g.
+    parsed conversations by upload hash. Concurrent requests for a missing key wait
+    for a single build, and least recently used entries are evicted beyond max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = int(DEFAULT_RESULT_STORE_MAX_MB * 1024 * 1024)):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple[str, Hashable], Tuple[Any, int]]' = OrderedDict()
+        self._building: Dict[Tuple[str, Hashable], threading.Event] = {}
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end((namespace, key))
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def put(self, namespace: str, key: Hashable, value: Any, size: int):
+        with self._lock:
+            old = self._entries.pop((namespace, key), None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[(namespace, key)] = (value, size)
+            self._bytes += size
+            # The newest entry is kept even if it alone exceeds the budget
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats['evictions'] += 1
+
+    def get_or_create(self, namespace: str, key: Hashable, factory: Callable[[], Any],
+                      sizeof: Callable[[Any], int]) -> Any:
+        """Return the stored value, or build it with factory() once and store it."""
+        full_key = (namespace, key)
+        while True:
+            with self._lock:
+                entry = self._entries.get(full_key)
+                if entry is not None:
+                    self._entries.move_to_end(full_key)
+                    self._stats['hits'] += 1
+                    return entry[0]
+                building = self._building.get(full_key)
+                if building is None:
+                    building = self._building[full_key] = threading.Event()
+                    self._stats['misses'] += 1
+                    break
+            # Another thread is building this value; a failed build lets the next waiter retry
+            building.wait()
+
+        try:
+            value = factory()
+            self.put(namespace, key, value, sizeof(value))
+            return value
+        finally:
+            with self._lock:
+                self._building.pop(full_key, None)
+            building.set()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            }
+
+
+_result_store_lock = threading.Lock()
+_result_store: Optional[ResultStore] = None
+
+
+def get_result_store() -> ResultStore:
+    """Process-wide result store sized by RESULT_STORE_MAX_MB."""
+    global _result_store
+    with _result_store_lock:
+        if _result_store is None:
+            _result_store = ResultStore()
+        return _result_store
@@ -0,0 +1,112 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, List, Sequence, Tuple
+
+from conversation_store import Conversation
+
+# Rough chars-per-token ratio for GPT-4-family tokenizers on chat text
+CHARS_PER_TOKEN = 4
+
+# Window budget for map-reduce segmentation, in estimated conversation tokens
+DEFAULT_WINDOW_TOKENS = 12000
+DEFAULT_OVERLAP_TOKENS = 1500
+
+Window = Tuple[int, int]  # half-open [start, end) message range
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def estimate_message_tokens(conversation: Conversation) -> List[int]:
+    """Estimated prompt tokens per message when rendered as '[timestamp] speaker: message'."""
+    return [
+        (len(conversation.timestamp(i)) + len(conversation.speaker(i)) + len(conversation.message(i)) + 5)
+        // CHARS_PER_TOKEN + 1
+        for i in range(len(conversation))
+    ]
+
+
+def plan_windows(token_counts: Sequence[int], max_tokens: int = DEFAULT_WINDOW_TOKENS,
+                 overlap_tokens: int = DEFAULT_OVERLAP_TOKENS) -> List[Window]:
+    """
+    Split messages into token-bounded windows where each window repeats roughly
+    overlap_tokens worth of messages from the end of the previous one.
+    A conversation that fits in max_tokens comes back as a single window.
+    """
+    total = len(token_counts)
+    if total == 0:
+        return []
+
+    prefix = [0] + list(accumulate(token_counts))
+    if prefix[-1] <= max_tokens:
+        return [(0, total)]
+
+    overlap_tokens = min(overlap_tokens, max_tokens // 2)
+    windows = []
+    start = 0
+    while True:
+        # Largest end with the window under budget, but always at least one message
+        end = max(start + 1, bisect_right(prefix, prefix[start] + max_tokens) - 1)
+        windows.append((start, end))
+        if end >= total:
+            return windows
+        # Next window starts at the earliest message within overlap_tokens of this end
+        start = max(start + 1, bisect_left(prefix, prefix[end] - overlap_tokens))
+
+
+def merge_window_segments(windows: Sequence[Window], window_segments: Sequence[Sequence[Tuple[int, int, Any]]],
+                          total: int) -> List[Tuple[int, int, Any]]:
+    """
+    Reduce per-window segmentations into one global, gap-free segment list.
+
+    window_segments[k] holds (start, end, payload) with inclusive indices local to
+    windows[k]. Each overlap is split at its midpoint, and each window contributes
+    only the segment starts that fall in its own half. A segment running across a
+    midpoint is not cut there: it continues until the next window's first own
+    boundary, so a topic that spans two windows stays one segment.
+    Returns (start, end, payload) tuples with inclusive global indices.
+    """
+    if total == 0 or not windows:
+        return []
+
+    own_starts = [0] + [(windows[k][0] + windows[k - 1][1]) // 2 for k in range(1, len(windows))]
+    own_ends = own_starts[1:] + [total]
+
+    starts = {}
+    first_payload = None
+    for k, (window_start, _) in enumerate(windows):
+        for local_start, local_end, payload in sorted(window_segments[k], key=lambda seg: seg[0]):
+            global_start = window_start + local_start
+            if first_payload is None and global_start <= 0 <= window_start + local_end:
+                first_payload = payload
+            if own_starts[k] <= global_start < own_ends[k] and 0 <= global_start < total:
+                starts.setdefault(global_start, payload)
+
+    if 0 not in starts:
+        starts[0] = first_payload
+
+    ordered = sorted(starts)
+    bounds = ordered[1:] + [total]
+    return [(start, next_start - 1, starts[start]) for start, next_start in zip(ordered, bounds)]
+
+
+def absorb_unclaimed(ranges: Sequence[Tuple[int, int, Any]]) -> List[Tuple[int, int, Any]]:
+    """
+    Fold ranges with a None payload (e.g. lines of a failed window) into their
+    neighbours: the previous range is extended over them, or the next one for
+    leading ranges. Coverage stays gap-free; all-None input gives [].
+    """
+    result: List[Tuple[int, int, Any]] = []
+    leading_start = None
+    for start, end, payload in ranges:
+        if payload is None:
+            if result:
+                result[-1] = (result[-1][0], end, result[-1][2])
+            elif leading_start is None:
+                leading_start = start
+            continue
+        if not result and leading_start is not None:
+            start = leading_start
+        result.append((start, end, payload))
+    return result
@@ -0,0 +1,184 @@
+import math
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from conversation_store import Conversation
+
+DEFAULT_MIN_WORDS = 200
+DEFAULT_BLOCK_SIZE = 6           # messages compared on each side of a candidate boundary
+DEFAULT_GAP_SECONDS = 30 * 60    # a silence this long is a boundary on its own
+
+_VECTOR_DIMS = 128               # signed feature-hashing width of message term vectors
+_TERM_BUCKETS = 1 << 18          # hash space for term frequency counts
+_MIN_TERM_CHARS = 3              # shorter words count towards length but not topic
+_DEPTH_CUTOFF_MADS = 4           # a boundary's depth must exceed the median dip by this many (scaled) MADs
+
+def _build_char_classes() -> np.ndarray:
+    """Lookup table over all codepoints: 0 = separator, 1 = word character, 2 = uppercase word character."""
+    codepoints = np.arange(0x110000, dtype=np.uint32)
+    word = (
+        ((codepoints >= 0x30) & (codepoints <= 0x39))
+        | ((codepoints >= 0x41) & (codepoints <= 0x5A))
+        | ((codepoints >= 0x61) & (codepoints <= 0x7A))
+        # Outside ASCII, treat everything as letters except punctuation blocks and emoji
+        | ((codepoints >= 0xC0) & ~((codepoints >= 0x2000) & (codepoints <= 0x2BFF))
+           & ~((codepoints >= 0x3000) & (codepoints <= 0x303F)) & (codepoints < 0x1F000))
+    )
+    # Uppercase ranges that lowercase by adding 0x20 (ASCII, Latin-1, basic Cyrillic)
+    upper = (
+        ((codepoints >= 0x41) & (codepoints <= 0x5A))
+        | ((codepoints >= 0xC0) & (codepoints <= 0xDE) & (codepoints != 0xD7))
+        | ((codepoints >= 0x410) & (codepoints <= 0x42F))
+    )
+    return word.astype(np.uint8) + upper.astype(np.uint8)
+
+
+_CHAR_CLASSES = _build_char_classes()
+
+
+def _message_words(conversation: Conversation) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Tokenize every message in one vectorized pass over the text buffer.
+    Returns (word hashes, message index of each word, word length in characters).
+    """
+    codepoints = np.frombuffer(conversation.text.encode('utf-32-le'), dtype='<u4')
+    char_classes = _CHAR_CLASSES[codepoints]
+    # Lowercase by adding 0x20 where the class table marks an uppercase letter
+    folded = codepoints + ((char_classes >> 1).astype(np.uint32) << 5)
+
+    # Word runs start and end where the word/separator flag changes
+    flags = np.zeros(len(codepoints) + 2, dtype=bool)
+    flags[1:-1] = char_classes != 0
+    changes = np.flatnonzero(flags[1:] != flags[:-1])
+    starts, ends = changes[0::2], changes[1::2]
+    lengths = ends - starts
+    if not len(starts):
+        empty = np.zeros(0, dtype=np.int64)
+        return empty.astype(np.uint32), empty, empty
+
+    # Order-insensitive word hash from the sums of characters and their squares
+    # (wrapping uint32 prefix sums); anagrams collide, which is harmless for cohesion
+    char_sums = np.zeros(len(folded) + 1, dtype=np.uint32)
+    np.cumsum(folded, out=char_sums[1:])
+    square_sums = np.zeros(len(folded) + 1, dtype=np.uint32)
+    np.cumsum(folded * folded, out=square_sums[1:])
+    hashes = (
+        (char_sums[ends] - char_sums[starts]) * np.uint32(0x9E3779B1)
+        ^ (square_sums[ends] - square_sums[starts]) * np.uint32(0x85EBCA77)
+        ^ lengths.astype(np.uint32) * np.uint32(0xC2B2AE3D)
+    )
+
+    offsets = np.frombuffer(conversation.message_offsets, dtype=np.int64)
+    message_starts = offsets[:-1] - offsets[0]
+    message_of_word = np.searchsorted(message_starts, starts, side='right') - 1
+    return hashes, message_of_word, lengths
+
+
+def _gap_similarity(hashes: np.ndarray, message_of_word: np.ndarray, lengths: np.ndarray,
+                    total: int, block_size: int) -> np.ndarray:
+    """
+    Lexical cohesion across each gap between consecutive messages: cosine similarity of
+    the block_size messages before and after it, with terms weighted by inverse
+    collection frequency so filler words barely count.
+    """
+    content = lengths >= _MIN_TERM_CHARS
+    hashes, message_of_word = hashes[content], message_of_word[content]
+    vectors = np.zeros((total + 2 * block_size, _VECTOR_DIMS), dtype=np.float32)
+    if len(hashes):
+        term_counts = np.bincount(hashes % _TERM_BUCKETS, minlength=_TERM_BUCKETS)
+        weights = np.log(len(hashes) / term_counts[hashes % _TERM_BUCKETS]).astype(np.float32) + 0.1
+        signs = np.where((hashes >> 16) & 1, np.float32(1), np.float32(-1))
+        np.add.at(vectors, (message_of_word + block_size, (hashes >> 8) % _VECTOR_DIMS), weights * signs)
+
+    # blocks[j] sums padded rows j .. j + block_size - 1
+    blocks = np.zeros((total + block_size + 1, _VECTOR_DIMS), dtype=np.float32)
+    for offset in range(block_size):
+        blocks += vectors[offset:offset + total + block_size + 1]
+
+    # Gap g sits before message g (1..total-1): left block ends at g - 1, right block starts at g
+    dots = np.einsum('ij,ij->i', blocks[1:total], blocks[1 + block_size:total + block_size])
+    squared_norms = np.einsum('ij,ij->i', blocks, blocks)
+    norms = np.sqrt(squared_norms[1:total] * squared_norms[1 + block_size:total + block_size])
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
+def _depth_scores(similarity: np.ndarray, block_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """TextTiling depth (how far each gap dips below the highest cohesion on either side) and the smoothed similarity."""
+    smoothed = np.convolve(np.pad(similarity, 1, mode='edge'), np.ones(3) / 3, mode='valid')
+    padded = np.pad(smoothed, block_size, mode='edge')
+    peaks = sliding_window_view(padded, block_size + 1)
+    left_peak = peaks[:len(smoothed)].max(axis=1)
+    right_peak = peaks[block_size:block_size + len(smoothed)].max(axis=1)
+    return left_peak + right_peak - 2 * smoothed, smoothed
+
+
+def segment_topics(conversation: Conversation, min_words: int = DEFAULT_MIN_WORDS,
+                   block_size: int = DEFAULT_BLOCK_SIZE, gap_seconds: float = DEFAULT_GAP_SECONDS,
+                   max_segments: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split a conversation at topic shifts without calling an LLM.
+
+    Boundaries are scored by lexical-cohesion depth (TextTiling over hashed term
+    vectors) plus long silences between timestamps. Candidates are cohesion minima
+    whose depth clearly exceeds the typical dip, plus silences of gap_seconds or
+    more; they are accepted strongest first as long as every segment keeps at
+    least min_words words. Returns inclusive
+    (start_idx, end_idx) message ranges covering the whole conversation.
+    """
+    total = len(conversation)
+    if total == 0:
+        return []
+
+    hashes, message_of_word, lengths = _message_words(conversation)
+    word_prefix = np.zeros(total + 1, dtype=np.int64)
+    np.cumsum(np.bincount(message_of_word, minlength=total), out=word_prefix[1:])
+    if total == 1 or word_prefix[-1] < 2 * min_words:
+        return [(0, total - 1)]
+
+    block_size = max(1, min(block_size, total // 4))
+    similarity = _gap_similarity(hashes, message_of_word, lengths, total, block_size)
+    depth, smoothed = _depth_scores(similarity, block_size)
+
+    # Silences between messages, scaled so gap_seconds (or longer) scores 1
+    epochs = np.frombuffer(conversation.epochs, dtype=np.float64)
+    silence = np.nan_to_num(np.diff(epochs), nan=0.0).clip(min=0)
+    silence_score = np.minimum(1.0, np.log1p(silence / 60) / math.log1p(gap_seconds / 60))
+
+    strength = depth + silence_score
+    local_minima = np.ones(len(smoothed), dtype=bool)
+    local_minima[1:] &= smoothed[1:] <= smoothed[:-1]
+    local_minima[:-1] &= smoothed[:-1] <= smoothed[1:]
+    # Most cohesion minima are noise, so a mean/std cutoff sits among them; the median and MAD of
+    # minima depths describe the typical dip without being pulled up by the real topic shifts
+    minima_depth = depth[local_minima]
+    if len(minima_depth):
+        median = np.median(minima_depth)
+        cutoff = median + _DEPTH_CUTOFF_MADS * 1.4826 * np.median(np.abs(minima_depth - median))
+    else:
+        cutoff = np.inf
+    candidates = np.flatnonzero((local_minima & (depth > cutoff)) | (silence_score >= 1)) + 1
+
+    # Enforce the word minimum on both sides of each boundary via the word prefix sum
+    words_before = word_prefix[candidates]
+    viable = (words_before >= min_words) & (word_prefix[-1] - words_before >= min_words)
+    candidates = candidates[viable]
+    order = np.argsort(-strength[candidates - 1], kind='stable')
+
+    accepted_words = [0, int(word_prefix[-1])]
+    boundaries = []
+    limit = (max_segments - 1) if max_segments else len(candidates)
+    for boundary in candidates[order].tolist():
+        if len(boundaries) >= limit:
+            break
+        words = int(word_prefix[boundary])
+        position = bisect_left(accepted_words, words)
+        if words - accepted_words[position - 1] >= min_words and accepted_words[position] - words >= min_words:
+            accepted_words.insert(position, words)
+            boundaries.append(boundary)
+
+    starts = [0] + sorted(boundaries)
+    ends = [start - 1 for start in starts[1:]] + [total - 1]
+    return list(zip(starts, ends))